@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+시퀀스 탐색 벤치마크 스크립트
+
+discover.scan_directory() 와 기존 pyseq 경로(excel._get_sequences)를 비교합니다.
+
+사용법:
+    python benchmark_discover.py                       # 임시 폴더에 가짜 프레임 생성 (기본 100,000 프레임)
+    python benchmark_discover.py --frames 200000
+    python benchmark_discover.py /show/westworld/product/scan/20230120
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python', 'app', 'api'))
+
+import discover
+
+
+def create_fake_scan(root, frames, frames_per_seq):
+    """롤 폴더마다 빈 EXR 프레임 파일을 만듭니다."""
+    seq_count = max(1, frames // frames_per_seq)
+    for seq_index in range(seq_count):
+        roll_dir = os.path.join(root, "A%03dC%03d" % (seq_index // 20 + 1, seq_index % 20 + 1))
+        os.makedirs(roll_dir)
+        for frame in range(1001, 1001 + frames_per_seq):
+            open(os.path.join(roll_dir, "A001C001_230101_R1AB.%07d.exr" % frame), 'w').close()
+    return seq_count
+
+
+def pyseq_sequences(path):
+    """excel._get_sequences() 와 같은 방식 (하위 폴더마다 pyseq.get_sequences)"""
+    import pyseq
+    sequences = []
+    for temp in os.listdir(path):
+        if temp in ['.thumbnail']:
+            continue
+        temp = os.path.join(path, temp)
+        if os.path.isdir(temp):
+            sequence = pyseq.get_sequences(temp)
+            if sequence:
+                sequences.extend(sequence)
+    return sequences
+
+
+def timed(label, func, *args):
+    start = time.time()
+    result = func(*args)
+    elapsed = time.time() - start
+    print(f"  {label:<20} {elapsed:8.3f} sec")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시퀀스 탐색 벤치마크")
+    parser.add_argument("path", nargs="?", help="스캔 폴더 (없으면 임시 폴더 생성)")
+    parser.add_argument("--frames", type=int, default=100000, help="생성할 전체 프레임 수")
+    parser.add_argument("--frames-per-seq", type=int, default=1000, help="시퀀스당 프레임 수")
+    args = parser.parse_args()
+
+    temp_root = None
+    path = args.path
+    if not path:
+        temp_root = tempfile.mkdtemp(prefix="iom_discover_")
+        print(f"가짜 스캔 폴더 생성 중: {temp_root}")
+        count = create_fake_scan(temp_root, args.frames, args.frames_per_seq)
+        print(f"  {count} 시퀀스, {count * args.frames_per_seq} 프레임")
+        path = temp_root
+
+    try:
+        print("=" * 70)
+        print(f"벤치마크: {path}")
+        print("=" * 70)
+        result = timed("scan_directory", discover.scan_directory, path, 1, discover.DEFAULT_IGNORE)
+        print(f"    → {len(result.sequences)} sequences")
+        try:
+            sequences = timed("pyseq", pyseq_sequences, path)
+            print(f"    → {len(sequences)} sequences")
+        except ImportError:
+            print("  pyseq               (설치되어 있지 않아 건너뜀)")
+    finally:
+        if temp_root:
+            shutil.rmtree(temp_root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+타임코드 변환 벤치마크 스크립트
+
+timecode_math (NumPy 배열 변환) 와 기존 방식(행마다 timecode.Timecode 생성)을 비교합니다.
+
+사용법:
+    python benchmark_timecode.py                  # 기본 100,000 개
+    python benchmark_timecode.py --count 1000000
+    python benchmark_timecode.py --fps 29.97
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python', 'app', 'api'))
+
+import timecode_math
+
+
+def timed(label, func, *args):
+    start = time.time()
+    result = func(*args)
+    elapsed = time.time() - start
+    print(f"  {label:<28} {elapsed:8.3f} sec")
+    return result
+
+
+def timecode_objects_to_frames(timecodes, fps):
+    """기존 방식: Timecode(round(fps), tc).frame_number"""
+    from timecode import Timecode
+    return [Timecode(round(fps), timecode).frame_number for timecode in timecodes]
+
+
+def timecode_objects_offset(timecodes, offsets, fps):
+    """기존 방식: str(Timecode(round(fps), tc) + offset)"""
+    from timecode import Timecode
+    return [str(Timecode(round(fps), timecode) + offset) for timecode, offset in zip(timecodes, offsets)]
+
+
+def vectorized_offset(timecodes, offsets, fps):
+    frames = timecode_math.timecodes_to_frames(timecodes, fps)
+    return timecode_math.frames_to_timecodes(frames + offsets, fps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="타임코드 변환 벤치마크")
+    parser.add_argument("--count", type=int, default=100000, help="변환할 타임코드 수")
+    parser.add_argument("--fps", type=float, default=23.976, help="프레임레이트")
+    args = parser.parse_args()
+
+    base = timecode_math.timecode_base(args.fps)
+    random.seed(0)
+    frames = [random.randrange(0, base * 3600 * 23) for _ in range(args.count)]
+    offsets = [random.randrange(0, 2000) for _ in range(args.count)]
+    timecodes = timecode_math.frames_to_timecodes(frames, base)
+
+    print("=" * 70)
+    print(f"벤치마크: {args.count} timecodes @ {args.fps} fps")
+    print("=" * 70)
+    result = timed("timecode_math to frames", timecode_math.timecodes_to_frames, timecodes, args.fps)
+    shifted = timed("timecode_math offset", vectorized_offset, timecodes, np.asarray(offsets), args.fps)
+    try:
+        expected = timed("Timecode to frames", timecode_objects_to_frames, timecodes, args.fps)
+        expected_shifted = timed("Timecode offset", timecode_objects_offset, timecodes, offsets, args.fps)
+    except ImportError:
+        print("  timecode                     (설치되어 있지 않아 건너뜀)")
+        return
+
+    mismatches = sum(1 for a, b in zip(result.tolist(), expected) if a != b)
+    mismatches += sum(1 for a, b in zip(shifted, expected_shifted) if a != b)
+    print(f"    → mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -110,10 +110,8 @@ class Collect:
     
     def _get_data(self,col,row=None):
         if not row:
-            index = self.model.createIndex(self.rows[0],col)
-        else:
-            index = self.model.createIndex(row,col)
-        return self.model.data(index,QtCore.Qt.DisplayRole)
+            row = self.rows[0]
+        return self.model.store.text(row,col)
         
     
 
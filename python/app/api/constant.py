@@ -32,6 +32,10 @@ MODEL_KEYS["framerate"] = 23
 MODEL_KEYS["date"] = 24
 MODEL_KEYS["clip_tag"] = 25
 
+# 지연 계산 컬럼: 행이 보이거나 체크되거나 Publish/Validate 에서 필요할 때 채움
+LAZY_VALUE = "…"
+LAZY_KEYS = ["clip_name", "resolution", "timecode_in", "timecode_out", "framerate"]
+
 
 COLORSPACE=[
     "ACES - ACES2065-1",
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+스캔 폴더 탐색
+
+os.scandir 한 번의 순회로 스캔 폴더를 재귀적으로 훑으면서
+- 프레임 파일을 시퀀스로 묶고
+- MOV/MXF/EDL 파일을 찾고
+- 디렉토리별 프레임 집합을 만듭니다.
+
+pyseq.get_sequences() 를 디렉토리마다 호출하던 방식보다 빠르며,
+중첩된 카메라 롤 폴더도 depth 설정만큼 내려가서 찾습니다.
+FrameSequence 는 ingest 에서 사용하는 pyseq.Sequence 인터페이스
+(head/tail/start/end/frames/format/dirname)를 그대로 제공합니다.
+"""
+
+import os
+import re
+import fnmatch
+
+
+DEFAULT_DEPTH = 1
+DEFAULT_IGNORE = ['.*', '*.tmp', 'Thumbs.db']
+ALWAYS_IGNORE = ['.thumbnail', '.scan_index.db']
+MOV_EXTS = ['mov', 'mxf']
+EDL_EXTS = ['edl']
+
+_FRAME_RE = re.compile(r'^(.*?)(\d+)(\D*)$')
+
+
+class FrameSequence(object):
+    """
+    한 디렉토리 안의 프레임 시퀀스 (pyseq.Sequence 호환)
+
+    파일이 하나뿐인 경우 pyseq 와 같이 head 에 파일 이름 전체를 두고
+    tail 은 빈 문자열, start/end 는 0 으로 둡니다.
+    """
+
+    def __init__(self, dirname, head, tail="", frames=None, pad=0):
+        self.dirname = dirname
+        self._head = head
+        self._tail = tail
+        self._frames = sorted(frames) if frames else []
+        self._pad = pad
+
+    def head(self):
+        return self._head
+
+    def tail(self):
+        return self._tail
+
+    def start(self):
+        return self._frames[0] if self._frames else 0
+
+    def end(self):
+        return self._frames[-1] if self._frames else 0
+
+    def frames(self):
+        return list(self._frames)
+
+    def frame_set(self):
+        return set(self._frames)
+
+    def missing(self):
+        if not self._frames:
+            return []
+        present = set(self._frames)
+        return [f for f in range(self.start(), self.end() + 1) if f not in present]
+
+    def _pad_format(self):
+        if not self._frames:
+            return ""
+        if self._pad > 1:
+            return "%%0%dd" % self._pad
+        return "%d"
+
+    def format(self, fmt):
+        """
+        pyseq 형식 지시자를 지원합니다.
+
+        %h head, %t tail, %p padding (%04d), %s start, %e end,
+        %l 길이, %r 범위 (start-end), %M 누락 프레임, %D dirname
+        """
+        values = {
+            'h': self._head,
+            't': self._tail,
+            'p': self._pad_format(),
+            's': str(self.start()),
+            'e': str(self.end()),
+            'l': str(len(self)),
+            'r': "%d-%d" % (self.start(), self.end()) if self._frames else "",
+            'M': " ".join(str(f) for f in self.missing()),
+            'D': self.dirname,
+        }
+        return re.sub(r'%([htpselrMD])', lambda m: values[m.group(1)], fmt)
+
+    def path(self):
+        return os.path.join(self.dirname, self.format("%h%r%t"))
+
+    def __len__(self):
+        return len(self._frames) if self._frames else 1
+
+    def __str__(self):
+        return self.format("%h%r%t")
+
+    def __repr__(self):
+        return "<FrameSequence %s>" % os.path.join(self.dirname, str(self))
+
+
+class ScanResult(object):
+    """scan_directory() 결과"""
+
+    def __init__(self):
+        self.sequences = []
+        self.movs = []
+        self.edls = []
+        self.frames_by_dir = {}     # dirname -> {(head, tail): set(frames)}
+
+
+def _compile_ignore(patterns):
+    """fnmatch 패턴 목록을 하나의 정규식으로 컴파일"""
+    patterns = list(ALWAYS_IGNORE) + list(patterns or [])
+    return re.compile("|".join("(?:%s)" % fnmatch.translate(pattern) for pattern in patterns))
+
+
+def _scandir(dirname):
+    entries = []
+    with os.scandir(dirname) as it:
+        for entry in it:
+            try:
+                entries.append((entry.name, entry.is_dir()))
+            except OSError:
+                continue
+    return entries
+
+
+def group_frames(dirname, names):
+    """
+    파일 이름 목록을 시퀀스로 묶습니다.
+
+    Args:
+        dirname: 디렉토리 경로
+        names: 파일 이름 목록
+
+    Returns:
+        (FrameSequence 리스트, {(head, tail): set(frames)})
+    """
+    groups = {}
+    singles = []
+    for name in names:
+        match = _FRAME_RE.match(name)
+        if not match:
+            singles.append(name)
+            continue
+        head, digits, tail = match.groups()
+        groups.setdefault((head, tail), []).append((int(digits), digits, name))
+
+    sequences = []
+    frame_sets = {}
+    for (head, tail), items in groups.items():
+        if len(items) == 1:
+            singles.append(items[0][2])
+            continue
+        frames = [frame for frame, digits, name in items]
+        # pyseq 와 같이 0 으로 시작하는 프레임이 있을 때만 패딩으로 봄 (1001-1100 은 "%d")
+        padded = [digits for frame, digits, name in items if digits.startswith("0")]
+        if padded:
+            pad = min(len(digits) for digits in padded)
+        else:
+            pad = 0
+        sequences.append(FrameSequence(dirname, head, tail, frames, pad))
+        frame_sets[(head, tail)] = set(frames)
+
+    for name in singles:
+        sequences.append(FrameSequence(dirname, name))
+
+    sequences.sort(key=lambda seq: (seq.head(), seq.tail()))
+    return sequences, frame_sets
+
+
+def scan_directory(path, depth=None, ignore=None, list_dir=None):
+    """
+    스캔 폴더를 한 번 순회하여 시퀀스와 MOV/MXF/EDL 을 찾습니다.
+
+    최상위 폴더의 이미지 파일은 기존 동작과 같이 시퀀스로 취급하지 않고,
+    하위 폴더(depth 까지)의 파일만 시퀀스로 묶습니다.
+    MOV/MXF/EDL 은 최상위 폴더를 포함해 depth 까지 찾습니다.
+
+    Args:
+        path: 스캔 폴더 경로
+        depth: 내려갈 하위 폴더 깊이 (None 이면 ingest.scan_depth 설정, 기본 1)
+        ignore: 무시할 fnmatch 패턴 목록 (None 이면 ingest.scan_ignore 설정)
+        list_dir: 디렉토리 항목 [(name, is_dir), ...] 을 반환하는 함수
+                  (ScanIndex.list_dir 을 넘기면 바뀌지 않은 폴더는 readdir 생략)
+
+    Returns:
+        ScanResult
+    """
+    if depth is None or ignore is None:
+        from .probe import get_config_value
+        if depth is None:
+            depth = get_config_value('ingest.scan_depth', DEFAULT_DEPTH)
+        if ignore is None:
+            ignore = get_config_value('ingest.scan_ignore', DEFAULT_IGNORE)
+    if list_dir is None:
+        list_dir = _scandir
+
+    ignored = _compile_ignore(ignore).match
+    result = ScanResult()
+    stack = [(path, 0)]
+    while stack:
+        dirname, level = stack.pop()
+        try:
+            entries = list_dir(dirname)
+        except OSError as e:
+            print(f"WARNING: Failed to list {dirname}: {e}")
+            continue
+
+        frame_names = []
+        for name, is_dir in entries:
+            if ignored(name):
+                continue
+            full_path = os.path.join(dirname, name)
+            if is_dir:
+                if level < depth:
+                    stack.append((full_path, level + 1))
+                continue
+            ext = name.split(".")[-1].lower()
+            if ext in MOV_EXTS:
+                result.movs.append(full_path)
+            elif ext in EDL_EXTS:
+                result.edls.append(full_path)
+            elif level > 0:
+                frame_names.append(name)
+
+        if frame_names:
+            sequences, frame_sets = group_frames(dirname, frame_names)
+            result.sequences.extend(sequences)
+            result.frames_by_dir[dirname] = frame_sets
+
+    result.sequences.sort(key=lambda seq: (seq.dirname, seq.head(), seq.tail()))
+    result.movs.sort()
+    result.edls.sort()
+    return result
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+EDL 컷 테이블
+
+EDL 파일을 한 번만 읽어서 이벤트마다
+- 소스 / 레코드 타임코드 (문자열과 프레임 번호)
+- M2 리타임 속도
+- 클립 이름 (* FROM CLIP NAME:)
+을 담은 컷 테이블을 만듭니다.
+
+edl.Parser 는 줄마다 모든 matcher 를 적용하고 Timecode 객체를 만들며,
+M2 는 parse_m2_from_edl() 에서 파일을 다시 읽어야 했습니다.
+여기서는 한 번의 순회로 정수 프레임 번호까지 계산해 두고,
+(path, size, mtime, fps) 키로 캐시하므로 MOV_INFO 는 정수만 읽습니다.
+"""
+
+import os
+import re
+import threading
+
+from .timecode_math import timecodes_to_frames, frames_to_timecodes, is_drop_frame_rate
+
+
+_EVENT_RE = re.compile(
+    r"(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S*)\s+"
+    r"(\d{1,2}:\d{1,2}:\d{1,2}[:;]\d{1,3})\s+(\d{1,2}:\d{1,2}:\d{1,2}[:;]\d{1,3})\s+"
+    r"(\d{1,2}:\d{1,2}:\d{1,2}[:;]\d{1,3})\s+(\d{1,2}:\d{1,2}:\d{1,2}[:;]\d{1,3})")
+_CLIP_NAME_RE = re.compile(r"\*\s*(FROM|TO)\s+CLIP\s+NAME:\s+(.+)")
+
+# 01:00:00:00 의 프레임 번호 (24 fps)
+HOUR_FRAMES_24 = 86400
+
+
+class CutEvent(object):
+    """
+    컷 테이블의 이벤트 한 줄
+
+    *_tc 는 'HH:MM:SS:FF' 문자열, src_* / rec_* 는 프레임 번호입니다.
+    디졸브/와이프처럼 같은 이벤트 번호가 두 줄이면 merge() 로 한 이벤트로 합칩니다.
+    """
+
+    __slots__ = ['number', 'reel', 'track', 'transition', 'clip_name', 'm2_retime',
+                 'src_start', 'src_end', 'rec_start', 'rec_end',
+                 'src_start_tc', 'src_end_tc', 'rec_start_tc', 'rec_end_tc']
+
+    def __init__(self, number, reel, track, transition, src_start_tc, src_end_tc, rec_start_tc, rec_end_tc):
+        self.number = number
+        self.reel = reel
+        self.track = track
+        self.transition = transition
+        self.clip_name = None
+        self.m2_retime = None
+        # 프레임 번호는 parse_edl() 이 테이블 전체를 한 번에 변환해서 채움
+        self.src_start = self.src_end = self.rec_start = self.rec_end = 0
+        self.src_start_tc = src_start_tc
+        self.src_end_tc = src_end_tc
+        self.rec_start_tc = rec_start_tc
+        self.rec_end_tc = rec_end_tc
+
+    def merge(self, reel, track, transition, src_start_tc, src_end_tc, rec_start_tc, rec_end_tc):
+        """
+        같은 이벤트 번호의 두 번째 줄(트랜지션으로 들어오는 클립)을 합칩니다.
+
+        레코드 시작은 첫 줄을 유지하고, 소스 구간/릴/레코드 끝은 들어오는 클립 기준으로 바꿉니다.
+        """
+        self.reel = reel
+        self.track = track
+        self.transition = transition
+        self.src_start_tc = src_start_tc
+        self.src_end_tc = src_end_tc
+        self.rec_end_tc = rec_end_tc
+
+    @property
+    def duration(self):
+        """레코드 길이 (프레임)"""
+        return self.rec_end - self.rec_start
+
+
+class CutTable(object):
+    """EDL 하나의 컷 테이블"""
+
+    def __init__(self, edl_file, fps):
+        self.edl_file = edl_file
+        self.fps = fps
+        self.title = ""
+        self.events = []
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __getitem__(self, i):
+        return self.events[i]
+
+    @property
+    def master_frame(self):
+        """
+        레코드 타임코드의 기준 프레임
+
+        첫 이벤트가 01:00:00:00 (24 fps 기준 86400 프레임) 이전이면 0,
+        이후면 86400 을 기준으로 합니다.
+        """
+        if not self.events:
+            return 0
+        start_frame = self.events[0].rec_start
+        if start_frame > 0 and start_frame < HOUR_FRAMES_24:
+            return 0
+        if start_frame > HOUR_FRAMES_24:
+            return HOUR_FRAMES_24
+        return start_frame
+
+
+def parse_edl(edl_file, fps):
+    """
+    EDL 을 한 번 읽어서 CutTable 을 만듭니다.
+
+    Args:
+        edl_file: EDL 경로
+        fps: 정수 프레임레이트 (round(mov framerate))
+
+    Returns:
+        CutTable
+    """
+    table = CutTable(edl_file, fps)
+    event = None
+    with open(edl_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("TITLE:"):
+                table.title = line[6:].strip()
+                continue
+            if line.startswith("M2"):
+                # M2 <reel> <speed> <timecode> : 바로 앞 이벤트의 리타임 속도
+                parts = line.split()
+                if event is not None and len(parts) >= 3:
+                    try:
+                        event.m2_retime = float(parts[2])
+                    except ValueError:
+                        pass
+                continue
+            if line.startswith("*"):
+                match = _CLIP_NAME_RE.match(line)
+                if match and event is not None:
+                    # 트랜지션 이벤트는 들어오는 클립(TO CLIP NAME) 이름을 사용
+                    if match.group(1) == "TO" or event.clip_name is None:
+                        event.clip_name = match.group(2).strip()
+                continue
+            match = _EVENT_RE.search(line)
+            if match:
+                groups = match.groups()
+                number = int(groups[0])
+                if event is not None and event.number == number:
+                    # edl.Parser 와 같이 같은 이벤트 번호의 줄은 한 이벤트로 합침
+                    event.merge(groups[1], groups[2], groups[3], *groups[5:9])
+                else:
+                    event = CutEvent(number, groups[1], groups[2], groups[3], *groups[5:9])
+                    table.events.append(event)
+
+    _resolve_frames(table)
+    return table
+
+
+def _resolve_frames(table):
+    """
+    모든 이벤트의 타임코드를 한 번에 프레임 번호로 변환하고
+    타임코드 문자열을 Timecode(fps, ...) 와 같은 형식으로 정규화합니다.
+
+    fps 가 30/60 이고 타임코드가 ';' 로 표기되어 있으면 29.97/59.94 drop-frame 으로
+    변환하고 ';' 표기를 유지합니다. 나머지는 non-drop 입니다.
+    """
+    if not table.events:
+        return
+    fields = ['src_start', 'src_end', 'rec_start', 'rec_end']
+    timecodes = [getattr(event, field + '_tc') for event in table.events for field in fields]
+    frames = timecodes_to_frames(timecodes, table.fps, drop_frame=False)
+    normalized = frames_to_timecodes(frames, table.fps)
+
+    drop_rate = table.fps * 1000.0 / 1001.0
+    drop = [i for i, timecode in enumerate(timecodes) if ";" in timecode]
+    if drop and is_drop_frame_rate(drop_rate):
+        drop_frames = timecodes_to_frames([timecodes[i] for i in drop], drop_rate, drop_frame=True)
+        drop_normalized = frames_to_timecodes(drop_frames, drop_rate, drop_frame=True)
+        for i, frame, timecode in zip(drop, drop_frames.tolist(), drop_normalized):
+            frames[i] = frame
+            normalized[i] = timecode
+    frames = frames.tolist()
+    i = 0
+    for event in table.events:
+        for field in fields:
+            setattr(event, field, frames[i])
+            setattr(event, field + '_tc', normalized[i])
+            i += 1
+
+
+class CutTableCache(object):
+    """
+    (path, size, mtime, fps) 키의 CutTable 캐시 (스레드 안전)
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, edl_file, fps):
+        """
+        Raises:
+            OSError: EDL 을 읽을 수 없을 때
+        """
+        st = os.stat(edl_file)
+        key = (edl_file, st.st_size, st.st_mtime_ns, fps)
+        with self._lock:
+            table = self._entries.get(key)
+        if table is None:
+            table = parse_edl(edl_file, fps)
+            with self._lock:
+                self._entries[key] = table
+        return table
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+CUT_TABLE_CACHE = CutTableCache()
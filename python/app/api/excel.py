@@ -1,77 +1,311 @@
 # -*- coding: utf-8 -*-
 import glob
+import io
 import re
 import os
 import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import xlsxwriter
-import pyseq
 import openpyxl
-import pydpx_meta
-import OpenEXR
 from PIL import Image
 # Qt 호환성 레이어 사용
 from ..utils.qt_compat import QtCore, QtGui
 from .constant import *
-import glob
-import ffmpeg
-from timecode import Timecode
-from edl import Parser
+from .probe import ProbeEngine, get_config_value
+from .scan_index import ScanIndex, INDEX_UPDATES, stat_signature
+from .discover import scan_directory
+from .thumbnail import THUMBNAIL_SERVICE
+from .header_reader import read_exr_header, read_dpx_header, exr_attribute_text, HeaderError
+from .ffprobe_cache import FFPROBE_CACHE
+from .edl_table import CUT_TABLE_CACHE, HOUR_FRAMES_24
+from .timecode_math import timecode_to_frame, offset_timecode, digits_to_timecodes
+from .scanlist_state import read_state, write_state
 
 DEFAULT_FPS = 23.976
+TIMECODE_DISCONTINUITY_TAG = "TC 불연속"
+_PUBLISH_LOCK = threading.Lock()       # scanlist_NN 번호 선택 + rename
+EXCEL_THUMBNAIL_SIZE = (240, 135)   # 기존 960x540 썸네일의 x_scale/y_scale 0.25 와 같은 크기
 
 
-def _safe_open_exr(file_path):
+class FrameHeader(object):
     """
-    OpenEXR 파일을 안전하게 열기
+    EXR/DPX 프레임 하나의 헤더 정보
 
-    Returns:
-        OpenEXR.InputFile 객체 또는 None (실패 시)
+    FrameHeaderCache 가 한 번 읽어서 보관하며,
+    해상도/프레임레이트/타임코드/dataWindow/클립 이름을 메모리에서 제공합니다.
     """
-    try:
-        # 파일 존재 확인
-        if not os.path.exists(file_path):
-            print(f"WARNING: EXR file not found: {file_path}")
-            return None
 
-        # 파일 접근 권한 확인
-        if not os.access(file_path, os.R_OK):
-            print(f"WARNING: No read permission for: {file_path}")
+    def __init__(self, path, ext):
+        self.path = path
+        self.ext = ext
+        self.width = 0
+        self.height = 0
+        self.data_window = None     # EXR: (xmin, ymin, xmax, ymax)
+        self.framerate = None
+        self.timecode = ""
+        self.attributes = {}        # EXR 헤더 속성 문자열 (카메라 클립 이름 검색용)
+
+    @property
+    def resolution(self):
+        if not self.width and not self.height:
+            return ""
+        return "%d x %d" % (self.width, self.height)
+
+    def clip_name(self):
+        """헤더 속성에서 카메라 클립 패턴을 찾습니다. 없으면 None"""
+        for value in self.attributes.values():
+            pattern = _get_camera_clip_pattern(value)
+            if pattern:
+                return pattern
+        return None
+
+
+class FrameHeaderCache(object):
+    """
+    EXR/DPX 프레임 헤더 캐시
+
+    (path, size, mtime) 를 키로 사용하여 프레임당 헤더를 한 번만 읽습니다.
+    파일이 바뀌면 size/mtime 이 달라지므로 자동으로 다시 읽습니다.
+    ProbeEngine 워커 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """
+        프레임 헤더를 반환합니다.
+
+        Args:
+            path: EXR 또는 DPX 파일 경로
+
+        Returns:
+            FrameHeader 또는 None (파일이 없거나 읽기 실패 시)
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            print(f"WARNING: Frame file not found: {path}")
             return None
 
-        # OpenEXR 파일 열기
-        exr = OpenEXR.InputFile(file_path)
-        return exr
+        key = (path, st.st_size, st.st_mtime)
+        with self._lock:
+            header = self._entries.get(key)
+            if header is not None:
+                self._entries.move_to_end(key)
+                return header
 
-    except Exception as e:
-        print(f"ERROR: Failed to open EXR file {file_path}: {e}")
+        header = self._read(path)
+        if header is None:
+            return None
+
+        with self._lock:
+            self._entries[key] = header
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return header
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _read(self, path):
+        ext = path.split(".")[-1].lower()
+        if ext == "exr":
+            return self._read_exr(path)
+        if ext == "dpx":
+            return self._read_dpx(path)
         return None
 
+    def _read_exr(self, path):
+        try:
+            attributes = read_exr_header(path)
+        except HeaderError as e:
+            print(f"WARNING: Native EXR header read failed for {path}: {e}, using OpenEXR")
+            return self._read_exr_openexr(path)
+        except OSError as e:
+            print(f"ERROR: Failed to open EXR file {path}: {e}")
+            return None
 
-def _safe_open_dpx(file_path):
-    """
-    DPX 파일을 안전하게 열기
+        header = FrameHeader(path, "exr")
+        if "dataWindow" in attributes:
+            xmin, ymin, xmax, ymax = attributes['dataWindow'][1]
+            header.data_window = (xmin, ymin, xmax, ymax)
+            header.width = xmax + 1
+            header.height = ymax + 1
+        if "timeCode" in attributes:
+            header.timecode = "%02d:%02d:%02d:%02d" % attributes['timeCode'][1][:4]
+        if "framesPerSecond" in attributes:
+            n, d = attributes['framesPerSecond'][1]
+            if d:
+                header.framerate = float(n) / float(d)
+        for key, (type_name, value) in attributes.items():
+            header.attributes[key] = exr_attribute_text(type_name, value)
+        return header
+
+    def _read_exr_openexr(self, path):
+        try:
+            import OpenEXR
+            exr = OpenEXR.InputFile(path)
+        except Exception as e:
+            print(f"ERROR: Failed to open EXR file {path}: {e}")
+            return None
 
-    Returns:
-        pydpx_meta.DpxHeader 객체 또는 None (실패 시)
-    """
-    try:
-        # 파일 존재 확인
-        if not os.path.exists(file_path):
-            print(f"WARNING: DPX file not found: {file_path}")
+        header = FrameHeader(path, "exr")
+        try:
+            exr_header = exr.header()
+            if "dataWindow" in exr_header:
+                dw = exr_header['dataWindow']
+                header.data_window = (dw.min.x, dw.min.y, dw.max.x, dw.max.y)
+                header.width = dw.max.x + 1
+                header.height = dw.max.y + 1
+            if "timeCode" in exr_header:
+                ti = exr_header['timeCode']
+                header.timecode = "%02d:%02d:%02d:%02d" % (ti.hours, ti.minutes, ti.seconds, ti.frame)
+            if "framesPerSecond" in exr_header:
+                fr = exr_header['framesPerSecond']
+                header.framerate = float(fr.n) / float(fr.d)
+            for key in exr_header.keys():
+                try:
+                    header.attributes[key] = str(exr_header[key])
+                except Exception:
+                    continue
+        except Exception as e:
+            print(f"ERROR: Failed to read EXR header {path}: {e}")
+        finally:
+            try:
+                exr.close()
+            except Exception:
+                pass
+        return header
+
+    def _read_dpx(self, path):
+        try:
+            info = read_dpx_header(path)
+        except HeaderError as e:
+            print(f"WARNING: Native DPX header read failed for {path}: {e}, using pydpx_meta")
+            return self._read_dpx_pydpx(path)
+        except OSError as e:
+            print(f"ERROR: Failed to open DPX file {path}: {e}")
             return None
 
-        # 파일 접근 권한 확인
-        if not os.access(file_path, os.R_OK):
-            print(f"WARNING: No read permission for: {file_path}")
+        header = FrameHeader(path, "dpx")
+        header.width = info['width']
+        header.height = info['height']
+        header.timecode = info['timecode']
+        header.framerate = info['framerate']
+        for key in ['file_name', 'input_name', 'frame_id', 'slate_info']:
+            header.attributes[key] = info[key]
+        return header
+
+    def _read_dpx_pydpx(self, path):
+        try:
+            import pydpx_meta
+            dpx = pydpx_meta.DpxHeader(path)
+        except Exception as e:
+            print(f"ERROR: Failed to open DPX file {path}: {e}")
             return None
 
-        # DPX 헤더 읽기
-        dpx = pydpx_meta.DpxHeader(file_path)
-        return dpx
+        header = FrameHeader(path, "dpx")
+        try:
+            header.width = dpx.raw_header.OrientHeader.XOriginalSize
+            header.height = dpx.raw_header.OrientHeader.YOriginalSize
+        except Exception as e:
+            print(f"ERROR: Failed to read resolution from {path}: {e}")
+        try:
+            header.timecode = dpx.tv_header.time_code
+        except Exception as e:
+            print(f"ERROR: Failed to read timecode from {path}: {e}")
+        try:
+            header.framerate = dpx.raw_header.TvHeader.FrameRate
+        except Exception as e:
+            print(f"ERROR: Failed to read framerate from {path}: {e}")
+        return header
 
-    except Exception as e:
-        print(f"ERROR: Failed to open DPX file {file_path}: {e}")
-        return None
+
+FRAME_HEADER_CACHE = FrameHeaderCache()
+
+
+class ScanlistCache(object):
+    """
+    파싱된 scanlist 엑셀 캐시
+
+    (path, size, mtime) 를 키로 사용하므로 바뀌지 않은 엑셀을 다시 열면
+    openpyxl 을 거치지 않고 바로 행을 돌려줍니다.
+    check 컬럼은 bool 로 보관하고, 꺼낼 때마다 새 행 목록을 만듭니다 (모델이 행을 수정함).
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(excel_file):
+        st = os.stat(excel_file)
+        return (excel_file, st.st_size, st.st_mtime_ns)
+
+    def get(self, excel_file):
+        """
+        Returns:
+            [[check(bool), ...]] 또는 None (캐시에 없을 때)
+        """
+        key = self._key(excel_file)
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is None:
+                return None
+            self._entries.move_to_end(key)
+        return [list(row) for row in rows]
+
+    def put(self, excel_file, rows):
+        key = self._key(excel_file)
+        with self._lock:
+            self._entries[key] = tuple(tuple(row) for row in rows)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+SCANLIST_CACHE = ScanlistCache()
+
+
+class SeqRow(list):
+    """
+    모델 행 (list) + 원본 시퀀스
+
+    ingest.lazy_metadata 가 켜져 있으면 무거운 컬럼(LAZY_KEYS)은 LAZY_VALUE 로 두고,
+    나중에 resolve_lazy_row() 로 채울 수 있도록 시퀀스 객체를 함께 보관합니다.
+    """
+
+    def __init__(self, values, seq=None):
+        list.__init__(self, values)
+        self.seq = seq
+
+    def is_lazy(self):
+        return self.seq is not None and any(self[MODEL_KEYS[key]] == LAZY_VALUE for key in LAZY_KEYS)
+
+
+def _get_frame_file(seq, frame):
+    """시퀀스의 frame 번호에 해당하는 파일 경로 (단일 파일이면 파일 자체)"""
+    if not seq.tail():
+        return os.path.join(seq.dirname, seq.head())
+    return os.path.join(seq.dirname, seq.head() + seq.format("%p") % frame + seq.tail())
+
+
+def _get_frame_ext(seq):
+    """EXR/DPX 판별용 확장자 (소문자, tail 이 없으면 head 에서 추출)"""
+    if not seq.tail():
+        return seq.head().split(".")[-1].lower()
+    return seq.tail().split(".")[-1].lower()
 
 
 def _get_camera_clip_pattern(text):
@@ -95,24 +329,13 @@ def _get_camera_clip_pattern(text):
 def _get_exr_clip_name(seq):
     """Search EXR metadata for camera clip pattern. Fall back to seq.head()."""
     try:
-        exr_file = os.path.join(seq.dirname,
-                                seq.head() + seq.format("%p") % seq.start() + seq.tail())
-        exr = _safe_open_exr(exr_file)
-        if exr is None:
-            return seq.head()
-        header = exr.header()
         pattern = _get_camera_clip_pattern(seq.head())
         if pattern:
             return pattern
-        for key in header.keys():
-            try:
-                value = str(header[key])
-                pattern = _get_camera_clip_pattern(value)
-                if pattern:
-                    return pattern
-            except Exception:
-                continue
-        return seq.head()
+        header = FRAME_HEADER_CACHE.get(_get_frame_file(seq, seq.start()))
+        if header is None:
+            return seq.head()
+        return header.clip_name() or seq.head()
     except Exception:
         return seq.head()
 
@@ -128,37 +351,9 @@ class CutItem(object):
         self.m2_retime = None
 
 
-def parse_m2_from_edl(edl_file):
-    """Parse M2 lines from EDL and return dict of {event_num: retime_speed}."""
-    m2_data = {}
-    try:
-        with open(edl_file, 'r') as f:
-            lines = f.readlines()
-        current_event_num = None
-        for line in lines:
-            line = line.strip()
-            if line and len(line) >= 3 and line[:3].isdigit():
-                parts = line.split()
-                if len(parts) > 1:
-                    try:
-                        current_event_num = int(parts[0])
-                    except ValueError:
-                        pass
-            if line.startswith('M2') and current_event_num is not None:
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        m2_data[current_event_num] = float(parts[2])
-                    except ValueError:
-                        pass
-    except Exception as e:
-        print(f"ERROR: Failed to parse M2 from EDL {edl_file}: {e}")
-    return m2_data
-
-
 class MOV_INFO:
 
-    def __init__(self,mov_file,video_stream=None,event=None,first_start=None,clip_name=None,cutitem = None):
+    def __init__(self,mov_file,video_stream=None,event=None,first_start=None,clip_name=None,cutitem = None,cut_table=None):
 
         self.mov_file = mov_file
         self.video_stream = video_stream
@@ -175,59 +370,49 @@ class MOV_INFO:
         else:
             self.clip_name = "None"
         self.cutitem = cutitem
+        self.cut_table = cut_table
         self.ext = "mov"
+        self.thumbnail_number = None
+        self._framerate = None
 
 
     def master_frame(self):
-        start_frame = Timecode(round(self.framerate()),str(self.first_start.rec_start_tc)).frame_number
-        if start_frame > 0 and start_frame < 86400:
-            return 0 
-        if start_frame > 86400:
-            return 86400
-
+        # 컷 테이블에서 계산한 값 (EDL 이 없으면 첫 이벤트 기준으로 계산)
+        if self.cut_table is not None:
+            return self.cut_table.master_frame
+        start_frame = self.first_start.rec_start
+        if start_frame > 0 and start_frame < HOUR_FRAMES_24:
+            return 0
+        if start_frame > HOUR_FRAMES_24:
+            return HOUR_FRAMES_24
         return start_frame
-    
+
     @classmethod
     def video_stream(self,mov_file):
-        probe = ffmpeg.probe(mov_file)
-        video_stream = next((stream for stream in probe['streams'] 
-                             if stream['codec_type'] == 'video'), None)
-        print(video_stream)
-        print(video_stream)
-        print(video_stream)
-        if video_stream : 
-            return video_stream
-        
-        return None
-    
+        # 컨테이너당 ffprobe 는 세션에서 한 번만 실행 (FFPROBE_CACHE)
+        return FFPROBE_CACHE.video_stream(mov_file)
+
     def master_timecode(self):
         if "timecode" in self.video_stream['tags']:
             start_timecode = self.video_stream['tags']['timecode']
         else:
             start_timecode = "00:00:00:00"
-        start_timecode = Timecode(round(self.framerate()),str(start_timecode))
-        return str(start_timecode)
+        return offset_timecode(str(start_timecode), 0, self.framerate())
 
     def head(self):
         return self.scan_name
-    
+
     def tail(self):
         return None
-    
+
     def format(self,format_str):
         return None
-    
+
 
     def frames(self):
 
         if self.event:
-            end_timecode = str(self.event.rec_end_tc)
-            end_frame = Timecode(round(self.framerate()),end_timecode).frame_number
-
-            start_timecode = str(self.event.rec_start_tc)
-            start_frame = Timecode(round(self.framerate()),start_timecode).frame_number
-            duraiton = end_frame - start_frame
-            return duraiton
+            return self.event.duration
         try:
             return self.video_stream['nb_frames']
         except :
@@ -235,35 +420,21 @@ class MOV_INFO:
 
     def start(self):
         if self.event:
-            start_timecode = str(self.event.rec_start_tc)
-            
-            mod_start_frame = Timecode(round(self.framerate()),self.master_timecode()).frame_number
-            start_frame = Timecode(round(self.framerate()),start_timecode).frame_number
-            return start_frame - self.master_frame() + 1
-        
+            return self.event.rec_start - self.master_frame() + 1
+
         return 1
-            
-            
 
     def end(self):
         if self.event:
-            end_timecode = str(self.event.rec_end_tc)
-            end_frame = Timecode(round(self.framerate()),end_timecode).frame_number
+            return self.start() + self.event.duration - 1
 
-            start_timecode = str(self.event.rec_start_tc)
-            start_frame = Timecode(round(self.framerate()),start_timecode).frame_number
-            duraiton = end_frame - start_frame
-
-            return self.start() +  duraiton - 1
-        
         return self.frames()
-    
+
     def framerate(self):
-        n ,d = self.video_stream['r_frame_rate'].split("/")
-        frame_rate = float(n) / float(d)
-        return frame_rate
-    
-    
+        if self._framerate is None:
+            n ,d = self.video_stream['r_frame_rate'].split("/")
+            self._framerate = float(n) / float(d)
+        return self._framerate
 
 
 def create_excel(path):
@@ -271,255 +442,391 @@ def create_excel(path):
     print(f"[PROGRESS] create_excel() START - path: {path}")
     print(f"[PROGRESS] ========================================")
 
-    sequences = _get_sequences(path)
-    print(f"[PROGRESS] Found {len(sequences)} sequences")
-    movs = _get_movs(path)
-    print(f"[PROGRESS] Found {len(movs)} MOV files")
-    if movs:
-        _create_thumbnail_for_mov(movs)
-        sequences = movs + sequences
-        print(f"[PROGRESS] Total sequences (with MOVs): {len(sequences)}")
-
-    print(f"[PROGRESS] Calling _create_seq_array()...")
-    array = _create_seq_array(sequences)
-    print(f"[PROGRESS] _create_seq_array() returned successfully")
+    array = []
+    for done, total, info in iter_excel(path):
+        info[MODEL_KEYS['check']] = False
+        array.append(info)
+
     print(f"[PROGRESS] Array length: {len(array)}")
     print(f"[PROGRESS] About to return from create_excel()")
     return array
 
 
+def iter_excel(path):
+    """
+    create_excel() 의 스트리밍 버전
+
+    시퀀스를 찾은 뒤 프로브가 끝난 행을 스캔 순서대로 yield 합니다.
+    check 컬럼은 None 이며, 받는 쪽(GUI 스레드)에서 채워야 합니다.
+
+    Args:
+        path: 스캔 폴더 경로
+
+    Yields:
+        (done, total, info) - 처리한 시퀀스 수, 전체 시퀀스 수, 모델 행
+    """
+    index = None
+    if get_config_value('ingest.scan_index', True):
+        index = ScanIndex(path)
+
+    try:
+        scan = scan_directory(path, list_dir=index.list_dir if index and index.enabled else None)
+        if index:
+            # 지연 컬럼을 인덱스에 다시 쓰는 연결(INDEX_UPDATES)이 기다리지 않도록 디렉토리 목록을 먼저 저장
+            index.commit()
+        sequences = scan.sequences
+        print(f"[PROGRESS] Found {len(sequences)} sequences")
+        movs = _get_movs(path, scan.movs, scan.edls)
+        print(f"[PROGRESS] Found {len(movs)} MOV files")
+        if movs:
+            _create_thumbnail_for_mov(movs)
+            sequences = movs + sequences
+            print(f"[PROGRESS] Total sequences (with MOVs): {len(sequences)}")
+
+        for item in _iter_seq_array(sequences, index):
+            yield item
+    finally:
+        if index:
+            index.close()
+
+
 def _create_thumbnail_for_mov(movs):
-    
-    mov_jobs = {}
+    """
+    MOV/MXF 이벤트 썸네일을 백그라운드로 요청합니다.
 
+    MOV 마다 이벤트 시작 프레임(중복 제거, 정렬)에 1 부터 번호를 매겨
+    .thumbnail/<이름>.%04d.jpg 로 추출하며, 번호는 mov.thumbnail_number 에 기록하여
+    _get_thumbnail() 이 같은 파일 이름을 사용하도록 합니다.
+    """
+    for mov_file, jobs in _number_mov_thumbnails(movs).items():
+        select_frames = sorted(set(mov.start() for mov in jobs))
+        frames = [(frame, _get_mov_thumbnail_file(jobs[0], number))
+                  for number, frame in enumerate(select_frames, 1)]
+        try:
+            count = THUMBNAIL_SERVICE.request_frames(mov_file, frames, jobs[0].framerate())
+        except OSError as e:
+            print(f"ERROR: Failed to request thumbnails for {mov_file}: {e}")
+            continue
+        print(f"[PROGRESS] {os.path.basename(mov_file)}: {count} / {len(frames)} thumbnails requested")
+
+
+def _number_mov_thumbnails(movs):
+    """
+    MOV 파일별로 이벤트 시작 프레임(중복 제거, 정렬)에 1 부터 번호를 매겨 mov.thumbnail_number 에 기록합니다.
+
+    Returns:
+        OrderedDict {mov_file: [mov, ...]}
+    """
+    mov_jobs = OrderedDict()
     for mov in movs:
-        mov_key = os.path.join(mov.dirname,mov.scan_name)
-        if mov_key in mov_jobs:
-            mov_jobs[mov_key].append(mov)
-        else:
-            mov_jobs[mov_key] = [mov]
-
-    thumbnail_path = os.path.join(movs[0].dirname,".thumbnail")
-    if not os.path.exists(thumbnail_path):
-        os.makedirs(thumbnail_path)
-
-    for mov_file in mov_jobs:
-            
-        thumbnail_file = os.path.join(thumbnail_path,os.path.basename(mov_file).split(".")[0]+".%04d.jpg")
-        select_frames = [ mov.start() for mov in mov_jobs[mov_file]]
-        select_frames = list(set(select_frames))
-        select_frames.sort()
-        select_frames = ["eq(n\,{})".format(frame) for frame in select_frames]
-        print(len(select_frames))
-        print(len(select_frames))
-        print(len(select_frames))
-        select_command ="+".join(select_frames)
-        
-        command = ['rez-env',"ffmpeg","--","ffmpeg","-y"]
-        command.append("-i")
-        command.append(mov_file)
-        command.append("-vf")
-        command.append("select='{}'".format(select_command))
-        #command.append("-vframes")
-        #command.append("{}".format(len(select_frames)))
-        command.append("-vsync")
-        command.append("0")
-        command.append("-s")
-        command.append("960x540")
-        command.append(thumbnail_file)
-
-        command = " ".join(command)
-        print(command)
-        os.system(command)
-
-def _create_seq_array(sequences):
-    print(f"[PROGRESS] _create_seq_array() START - total sequences: {len(sequences)}")
+        mov_jobs.setdefault(mov.mov_file, []).append(mov)
+
+    for jobs in mov_jobs.values():
+        select_frames = sorted(set(mov.start() for mov in jobs))
+        numbers = dict((frame, number) for number, frame in enumerate(select_frames, 1))
+        for mov in jobs:
+            mov.thumbnail_number = numbers[mov.start()]
+    return mov_jobs
+
+
+def _get_mov_thumbnail_file(mov, number):
+    thumbnail_path = os.path.join(mov.dirname, ".thumbnail")
+    return os.path.join(thumbnail_path, mov.scan_name.split(".")[0] + ".%04d.jpg" % number)
+
+
+def _create_seq_array(sequences, index=None):
     array = []
-    seq_index = 0
-    for seq in sequences:
-        seq_index += 1
-        print(f"[PROGRESS] ========== Processing sequence {seq_index}/{len(sequences)} ==========")
-        print("create dir seq info {}".format(seq.start()))
-        info = []
-        info.insert(MODEL_KEYS['check'], QtGui.QCheckBox())
-        info.insert(MODEL_KEYS['thumbnail'],_get_thumbnail(seq,sequences))
-        info.insert(MODEL_KEYS['roll'],"")
-        info.insert(MODEL_KEYS['seq_name'],"")
-        info.insert(MODEL_KEYS['shot_name'], "")
-        info.insert(MODEL_KEYS['version'],"")
-        info.insert(MODEL_KEYS['type'], "org")
-        info.insert(MODEL_KEYS['scan_path'], seq.dirname)
-        info.insert(MODEL_KEYS['scan_name'], seq.head())
-        if _get_ext(seq) in ["mov", "mxf"]:
-            info.insert(MODEL_KEYS['clip_name'], seq.clip_name)
-        elif _get_ext(seq) == "exr":
-            info.insert(MODEL_KEYS['clip_name'], _get_exr_clip_name(seq))
-        else:
-            info.insert(MODEL_KEYS['clip_name'], seq.head())
-        info.insert(MODEL_KEYS['pad'],seq.format('%p'))
-        info.insert(MODEL_KEYS['ext'],_get_ext(seq))
-        print("[PROGRESS] About to call _get_resolution()")
-        info.insert(MODEL_KEYS['resolution'] , _get_resolution(seq))
-        print("[PROGRESS] _get_resolution() completed, calling _get_start()")
-        info.insert(MODEL_KEYS['start_frame'], _get_start(seq))
-        print("[PROGRESS] _get_start() completed, calling _get_end()")
-        info.insert(MODEL_KEYS['end_frame'], _get_end(seq))
-        print("[PROGRESS] _get_end() completed, calling _get_duration()")
-        info.insert(MODEL_KEYS['duration'],_get_duration(seq))
-        print("[PROGRESS] _get_duration() completed")
-        info.insert(MODEL_KEYS['retime_duration'],None)
-        info.insert(MODEL_KEYS['retime_percent'],None)
-        info.insert(MODEL_KEYS["retime_start_frame"],None)
-        print("[PROGRESS] About to process timecodes")
-        if _get_ext(seq) in  ["mov" , "mxf"]:
-            if seq.cutitem:
-                info.insert(MODEL_KEYS['timecode_in'],str(seq.cutitem.start_tc))
-                info.insert(MODEL_KEYS['timecode_out'],str(seq.cutitem.end_tc))
-            else:
-                print("[PROGRESS] Calling _get_time_code() for timecode_in")
-                info.insert(MODEL_KEYS['timecode_in'], _get_time_code(seq,_get_start(seq)))
-                print("[PROGRESS] Calling _get_time_code() for timecode_out")
-                info.insert(MODEL_KEYS['timecode_out'],_get_time_code(seq,_get_end(seq)))
+    for done, total, info in _iter_seq_array(sequences, index):
+        info[MODEL_KEYS['check']] = False
+        array.append(info)
+    return array
+
+
+def _iter_seq_array(sequences, index=None):
+    """
+    시퀀스별 행을 순서대로 yield 합니다.
+
+    스캔 인덱스에 있는 행은 바로 반환하고, 나머지는 ProbeEngine 에서
+    병렬로 프로브하면서 앞쪽부터 끝나는 대로 반환합니다.
+    프로브에 실패한 시퀀스는 건너뛰고 마지막에 목록을 출력합니다.
+
+    Yields:
+        (done, total, info)
+    """
+    total = len(sequences)
+    print(f"[PROGRESS] _iter_seq_array() START - total sequences: {total}")
+
+    # 스캔 인덱스에서 바뀌지 않은 시퀀스의 행을 재사용
+    rows = [None] * total
+    index_keys = [None] * total
+    probe_items = []
+    for i, seq in enumerate(sequences):
+        if index and index.enabled:
+            key, signature = _get_index_key(seq)
+            index_keys[i] = (key, signature)
+            row = index.get_row(key, signature)
+            if row is not None:
+                rows[i] = row
+                continue
+        probe_items.append(i)
+    print(f"[PROGRESS] Index hits: {total - len(probe_items)}, to probe: {len(probe_items)}")
+
+    # 썸네일 번호를 미리 매겨 두면 각 프로브 작업에는 시퀀스 하나만 넘기면 됨
+    unnumbered = [seq for seq in sequences
+                  if _get_ext(seq) in ["mov", "mxf"] and getattr(seq, 'thumbnail_number', None) is None]
+    if unnumbered:
+        _number_mov_thumbnails(unnumbered)
+
+    lazy = get_config_value('ingest.lazy_metadata', True)
+    engine = ProbeEngine()
+    print(f"[PROGRESS] Probe engine: mode={engine.mode}, workers={engine.workers}, lazy={lazy}")
+    probed = engine.imap(_create_seq_row, [sequences[i] for i in probe_items], lazy)
+    probe_set = set(probe_items)
+
+    index_items = []
+    try:
+        for i in range(total):
+            info = rows[i]
+            if i in probe_set:
+                info = next(probed)
+                if info is not None and index_keys[i]:
+                    key, signature = index_keys[i]
+                    index_items.append((key, signature, list(info)))
+                    if signature is not None:
+                        # 인덱스에 쓰기 전에 지연 컬럼이 채워지면 이 목록도 함께 고침 (resolve_lazy_row)
+                        sequences[i].index_entry = (index.path, key, signature, index_items[-1][2])
+            elif index_keys[i] and index_keys[i][1] is not None:
+                key, signature = index_keys[i]
+                sequences[i].index_entry = (index.path, key, signature, None)
+            if info is not None:
+                info = SeqRow(info, sequences[i])
+                # 지연 행의 썸네일은 resolve_lazy_row() 에서 요청
+                if not info.is_lazy():
+                    _request_thumbnail(sequences[i], info)
+                yield i + 1, total, info
+    finally:
+        probed.close()
+        THUMBNAIL_SERVICE.flush()
+        if index and index_items:
+            index.put_rows(index_items)
+
+        if engine.failures:
+            print(f"[PROGRESS] {len(engine.failures)} sequences failed to probe:")
+            for failure in engine.failures:
+                print(f"[PROGRESS]   - {failure.item}: {failure.error}")
+        print(f"[PROGRESS] _iter_seq_array() FINISHED")
+
+
+def _get_index_key(seq):
+    """
+    스캔 인덱스용 (key, signature) 를 반환합니다.
+
+    key 는 시퀀스 식별자, signature 는 파일 stat 기반 변경 감지 값입니다.
+    """
+    if _get_ext(seq) in ["mov", "mxf"]:
+        key = seq.mov_file
+        cut = ""
+        if seq.cutitem:
+            item = seq.cutitem
+            key = "%s#%s-%s" % (seq.mov_file, item.rec_start_tc, item.rec_end_tc)
+            cut = "|%s|%s|%s|%s" % (item.clibname, item.start_tc, item.end_tc, item.m2_retime)
+        signature = stat_signature([seq.mov_file])
+        if signature is not None:
+            signature += cut
+        return key, signature
+
+    first = _get_frame_file(seq, seq.start())
+    last = _get_frame_file(seq, seq.end())
+    key = "%s|%s|%s" % (os.path.join(seq.dirname, seq.head()), seq.tail(), seq.format("%p"))
+    signature = stat_signature([first, last])
+    if signature is not None:
+        signature += "|%d-%d|%d" % (seq.start(), seq.end(), len(seq))
+    return key, signature
+
+
+def _request_thumbnail(seq, info):
+    """썸네일이 없거나 원본보다 오래되었으면 백그라운드 생성 요청"""
+    source = _get_thumbnail_source(seq)
+    thumbnail_file = info[MODEL_KEYS['thumbnail']]
+    if not source or not thumbnail_file:
+        return
+    try:
+        THUMBNAIL_SERVICE.request(source, thumbnail_file)
+    except OSError as e:
+        print(f"ERROR: Failed to request thumbnail for {source}: {e}")
+
+
+def _create_seq_row(seq, lazy=False):
+    """
+    시퀀스 하나를 프로브하여 모델 행(row)을 만듭니다.
+
+    ProbeEngine 워커에서 실행되므로 Qt 위젯을 생성하지 않습니다.
+    check 컬럼은 None 으로 두고 _create_seq_array() 에서 채웁니다.
+    lazy 이면 EXR/DPX 등 프레임 시퀀스의 LAZY_KEYS 컬럼은 LAZY_VALUE 로 두고
+    헤더를 읽지 않습니다 (MOV/MXF 는 ffprobe 결과가 캐시되어 있으므로 바로 채움).
+    """
+    print(f"[PROGRESS] ========== Processing sequence {seq} ==========")
+    print("create dir seq info {}".format(seq.start()))
+    lazy = lazy and _get_ext(seq) not in ["mov", "mxf"]
+    info = []
+    info.insert(MODEL_KEYS['check'], None)
+    info.insert(MODEL_KEYS['thumbnail'],_get_thumbnail(seq))
+    info.insert(MODEL_KEYS['roll'],"")
+    info.insert(MODEL_KEYS['seq_name'],"")
+    info.insert(MODEL_KEYS['shot_name'], "")
+    info.insert(MODEL_KEYS['version'],"")
+    info.insert(MODEL_KEYS['type'], "org")
+    info.insert(MODEL_KEYS['scan_path'], seq.dirname)
+    info.insert(MODEL_KEYS['scan_name'], seq.head())
+    if _get_ext(seq) in ["mov", "mxf"]:
+        info.insert(MODEL_KEYS['clip_name'], seq.clip_name)
+    elif _get_ext(seq) == "exr":
+        info.insert(MODEL_KEYS['clip_name'], LAZY_VALUE if lazy else _get_exr_clip_name(seq))
+    else:
+        info.insert(MODEL_KEYS['clip_name'], seq.head())
+    info.insert(MODEL_KEYS['pad'],seq.format('%p'))
+    info.insert(MODEL_KEYS['ext'],_get_ext(seq))
+    print("[PROGRESS] About to call _get_resolution()")
+    info.insert(MODEL_KEYS['resolution'] , LAZY_VALUE if lazy else _get_resolution(seq))
+    print("[PROGRESS] _get_resolution() completed, calling _get_start()")
+    start = _get_start(seq)
+    info.insert(MODEL_KEYS['start_frame'], start)
+    print("[PROGRESS] _get_start() completed, calling _get_end()")
+    end = _get_end(seq)
+    info.insert(MODEL_KEYS['end_frame'], end)
+    print("[PROGRESS] _get_end() completed, calling _get_duration()")
+    info.insert(MODEL_KEYS['duration'],_get_duration(seq))
+    print("[PROGRESS] _get_duration() completed")
+    info.insert(MODEL_KEYS['retime_duration'],None)
+    info.insert(MODEL_KEYS['retime_percent'],None)
+    info.insert(MODEL_KEYS["retime_start_frame"],None)
+    print("[PROGRESS] About to call _get_framerate()")
+    framerate = LAZY_VALUE if lazy else _get_framerate(seq)
+    print("[PROGRESS] About to process timecodes")
+    timecode_flagged = False
+    if _get_ext(seq) in  ["mov" , "mxf"]:
+        if seq.cutitem:
+            info.insert(MODEL_KEYS['timecode_in'],str(seq.cutitem.start_tc))
+            info.insert(MODEL_KEYS['timecode_out'],str(seq.cutitem.end_tc))
         else:
             print("[PROGRESS] Calling _get_time_code() for timecode_in")
-            info.insert(MODEL_KEYS['timecode_in'], _get_time_code(seq,_get_start(seq)))
+            info.insert(MODEL_KEYS['timecode_in'], _get_time_code(seq,start))
             print("[PROGRESS] Calling _get_time_code() for timecode_out")
-            info.insert(MODEL_KEYS['timecode_out'],_get_time_code(seq,_get_end(seq)))
-        print("[PROGRESS] Timecodes completed, processing final metadata")
-        info.insert(MODEL_KEYS['just_in'],_get_start(seq))
-        info.insert(MODEL_KEYS['just_out'], _get_end(seq))
-        print("[PROGRESS] About to call _get_framerate()")
-        info.insert(MODEL_KEYS['framerate'] ,_get_framerate(seq))
-        print("[PROGRESS] _get_framerate() completed")
-        info.insert(MODEL_KEYS['date'] , "")
-        clip_tag_value = ""
-        if _get_ext(seq) in ["mov", "mxf"] and hasattr(seq, 'cutitem') \
-                and seq.cutitem and seq.cutitem.m2_retime is not None:
-            retime = seq.cutitem.m2_retime
-            if retime == 0.0:
-                clip_tag_value = "리타임"
-            else:
-                retime_percent = (retime / 24.0) * 100
-                duration = _get_end(seq) - _get_start(seq) + 1
-                clip_tag_value = "리타임  {:.1f}%  {}fr".format(retime_percent, duration)
-        info.insert(MODEL_KEYS['clip_tag'], clip_tag_value)
-        array.append(info)
-        print("[PROGRESS] ✓ Sequence {} processing completed".format(seq.start()))
-        print(f"[PROGRESS] ========== End of sequence {seq_index}/{len(sequences)} ==========\n")
+            info.insert(MODEL_KEYS['timecode_out'],_get_time_code(seq,end))
+    elif lazy:
+        info.insert(MODEL_KEYS['timecode_in'], LAZY_VALUE)
+        info.insert(MODEL_KEYS['timecode_out'], LAZY_VALUE)
+    else:
+        print("[PROGRESS] Calling _get_time_code() for timecode_in")
+        timecode_in = _get_time_code(seq,start)
+        info.insert(MODEL_KEYS['timecode_in'], timecode_in)
+        print("[PROGRESS] Calling _get_time_code_out() for timecode_out")
+        timecode_out, timecode_flagged = _get_time_code_out(seq, start, end, timecode_in, framerate)
+        info.insert(MODEL_KEYS['timecode_out'], timecode_out)
+    print("[PROGRESS] Timecodes completed, processing final metadata")
+    info.insert(MODEL_KEYS['just_in'],start)
+    info.insert(MODEL_KEYS['just_out'], end)
+    info.insert(MODEL_KEYS['framerate'] ,framerate)
+    print("[PROGRESS] _get_framerate() completed")
+    info.insert(MODEL_KEYS['date'] , "")
+    clip_tag_value = ""
+    if _get_ext(seq) in ["mov", "mxf"] and hasattr(seq, 'cutitem') \
+            and seq.cutitem and seq.cutitem.m2_retime is not None:
+        retime = seq.cutitem.m2_retime
+        if retime == 0.0:
+            clip_tag_value = "리타임"
+        else:
+            retime_percent = (retime / 24.0) * 100
+            duration = end - start + 1
+            clip_tag_value = "리타임  {:.1f}%  {}fr".format(retime_percent, duration)
+    elif timecode_flagged:
+        clip_tag_value = TIMECODE_DISCONTINUITY_TAG
+    info.insert(MODEL_KEYS['clip_tag'], clip_tag_value)
+    print("[PROGRESS] ✓ Sequence {} processing completed".format(seq.start()))
+    return info
 
-    print(f"[PROGRESS] _create_seq_array() FINISHED - processed {len(array)} sequences")
-    print("[PROGRESS] About to return array from _create_seq_array()")
-    return array
 
+def resolve_lazy_row(row):
+    """
+    SeqRow 의 지연 컬럼 값을 계산하고 썸네일 생성을 요청합니다.
 
-def _get_thumbnail(seq,sequences):
-    
-    
+    워커 스레드에서 호출할 수 있도록 행은 수정하지 않고 값만 반환합니다.
+    적용은 GUI 스레드에서 SeqTableModel.apply_lazy_values() 가 합니다.
 
+    Args:
+        row: SeqRow
+
+    Returns:
+        {컬럼 인덱스: 값}
+    """
+    seq = getattr(row, 'seq', None)
+    if seq is None:
+        return {}
+
+    values = {}
+    start = _get_start(seq)
+    end = _get_end(seq)
+    if row[MODEL_KEYS['clip_name']] == LAZY_VALUE:
+        values[MODEL_KEYS['clip_name']] = _get_exr_clip_name(seq)
+    if row[MODEL_KEYS['resolution']] == LAZY_VALUE:
+        values[MODEL_KEYS['resolution']] = _get_resolution(seq)
+
+    framerate = row[MODEL_KEYS['framerate']]
+    if framerate == LAZY_VALUE:
+        framerate = _get_framerate(seq)
+        values[MODEL_KEYS['framerate']] = framerate
+
+    timecode_in = row[MODEL_KEYS['timecode_in']]
+    if timecode_in == LAZY_VALUE:
+        timecode_in = _get_time_code(seq, start)
+        values[MODEL_KEYS['timecode_in']] = timecode_in
+    if row[MODEL_KEYS['timecode_out']] == LAZY_VALUE:
+        timecode_out, flagged = _get_time_code_out(seq, start, end, timecode_in, float(framerate))
+        values[MODEL_KEYS['timecode_out']] = timecode_out
+        if flagged and not row[MODEL_KEYS['clip_tag']]:
+            values[MODEL_KEYS['clip_tag']] = TIMECODE_DISCONTINUITY_TAG
+
+    _request_thumbnail(seq, row)
+    THUMBNAIL_SERVICE.flush()
+
+    # 계산한 값을 스캔 인덱스에도 남겨서 다시 열 때 헤더를 읽지 않도록 함
+    index_entry = getattr(seq, 'index_entry', None)
+    if index_entry and values:
+        path, key, signature, pending_row = index_entry
+        if pending_row is not None:
+            for col, value in values.items():
+                pending_row[col] = value
+        INDEX_UPDATES.add((path, key, signature), values)
+    return values
+
+
+def _get_thumbnail(seq):
 
     if _get_ext(seq) in ["mov","mxf"]:
-        
-        
-
-        index_search =  [ x.start() for x in sequences ]
-        index_search = list(set(index_search))
-        index_search.sort()
-        index = index_search.index(seq.start()) + 1
-
-        mov_file = os.path.join(seq.dirname,seq.scan_name)
-        thumbnail_path = os.path.join(seq.dirname,".thumbnail")
-        #if not os.path.exists(thumbnail_path):
-        #    os.makedirs(thumbnail_path)
-        if seq.event:
-            thumbnail_file = os.path.join(thumbnail_path,seq.scan_name.split(".")[0]+".%04d.jpg"%index)
-        else:
-            thumbnail_file = os.path.join(thumbnail_path,seq.scan_name.split(".")[0]+".0001.jpg")
-        #start_frame = seq.start()
-
-        #command = ['rez-env',"ffmpeg","--","ffmpeg","-y"]
-        #command.append("-i")
-        #command.append(mov_file)
-        #command.append("-vf")
-        #command.append("select='gte(n\,{0})'".format(seq.start()-1))
-        #command.append("-vframes")
-        #command.append("1")
-        #command.append("-s")
-        #command.append("240x144")
-        #command.append(thumbnail_file)
-
-        #command = " ".join(command)
-        #os.system(command)
-        return thumbnail_file
+        # 번호는 _number_mov_thumbnails() 에서 매김 (이벤트가 없으면 1)
+        number = getattr(seq, 'thumbnail_number', None) or 1
+        return _get_mov_thumbnail_file(seq, number)
     else:
         if not seq.tail() or seq.tail() == "":
-            original_file = os.path.join(seq.dirname, seq.head())
             thumbnail_path = os.path.join(os.path.dirname(seq.dirname), ".thumbnail")
             thumbnail_file = os.path.join(thumbnail_path,
                                          os.path.basename(seq.dirname) + '_' + seq.head() + ".jpg")
         else:
-            original_file = os.path.join(seq.dirname,
-                                         seq.head()+seq.format("%p")%seq.start()+seq.tail())
             thumbnail_path = os.path.join(os.path.dirname(seq.dirname), ".thumbnail")
             thumbnail_file = os.path.join(thumbnail_path,
                                          os.path.basename(seq.dirname)+'_'+seq.head()+seq.format("%p")%seq.start()+".jpg")
 
-        print(thumbnail_file)
-        if not os.path.exists(thumbnail_path):
-            os.makedirs(thumbnail_path)
+        # 생성은 THUMBNAIL_SERVICE 가 백그라운드에서 처리 (_iter_seq_array 참고)
+        return thumbnail_file
+
+
+def _get_thumbnail_source(seq):
+    """썸네일을 만들 원본 프레임 경로 (MOV/MXF 는 _create_thumbnail_for_mov 에서 처리하므로 None)"""
+    if _get_ext(seq) in ["mov", "mxf"]:
+        return None
+    return _get_frame_file(seq, seq.start())
 
-        # Rez 사용 여부에 따라 oiiotool 명령 구성
-        try:
-            from ...app_instance import AppInstance
-            app_config = AppInstance.get_config()
-            use_rez = app_config.get('rez.enabled', True) if app_config else True
-        except:
-            # AppInstance를 사용할 수 없으면 환경변수로 판단
-            use_rez = os.environ.get('USE_REZ', '1') == '1'
-
-        if use_rez:
-            # Rez 환경에서 oiio 패키지 로드
-            command = ['rez-env', 'oiio', '--', 'oiiotool']
-        else:
-            # 로컬 시스템의 oiiotool 직접 사용
-            # oiiotool이 설치되어 있는지 확인
-            import shutil
-            if not shutil.which('oiiotool'):
-                print(f"WARNING: oiiotool not found, skipping thumbnail generation for {original_file}")
-                print("         Install OpenImageIO: brew install openimageio (macOS)")
-                print("                             : sudo apt-get install openimageio-tools (Linux)")
-                # 썸네일 파일이 없어도 경로만 반환 (UI에서 기본 아이콘 표시)
-                return thumbnail_file
-            command = ['oiiotool']
-
-        command.append(original_file)
-        command.append("--colorconvert")
-        command.append("linear")
-        command.append("sRGB")
-        command.append("--resize")
-        command.append("960x540")
-        command.append("-o")
-        command.append(thumbnail_file)
-
-        command_str = " ".join(command)
-        print(f"Generating thumbnail: {command_str}")
-
-        # subprocess를 사용하여 더 안전하게 실행
-        import subprocess
-        try:
-            result = subprocess.run(command, capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
-                print(f"ERROR: oiiotool failed with return code {result.returncode}")
-                if result.stderr:
-                    print(f"       {result.stderr}")
-            else:
-                print(f"✓ Thumbnail created: {thumbnail_file}")
-        except subprocess.TimeoutExpired:
-            print(f"ERROR: oiiotool timeout for {original_file}")
-        except Exception as e:
-            print(f"ERROR: Failed to generate thumbnail: {e}")
 
-        return thumbnail_file
-        
 def _get_duration(seq):
     print(f"[DEBUG] _get_duration() START")
     if _get_ext(seq) in ["mov","mxf"]:
@@ -556,9 +863,11 @@ def _get_end(seq):
     return result
 
 def _get_ext(seq):
+    # scan_directory 는 A.MOV / B.MXF 도 찾으므로 소문자로 비교
     if not seq.tail():
-        return seq.mov_file.split(".")[-1]
-    return seq.tail().split(".")[-1]
+        # MOV_INFO 는 mov_file, 단일 파일 시퀀스는 head 에서 확장자 추출
+        return getattr(seq, 'mov_file', seq.head()).split(".")[-1].lower()
+    return seq.tail().split(".")[-1].lower()
 
 def _get_time_code(seq,frame):
     print(f"[DEBUG] _get_time_code() START - frame: {frame}, ext: {_get_ext(seq)}, tail: {seq.tail()}")
@@ -572,85 +881,82 @@ def _get_time_code(seq,frame):
             start_timecode = mov_info.video_stream['tags']['timecode']
         else:
             start_timecode = "00:00:00:00"
-        n ,d = mov_info.video_stream['r_frame_rate'].split("/")
-        frame_rate = float(n) / float(d)
-        start_timecode = Timecode(round(frame_rate),str(start_timecode))
-        result = str(start_timecode + (int(frame) - 1))
+        result = offset_timecode(str(start_timecode), int(frame) - 1, mov_info.framerate())
         print(f"[DEBUG] _get_time_code() END - MOV/MXF result: {result}")
         return result
 
 
 
-    if seq.tail() == ".exr":
-        exr_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%frame+seq.tail())
-        print(f"[DEBUG] _get_time_code() - Processing EXR: {exr_file}")
-        exr = _safe_open_exr(exr_file)
-        if exr is None:
-            print(f"[DEBUG] _get_time_code() END - EXR open failed")
-            return ""
-        try:
-            if "timeCode" in exr.header():
-                ti = exr.header()['timeCode']
-                result = "%02d:%02d:%02d:%02d"%(ti.hours,ti.minutes,ti.seconds,ti.frame)
-                print(f"[DEBUG] _get_time_code() END - EXR result: {result}")
-                return result
-        except Exception as e:
-            print(f"ERROR: Failed to read timecode from {exr_file}: {e}")
-        print(f"[DEBUG] _get_time_code() END - EXR no timecode")
-        return ""
-    elif seq.tail() == ".dpx":
-        dpx_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%frame+seq.tail())
-        print(f"[DEBUG] _get_time_code() - Processing DPX: {dpx_file}")
-        dpx = _safe_open_dpx(dpx_file)
-        if dpx is None:
-            print(f"[DEBUG] _get_time_code() END - DPX open failed")
-            return ""
-        try:
-            result = dpx.tv_header.time_code
-            print(f"[DEBUG] _get_time_code() END - DPX result: {result}")
-            return result
-        except Exception as e:
-            print(f"ERROR: Failed to read timecode from {dpx_file}: {e}")
-            print(f"[DEBUG] _get_time_code() END - DPX exception")
-            return ""
-    elif seq.tail() == "":
-        tail = seq.head().split(".")[-1]
-        if tail == "dpx":
-            dpx_file = os.path.join(seq.dirname,seq.head())
-            print(f"[DEBUG] _get_time_code() - Processing DPX (no tail): {dpx_file}")
-            dpx = _safe_open_dpx(dpx_file)
-            if dpx is None:
-                print(f"[DEBUG] _get_time_code() END - DPX open failed")
-                return ""
-            try:
-                result = dpx.tv_header.time_code
-                print(f"[DEBUG] _get_time_code() END - DPX (no tail) result: {result}")
-                return result
-            except Exception as e:
-                print(f"ERROR: Failed to read timecode from {dpx_file}: {e}")
-                print(f"[DEBUG] _get_time_code() END - DPX (no tail) exception")
-                return ""
-        elif tail == "exr":
-            exr_file = os.path.join(seq.dirname,seq.head())
-            print(f"[DEBUG] _get_time_code() - Processing EXR (no tail): {exr_file}")
-            exr = _safe_open_exr(exr_file)
-            if exr is None:
-                print(f"[DEBUG] _get_time_code() END - EXR open failed")
-                return ""
-            try:
-                if "timeCode" in exr.header():
-                    ti = exr.header()['timeCode']
-                    result = "%02d:%02d:%02d:%02d"%(ti.hours,ti.minutes,ti.seconds,ti.frame)
-                    print(f"[DEBUG] _get_time_code() END - EXR (no tail) result: {result}")
-                    return result
-            except Exception as e:
-                print(f"ERROR: Failed to read timecode from {exr_file}: {e}")
-            print(f"[DEBUG] _get_time_code() END - EXR (no tail) no timecode")
-            return ""
-    else:
+    if _get_frame_ext(seq) not in ["exr", "dpx"]:
         print(f"[DEBUG] _get_time_code() END - Unknown type")
         return ""
 
+    header = FRAME_HEADER_CACHE.get(_get_frame_file(seq, frame))
+    if header is None:
+        print(f"[DEBUG] _get_time_code() END - header read failed")
+        return ""
+    print(f"[DEBUG] _get_time_code() END - result: {header.timecode}")
+    return header.timecode
+
+def _get_time_code_out(seq, start, end, timecode_in, framerate):
+    """
+    시퀀스의 timecode_out 을 구합니다.
+
+    ingest.timecode_out 이 "derive" 이면 timecode_in + (end - start) 로 계산하고,
+    ingest.timecode_samples 개(이미 읽은 첫 프레임 포함)의 헤더로 연속성을 확인합니다.
+    - 1 (기본): 첫 프레임만 (마지막 프레임을 열지 않음)
+    - 2: 첫 프레임 + 마지막 프레임 (계산한 끝 타임코드와 비교, 설정으로 켤 때만)
+    - 3 이상: 마지막 프레임 + 중간 프레임 (samples - 2) 개
+    샘플이 맞지 않으면 마지막 프레임의 타임코드를 사용하고 flagged 를 True 로 반환합니다.
+    빠진 프레임이 있으면 기존처럼 마지막 프레임을 읽습니다.
+
+    Args:
+        seq: 시퀀스
+        start, end: _get_start() / _get_end() 결과
+        timecode_in: 첫 프레임 타임코드
+        framerate: 시퀀스 프레임레이트
+
+    Returns:
+        (timecode_out, flagged) - flagged 는 샘플 타임코드가 맞지 않았을 때 True
+    """
+    if start == end:
+        return timecode_in, False
+    if get_config_value('ingest.timecode_out', 'derive') != 'derive' \
+            or not timecode_in or len(seq) != end - start + 1:
+        return _get_time_code(seq, end), False
+
+    framerate = framerate or DEFAULT_FPS
+    try:
+        timecode_to_frame(timecode_in, framerate)
+    except ValueError:
+        return _get_time_code(seq, end), False
+
+    derived = offset_timecode(timecode_in, end - start, framerate)
+    samples = max(1, int(get_config_value('ingest.timecode_samples', 1)))
+    if samples == 1:
+        return derived, False
+
+    # 마지막 프레임을 먼저 확인하고, 남은 샘플은 중간 프레임에 고르게 나눔
+    middle = samples - 2
+    sample_frames = [end] + sorted(set(start + int(round(i * (end - start) / float(middle + 1)))
+                                       for i in range(1, middle + 1)) - set([start, end]))
+    timecode_out = derived
+    for frame in sample_frames:
+        sampled = _get_time_code(seq, frame)
+        if not sampled:
+            continue
+        expected = offset_timecode(timecode_in, frame - start, framerate)
+        if frame == end:
+            timecode_out = sampled
+        if sampled.replace(";", ":") != expected.replace(";", ":"):
+            print(f"WARNING: Timecode discontinuity in {seq}: frame {frame} is {sampled}, expected {expected}")
+            if frame != end:
+                timecode_out = _get_time_code(seq, end) or derived
+            return timecode_out, True
+
+    return timecode_out, False
+
+
 def _get_framerate(seq):
     print(f"[DEBUG] _get_framerate() START - ext: {_get_ext(seq)}, tail: {seq.tail()}")
 
@@ -664,76 +970,17 @@ def _get_framerate(seq):
         print(f"[DEBUG] _get_framerate() END - MOV/MXF result: {frame_rate}")
         return frame_rate
 
-    if seq.tail() == ".exr":
-        exr_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%seq.start()+seq.tail())
-        print(f"[DEBUG] _get_framerate() - Processing EXR: {exr_file}")
-        exr = _safe_open_exr(exr_file)
-        if exr is None:
-            print(f"[DEBUG] _get_framerate() END - EXR open failed")
-            return DEFAULT_FPS
-        try:
-            if "framesPerSecond" in exr.header():
-                fr = exr.header()['framesPerSecond']
-                result = float(fr.n)/float(fr.d)
-                print(f"[DEBUG] _get_framerate() END - EXR result: {result}")
-                return result
-        except Exception as e:
-            print(f"ERROR: Failed to read framerate from {exr_file}: {e}")
-        print(f"[DEBUG] _get_framerate() END - EXR no framerate")
-        return DEFAULT_FPS
-    elif seq.tail() == ".dpx":
-        dpx_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%seq.start()+seq.tail())
-        print(f"[DEBUG] _get_framerate() - Processing DPX: {dpx_file}")
-        dpx = _safe_open_dpx(dpx_file)
-        if dpx is None:
-            print(f"[DEBUG] _get_framerate() END - DPX open failed")
-            return DEFAULT_FPS
-        try:
-            result = dpx.raw_header.TvHeader.FrameRate
-            print(f"[DEBUG] _get_framerate() END - DPX result: {result}")
-            return result
-        except Exception as e:
-            print(f"ERROR: Failed to read framerate from {dpx_file}: {e}")
-            print(f"[DEBUG] _get_framerate() END - DPX exception")
-            return DEFAULT_FPS
-    elif seq.tail() == "":
-        tail = seq.head().split(".")[-1]
-        if tail == "dpx":
-            dpx_file = os.path.join(seq.dirname,seq.head())
-            print(f"[DEBUG] _get_framerate() - Processing DPX (no tail): {dpx_file}")
-            dpx = _safe_open_dpx(dpx_file)
-            if dpx is None:
-                print(f"[DEBUG] _get_framerate() END - DPX open failed")
-                return DEFAULT_FPS
-            try:
-                result = dpx.raw_header.TvHeader.FrameRate
-                print(f"[DEBUG] _get_framerate() END - DPX (no tail) result: {result}")
-                return result
-            except Exception as e:
-                print(f"ERROR: Failed to read framerate from {dpx_file}: {e}")
-                print(f"[DEBUG] _get_framerate() END - DPX (no tail) exception")
-                return DEFAULT_FPS
-        elif tail == "exr":
-            exr_file = os.path.join(seq.dirname,seq.head())
-            print(f"[DEBUG] _get_framerate() - Processing EXR (no tail): {exr_file}")
-            exr = _safe_open_exr(exr_file)
-            if exr is None:
-                print(f"[DEBUG] _get_framerate() END - EXR open failed")
-                return DEFAULT_FPS
-            try:
-                if "framesPerSecond" in exr.header():
-                    fr = exr.header()['framesPerSecond']
-                    result = float(fr.n)/float(fr.d)
-                    print(f"[DEBUG] _get_framerate() END - EXR (no tail) result: {result}")
-                    return result
-            except Exception as e:
-                print(f"ERROR: Failed to read framerate from {exr_file}: {e}")
-            print(f"[DEBUG] _get_framerate() END - EXR (no tail) no framerate")
-            return DEFAULT_FPS
-    else:
+    if _get_frame_ext(seq) not in ["exr", "dpx"]:
         print(f"[DEBUG] _get_framerate() END - Unknown type")
         return DEFAULT_FPS
 
+    header = FRAME_HEADER_CACHE.get(_get_frame_file(seq, seq.start()))
+    if header is None or header.framerate is None:
+        print(f"[DEBUG] _get_framerate() END - no framerate")
+        return DEFAULT_FPS
+    print(f"[DEBUG] _get_framerate() END - result: {header.framerate}")
+    return header.framerate
+
 def _get_resolution(seq):
     print(f"[DEBUG] _get_resolution() START - ext: {_get_ext(seq)}, tail: {seq.tail()}")
 
@@ -748,169 +995,124 @@ def _get_resolution(seq):
         print(f"[DEBUG] _get_resolution() END - MOV/MXF result: {result}")
         return result
 
-    if seq.tail() == ".exr":
-        exr_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%seq.start()+seq.tail())
-        print(f"[DEBUG] _get_resolution() - Processing EXR file: {exr_file}")
-        exr = _safe_open_exr(exr_file)
-        if exr is None:
-            print(f"[DEBUG] _get_resolution() END - EXR open failed, returning empty")
-            return ""
-        try:
-            if "dataWindow" in exr.header():
-                res = exr.header()['dataWindow']
-                result = "%d x %d"%(res.max.x+1,res.max.y+1)
-                print(f"[DEBUG] _get_resolution() END - EXR result: {result}")
-                return result
-        except Exception as e:
-            print(f"ERROR: Failed to read resolution from {exr_file}: {e}")
-        print(f"[DEBUG] _get_resolution() END - EXR no dataWindow, returning empty")
-        return ""
-    elif seq.tail() == ".dpx":
-        dpx_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%seq.start()+seq.tail())
-        print(f"[DEBUG] _get_resolution() - Processing DPX file: {dpx_file}")
-        dpx = _safe_open_dpx(dpx_file)
-        if dpx is None:
-            print(f"[DEBUG] _get_resolution() END - DPX open failed, returning empty")
-            return ""
-        try:
-            width = dpx.raw_header.OrientHeader.XOriginalSize
-            height = dpx.raw_header.OrientHeader.YOriginalSize
-            if width == 0:
-                from subprocess import check_output
-                dpx_info = check_output(["rez-env", "oiio","--","iinfo",dpx_file])
-                resolution_info = re.search("\d+\ x\s+\d+",dpx_info)
-                if resolution_info :
-                    width,height = resolution_info.group().split("x")
-                    width = int(width)
-                    height = int(height)
-            result = '%d x %d'%(width,height)
-            print(f"[DEBUG] _get_resolution() END - DPX result: {result}")
-            return result
-        except Exception as e:
-            print(f"ERROR: Failed to read resolution from {dpx_file}: {e}")
-            print(f"[DEBUG] _get_resolution() END - DPX exception, returning empty")
-            return ""
-
-    elif seq.tail() in [ '.jpg','.jpeg']:
+    if seq.tail() in [ '.jpg','.jpeg']:
         jpg_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%seq.start()+seq.tail())
         print(f"[DEBUG] _get_resolution() - Processing JPG file: {jpg_file}")
         jpeg = Image.open(jpg_file)
         result = '%d x %d'%(jpeg.size[0],jpeg.size[1])
         print(f"[DEBUG] _get_resolution() END - JPG result: {result}")
         return result
-    elif seq.tail() == "":
-        tail = seq.head().split(".")[-1]
-        if tail == "dpx":
-            dpx_file = os.path.join(seq.dirname,seq.head())
-            print(f"[DEBUG] _get_resolution() - Processing DPX file (no tail): {dpx_file}")
-            dpx = _safe_open_dpx(dpx_file)
-            if dpx is None:
-                print(f"[DEBUG] _get_resolution() END - DPX open failed, returning empty")
-                return ""
-            try:
-                width = dpx.raw_header.OrientHeader.XOriginalSize
-                height = dpx.raw_header.OrientHeader.YOriginalSize
-                if width == 0:
-                    from subprocess import check_output
-                    dpx_info = check_output(["rez-env", "oiio","--","iinfo",dpx_file])
-                    resolution_info = re.search("\d+\ x\ \d+",dpx_info)
-                    if resolution_info :
-                        width,height = resolution_info.group().split("x")
-                        width = int(width)
-                        height = int(height)
-                result = '%d x %d'%(width,height)
-                print(f"[DEBUG] _get_resolution() END - DPX (no tail) result: {result}")
-                return result
-            except Exception as e:
-                print(f"ERROR: Failed to read resolution from {dpx_file}: {e}")
-                print(f"[DEBUG] _get_resolution() END - DPX (no tail) exception, returning empty")
-                return ""
-        elif tail == "exr":
-            exr_file = os.path.join(seq.dirname,seq.head())
-            print(f"[DEBUG] _get_resolution() - Processing EXR file (no tail): {exr_file}")
-            exr = _safe_open_exr(exr_file)
-            if exr is None:
-                print(f"[DEBUG] _get_resolution() END - EXR open failed, returning empty")
-                return ""
-            try:
-                if "dataWindow" in exr.header():
-                    res = exr.header()['dataWindow']
-                    result = "%d x %d"%(res.max.x+1,res.max.y+1)
-                    print(f"[DEBUG] _get_resolution() END - EXR (no tail) result: {result}")
-                    return result
-            except Exception as e:
-                print(f"ERROR: Failed to read resolution from {exr_file}: {e}")
-            print(f"[DEBUG] _get_resolution() END - EXR (no tail) no dataWindow, returning empty")
-            return ""
-    else:
+
+    if _get_frame_ext(seq) not in ["exr", "dpx"]:
         print(f"[DEBUG] _get_resolution() END - Unknown type, returning empty")
         return ""
 
+    header = FRAME_HEADER_CACHE.get(_get_frame_file(seq, seq.start()))
+    if header is None:
+        print(f"[DEBUG] _get_resolution() END - header read failed, returning empty")
+        return ""
+    print(f"[DEBUG] _get_resolution() END - result: {header.resolution}")
+    return header.resolution
 
-def _get_sequences(path):
-    
-    sequences = []
 
-    for temp in os.listdir(path):
-        if temp in ['.thumbnail']:
-            continue
-        temp = os.path.join(path,temp)
-        if os.path.isdir(temp):
-            sequence = pyseq.get_sequences(temp)
-            if sequence:
-                sequences.extend(sequence)
-    
-
-    return sequences
+def _get_movs(path, mov_files, edl_files):
+    """
+    MOV/MXF 파일과 같은 이름으로 시작하는 EDL 의 이벤트를 MOV_INFO 로 만듭니다.
 
-def _get_movs(path):
-    
+    Args:
+        path: 스캔 폴더 경로
+        mov_files: MOV/MXF 경로 목록 (discover.scan_directory 결과)
+        edl_files: EDL 경로 목록 (discover.scan_directory 결과)
+    """
     movs = []
 
-    mov_files = glob.glob(os.path.join(path,"*.mov"))
-    mxf_files =  glob.glob(os.path.join(path,"*.mxf"))
-    if mxf_files:
-        mov_files.extend(mxf_files)
-
-    
     for mov_file in mov_files:
-        
+
         video_stream = MOV_INFO.video_stream(mov_file)
         mov_info = MOV_INFO(mov_file,video_stream)
         mov_name = mov_file.split(".")[0]
-        edl_files = glob.glob(mov_name + "*.edl")
-        print(edl_files)
-        if edl_files:
-            for edl_file in edl_files:
-                if os.path.exists(edl_file):
-                    parser = Parser(round(mov_info.framerate()))
-                    f = open(edl_file)
-                    dl = parser.parse(f)
-                    first_start = dl[0]
-                    m2_data = parse_m2_from_edl(edl_file)
-                    event_num = 1
-                    for event in dl:
-
-                        cutitem = CutItem()
-                        cutitem.clibname = event.clip_name
-                        cutitem.start_tc = event.src_start_tc
-                        cutitem.end_tc = event.src_end_tc
-                        cutitem.rec_start_tc = event.rec_start_tc
-                        cutitem.rec_end_tc = event.rec_end_tc
-                        cutitem.m2_retime = m2_data.get(event_num)
-                        event_num += 1
-                        mov_info = MOV_INFO(mov_file,video_stream,event,first_start,event.clip_name,cutitem)
-                        movs.append(mov_info)
-                    f.close()
+        mov_edl_files = [edl_file for edl_file in edl_files if edl_file.startswith(mov_name)]
+        print(mov_edl_files)
+        if mov_edl_files:
+            for edl_file in mov_edl_files:
+                try:
+                    cut_table = CUT_TABLE_CACHE.get(edl_file, round(mov_info.framerate()))
+                except OSError as e:
+                    print(f"ERROR: Failed to read EDL {edl_file}: {e}")
+                    continue
+                if not cut_table.events:
+                    continue
+                first_start = cut_table.events[0]
+                for event in cut_table.events:
+
+                    cutitem = CutItem()
+                    cutitem.clibname = event.clip_name
+                    cutitem.start_tc = event.src_start_tc
+                    cutitem.end_tc = event.src_end_tc
+                    cutitem.rec_start_tc = event.rec_start_tc
+                    cutitem.rec_end_tc = event.rec_end_tc
+                    cutitem.m2_retime = event.m2_retime
+                    mov_info = MOV_INFO(mov_file,video_stream,event,first_start,event.clip_name,cutitem,cut_table)
+                    movs.append(mov_info)
         else:
             mov_info = MOV_INFO(mov_file,video_stream)
-            movs.append(mov_info)    
+            movs.append(mov_info)
 
     return movs
 
- 
 
+class ScanlistSnapshot(object):
+    """
+    저장용 모델 스냅샷 (변경 불가)
+
+    GUI 스레드에서 만든 뒤 백그라운드 저장 워커로 넘깁니다.
+    저장 중에 사용자가 모델을 고쳐도 스냅샷은 바뀌지 않습니다.
+    아직 채우지 않은 지연 컬럼(LAZY_VALUE)이 있는 행은 시퀀스를 함께 보관하고,
+    저장 워커에서 resolve_lazy() 로 채웁니다 (GUI 스레드에서 헤더를 읽지 않음).
+    """
+
+    def __init__(self, header, rows, checks, seqs=None):
+        self.header = tuple(header)
+        self.rows = tuple(tuple(row) for row in rows)
+        self.checks = tuple(checks)
+        self.seqs = tuple(seqs) if seqs is not None else (None,) * len(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
 
+    @classmethod
+    def from_model(cls, model):
+        """
+        SeqTableModel 의 현재 상태를 복사합니다 (GUI 스레드에서 호출).
+
+        check 컬럼은 bool 로, thumbnail 컬럼은 경로 문자열로 저장합니다.
+        """
+        store = model.store
+        rows = [store.row_values(row) for row in range(0, len(store))]
+        checks = [row[MODEL_KEYS['check']] for row in rows]
+        seqs = [record.seq if record.is_lazy() else None for record in store]
+        return cls(model.header, rows, checks, seqs)
+
+    def resolve_lazy(self):
+        """
+        지연 컬럼을 채운 새 스냅샷을 반환합니다 (저장 워커 스레드에서 호출).
+
+        Returns:
+            ScanlistSnapshot (지연 행이 없으면 self)
+        """
+        lazy_rows = [i for i, seq in enumerate(self.seqs) if seq is not None]
+        if not lazy_rows:
+            return self
+        print(f"[PROGRESS] Resolving {len(lazy_rows)} lazy rows before save")
+        rows = [list(row) for row in self.rows]
+        targets = [SeqRow(rows[i], self.seqs[i]) for i in lazy_rows]
+        workers = max(1, int(get_config_value('ingest.probe_workers', 4)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i, values in zip(lazy_rows, executor.map(resolve_lazy_row, targets)):
+                for col, value in values.items():
+                    rows[i][col] = value
+        INDEX_UPDATES.flush()
+        return ScanlistSnapshot(self.header, rows, self.checks)
 
 
 class ExcelWriteModel:
@@ -918,13 +1120,29 @@ class ExcelWriteModel:
     def __init__( self, excel_path ):
 
         self._excel_path = excel_path
-        self.excel_file  = self._get_excel_file()
+        self._excel_file = None
+        # 임시 파일과 워크북은 write_snapshot() 에서 만듦 (실패하면 같은 곳에서 정리)
+        self._temp_file = None
+        self.wWorkbook  = None
+        self.wWorksheet = None
+        self.bold       = None
+        #self.initHorizontalItems()
+
+    def _open_workbook(self):
+        # 다 쓴 뒤에 다음 scanlist_NN.xlsx 로 옮기므로 (publish) 쓰는 동안에는 숨김 임시 파일 사용
+        fd, self._temp_file = tempfile.mkstemp(prefix=".scanlist_", suffix=".xlsx.tmp", dir=self._excel_path)
+        os.close(fd)
 
-        self.wWorkbook  = xlsxwriter.Workbook( self._excel_file )
+        # constant_memory: 행을 쓰는 즉시 디스크로 내보내므로 메모리가 행 수에 비례하지 않음
+        self.wWorkbook  = xlsxwriter.Workbook( self._temp_file, {'constant_memory': True} )
         self.wWorksheet = self.wWorkbook.add_worksheet()     # 엑셀 파일 생성
         self.bold       = self.wWorkbook.add_format( {'bold': 1} )
-        #self.initHorizontalItems()
-    
+
+    @property
+    def excel_file(self):
+        """저장이 끝난 scanlist_NN.xlsx 경로 (저장 전에는 None)"""
+        return self._excel_file
+
     def _get_excel_file(self):
 
         excel_files = ""
@@ -947,63 +1165,152 @@ class ExcelWriteModel:
             return None
         return sorted(excel_files)[-1]
     
+    @classmethod
+    def read_scanlist(self,excel_file):
+        """
+        저장된 scanlist 를 모델 행으로 읽습니다.
+
+        상태 파일(scanlist_NN.state)이 유효하면 그것을 쓰고,
+        없거나 xlsx 가 저장 후 수정되었으면 read_excel() 로 xlsx 를 읽습니다.
+        """
+        rows = read_state(excel_file)
+        if rows is None:
+            return self.read_excel(excel_file)
+        print(f"[PROGRESS] Loaded scanlist state for {excel_file}")
+        return rows
+
     @classmethod
     def read_excel(self,excel_file):
 
-        rWorkbook  = openpyxl.load_workbook(excel_file)
-        rWorksheet = rWorkbook.active
-        rows = rWorksheet.max_row
-        cols = rWorksheet.max_column
-        array = []
-        for row in range(2, rows + 1):  # row 1 = header, data starts at row 2
-            info = []
-            check_data = rWorksheet.cell(row, MODEL_KEYS['check'] + 1).value  # openpyxl is 1-indexed
-            check_box = QtGui.QCheckBox()
-            if check_data:
-                check_box.setChecked(True)
-            info.append(check_box)
-            for col in range(1, cols):  # 0-indexed col 1 ~ cols-1
-                data = rWorksheet.cell(row, col + 1).value  # openpyxl: +1 for 1-indexed
-                if data is None:
-                    data = ""
-                if data != "NaN":
-                    if col == 1:
-                        ext = rWorksheet.cell(row, MODEL_KEYS['ext'] + 1).value
+        rows = SCANLIST_CACHE.get(excel_file)
+        if rows is None:
+            rows = self._parse_excel(excel_file)
+            SCANLIST_CACHE.put(excel_file, rows)
+        else:
+            print(f"[PROGRESS] Scanlist cache hit: {excel_file}")
+        return rows
+
+    @classmethod
+    def _parse_excel(self,excel_file):
+        """
+        scanlist 엑셀을 read_only 모드로 한 번 훑어서 행 목록을 만듭니다.
+
+        check 컬럼은 bool 로 두고,
+        숫자로 저장된 타임코드 셀은 모아서 digits_to_timecodes() 로 한 번에 변환합니다.
+
+        Args:
+            excel_file: scanlist_XX.xlsx 경로
+
+        Returns:
+            [[check(bool), thumbnail_file, ...]]
+        """
+        rWorkbook  = openpyxl.load_workbook(excel_file, read_only=True)
+        try:
+            rWorksheet = rWorkbook.active
+            sheet_rows = rWorksheet.iter_rows(values_only=True)
+            header = next(sheet_rows, None)
+            if header is None:
+                return []
+            cols = len(header)
+            while cols > 1 and header[cols - 1] is None:
+                cols -= 1
+
+            array = []
+            numeric_cells = []
+            for values in sheet_rows:  # row 1 = header, data starts at row 2
+                values = list(values[:cols])
+                values.extend([None] * (cols - len(values)))
+                info = [bool(values[MODEL_KEYS['check']])]
+                for col in range(1, cols):
+                    data = values[col]
+                    if data is None:
+                        data = ""
+                    if data == "NaN":
+                        data = ""
+                    elif col == 1:
+                        ext = values[MODEL_KEYS['ext']]
+                        scan_path = values[MODEL_KEYS['scan_path']] or ""
                         if ext in ['mov']:
-                            path = rWorksheet.cell(row, 8).value  # 0-indexed 7 → 1-indexed 8
+                            path = scan_path
                         else:
-                            path = os.path.dirname(rWorksheet.cell(row, 8).value or "")
-                        thumbnail_path = os.path.join(path, ".thumbnail")
-                        thumbnail_file = os.path.join(thumbnail_path, data)
-                        info.append(thumbnail_file)
+                            path = os.path.dirname(scan_path)
+                        data = os.path.join(path, ".thumbnail", data)
                     elif col in [MODEL_KEYS["timecode_in"], MODEL_KEYS['timecode_out']]:
                         if type(data) in (float, int):
-                            data = "%08d" % int(data)
-                            temp = list(data)
-                            temp = [temp[x] + temp[x+1] for x in range(0, len(temp)) if (x+1) % 2 == 1]
-                            data = ":".join(temp)
-                        info.append(data)
-                    else:
-                        info.append(data)
-                else:
-                    info.append("")
-            array.append(info)
+                            numeric_cells.append((len(array), col, data))
+                    info.append(data)
+                array.append(info)
+        finally:
+            rWorkbook.close()
+
+        if numeric_cells:
+            timecodes = digits_to_timecodes([data for _, _, data in numeric_cells])
+            for (row, col, _), timecode in zip(numeric_cells, timecodes):
+                array[row][col] = timecode
         return array
-    
+
     def write_model_to_excel(self,model):
-        for col in range(0,len(model.header)):
+        self.write_snapshot(ScanlistSnapshot.from_model(model))
+
+    def write_snapshot(self,snapshot,progress=None):
+        """
+        스냅샷을 임시 파일에 쓴 뒤 다음 scanlist_NN.xlsx 로 옮기고 상태 파일을 저장합니다.
+
+        백그라운드 스레드에서 호출할 수 있습니다 (모델/위젯을 사용하지 않음).
 
-            self.wWorksheet.write(0,col,model.header[col])
+        Args:
+            snapshot: ScanlistSnapshot
+            progress: progress(done, total) 콜백 (없으면 None)
 
-        for row in range(0,model.rowCount(None)):
-            index = model.createIndex(row,MODEL_KEYS['check'])
-            check_box = model.data(index,QtCore.Qt.CheckStateRole)
-            if check_box:
+        Returns:
+            저장된 scanlist_NN.xlsx 경로
+        """
+        snapshot = snapshot.resolve_lazy()
+        try:
+            self._open_workbook()
+            self._write_rows(snapshot, progress)
+            self.wWorkbook.close()
+            with _PUBLISH_LOCK:
+                self._get_excel_file()
+                os.replace(self._temp_file, self._excel_file)
+        except Exception:
+            # 저장이 끝나지 않으면 스캔 폴더에 .scanlist_*.xlsx.tmp 를 남기지 않음
+            if self._temp_file and os.path.exists(self._temp_file):
+                os.remove(self._temp_file)
+            raise
+
+        # 다시 열 때 쓰는 작업용 상태 파일 (xlsx 는 사람이 보는 출력물)
+        write_state(self._excel_file, snapshot.rows, snapshot.checks)
+        return self._excel_file
+
+    def _write_rows(self,snapshot,progress=None):
+        # constant_memory 모드에서는 행 순서대로 써야 하므로 컬럼 설정과 헤더를 먼저 씀
+        for col in list(MODEL_KEYS.values())[1:]:
+            self.wWorksheet.set_column( col,col ,15 )
+        self.wWorksheet.set_column( MODEL_KEYS['thumbnail'], MODEL_KEYS['thumbnail'], 40 )
+        self.wWorksheet.set_column( MODEL_KEYS['scan_path'], MODEL_KEYS['scan_path'], 45 )
+        for col in range(0,len(snapshot.header)):
+
+            self.wWorksheet.write(0,col,snapshot.header[col])
+
+        # 엑셀에 넣을 작은 썸네일은 워커에서 미리 만들고 메모리에서 바로 삽입
+        thumbnails = [row[MODEL_KEYS['thumbnail']] for row in snapshot.rows]
+        size = (get_config_value('thumbnail.excel_width', EXCEL_THUMBNAIL_SIZE[0]),
+                get_config_value('thumbnail.excel_height', EXCEL_THUMBNAIL_SIZE[1]))
+        quality = get_config_value('thumbnail.excel_quality', 80)
+        engine = ProbeEngine(workers=THUMBNAIL_SERVICE.workers, mode="thread")
+        images = engine.imap(_get_excel_thumbnail, thumbnails, size, quality)
+
+        total = len(snapshot)
+        for row, values, image_data in zip(range(0,total), snapshot.rows, images):
+            self.wWorksheet.set_row( row+1, 144 )   # 엑셀 높이설정 (썸네일크기 맞춰서)
+            if snapshot.checks[row]:
                 self.wWorksheet.write( row+1, MODEL_KEYS['check'], "o" )
 
-            for col in range(1,model.columnCount(None)):
-                index = model.createIndex(row,col)
-                data = model.data(index,QtCore.Qt.DisplayRole )
+            for col in range(1,len(values)):
+                # 화면에 보이는 값 (SeqTableModel.data DisplayRole) 과 같게 문자열로 씀
+                data = values[col]
+                data = "" if data is None else str(data)
                 try:
                     if data == "" :
                         self.wWorksheet.write( row+1, col, "" )
@@ -1013,21 +1320,15 @@ class ExcelWriteModel:
                             self.wWorksheet.write( row+1, col, thumbnail_file )
                         else:
                             self.wWorksheet.write( row+1, col, data )
-                    if col == 1:
-                        #col = self.wWorksheet.col(1)
-                        #col.width = 240
-                        self.wWorksheet.set_row( row+1, 144 )   # 엑셀 높이설정 (썸네일크기 맞춰서)
-                        self.wWorksheet.insert_image( row+1, col,data,{'x_scale':0.25, 'y_scale': 0.25})
+                    if col == 1 and image_data is not None:
+                        self.wWorksheet.insert_image( row+1, col, thumbnails[row], {'image_data': image_data})
 
                 except Exception as e :
                     print(e)
                     pass
-        
-        for col in list(MODEL_KEYS.values())[1:]:
-            self.wWorksheet.set_column( col,col ,15 )
-        self.wWorksheet.set_column( MODEL_KEYS['thumbnail'], MODEL_KEYS['thumbnail'], 40 )
-        self.wWorksheet.set_column( MODEL_KEYS['scan_path'], MODEL_KEYS['scan_path'], 45 )
-        self.wWorkbook.close()
+
+            if progress is not None and ((row + 1) % 50 == 0 or row + 1 == total):
+                progress(row + 1, total)
 
     def set_global_data( self ,temp_folder,scan_date ):
         self.ws_2 = self.wWorkbook.add_worksheet()
@@ -1069,6 +1370,34 @@ class ExcelWriteModel:
         self.wWorksheet.write( row, colName, string )
 
 
+def _get_excel_thumbnail(thumbnail_file, size, quality):
+    """
+    scanlist 엑셀에 넣을 작은 JPEG 썸네일을 메모리에 만듭니다.
+
+    Args:
+        thumbnail_file: .thumbnail 디렉토리의 JPEG 경로
+        size: (width, height) 최대 크기
+        quality: JPEG 품질
+
+    Returns:
+        io.BytesIO 또는 None (썸네일이 없거나 읽기 실패 시)
+    """
+    if not thumbnail_file or not os.path.isfile(thumbnail_file):
+        return None
+    try:
+        with Image.open(thumbnail_file) as image:
+            image.draft('RGB', size)
+            image = image.convert('RGB')
+            image.thumbnail(size)
+            buf = io.BytesIO()
+            image.save(buf, 'JPEG', quality=quality)
+    except Exception as e:
+        print(f"WARNING: Failed to create excel thumbnail for {thumbnail_file}: {e}")
+        return None
+    buf.seek(0)
+    return buf
+
+
 def get_time_code(dir_name,head,frame_format,frame,tail):
 
     if tail == "mov":
@@ -1077,32 +1406,12 @@ def get_time_code(dir_name,head,frame_format,frame,tail):
         video_stream = MOV_INFO.video_stream(mov_file)
         mov_info = MOV_INFO(mov_file,video_stream)
         start_timecode = mov_info.video_stream['tags']['timecode']
-        n ,d = mov_info.video_stream['r_frame_rate'].split("/")
-        frame_rate = float(n) / float(d)
-        start_timecode = Timecode(round(frame_rate),str(start_timecode))
-        return str(start_timecode + (int(frame) - 1))
+        return offset_timecode(str(start_timecode), int(frame) - 1, mov_info.framerate())
 
-    if tail == "exr":
-        exr_file = os.path.join(dir_name,head+"."+frame_format%frame+"."+tail)
-        exr = _safe_open_exr(exr_file)
-        if exr is None:
-            return ""
-        try:
-            if "timeCode" in exr.header():
-                ti = exr.header()['timeCode']
-                return "%02d:%02d:%02d:%02d"%(ti.hours,ti.minutes,ti.seconds,ti.frame)
-        except Exception as e:
-            print(f"ERROR: Failed to read timecode from {exr_file}: {e}")
+    if tail not in ["exr", "dpx"]:
         return ""
-    elif tail == "dpx":
-        dpx_file = os.path.join(dir_name,head+"."+frame_format%frame+"."+tail)
-        dpx = _safe_open_dpx(dpx_file)
-        if dpx is None:
-            return ""
-        try:
-            return dpx.tv_header.time_code
-        except Exception as e:
-            print(f"ERROR: Failed to read timecode from {dpx_file}: {e}")
-            return ""
-    else:
+
+    header = FRAME_HEADER_CACHE.get(os.path.join(dir_name,head+"."+frame_format%frame+"."+tail))
+    if header is None:
         return ""
+    return header.timecode
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+ffprobe 결과 캐시
+
+MOV/MXF 컨테이너마다 ffmpeg.probe 를 한 번만 실행하도록
+(path, size, mtime) 키로 결과를 메모리에 보관합니다.
+ingest.ffprobe_persist 설정이 켜져 있으면 사용자 캐시 디렉토리의
+SQLite 파일에도 저장하여 세션 간에 재사용합니다.
+
+excel.MOV_INFO, validate.MOV_INFO, excel.get_time_code 가 같은 캐시를 사용합니다.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+
+import ffmpeg
+
+from .probe import get_config_value
+
+
+DEFAULT_PERSIST_FILE = os.path.join(os.path.expanduser("~"), ".cache", "iomanager", "ffprobe_cache.db")
+
+
+class FFProbeCache(object):
+    """
+    파일 단위 ffprobe 결과 캐시 (스레드 안전)
+
+    같은 파일을 여러 스레드가 동시에 요청해도 ffprobe 는 한 번만 실행됩니다.
+    """
+
+    def __init__(self, persist_file=None):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._persist_file = persist_file
+        self._conn = None
+        self._persist_loaded = False
+
+    def probe(self, path):
+        """
+        ffmpeg.probe 결과를 반환합니다.
+
+        Args:
+            path: MOV/MXF 파일 경로
+
+        Returns:
+            ffprobe 결과 dict
+
+        Raises:
+            ffmpeg.Error: ffprobe 실패 시 (캐시하지 않음)
+        """
+        st = os.stat(path)
+        key = (path, st.st_size, st.st_mtime_ns)
+
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            try:
+                with self._lock:
+                    if key in self._entries:
+                        return self._entries[key]
+
+                result = self._load_persisted(key)
+                if result is None:
+                    print(f"[DEBUG] ffprobe: {path}")
+                    result = ffmpeg.probe(path)
+                    self._save_persisted(key, result)
+
+                with self._lock:
+                    self._entries[key] = result
+            finally:
+                # ffprobe 가 실패해도 키별 잠금은 남기지 않음 (다음 요청이 다시 시도)
+                with self._lock:
+                    if self._key_locks.get(key) is key_lock:
+                        del self._key_locks[key]
+        return result
+
+    def video_stream(self, path):
+        """첫 번째 video stream 을 반환합니다. 없으면 None"""
+        probe = self.probe(path)
+        return next((stream for stream in probe['streams']
+                     if stream['codec_type'] == 'video'), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _persist_enabled(self):
+        if self._persist_file is None:
+            if not get_config_value('ingest.ffprobe_persist', False):
+                return False
+            self._persist_file = get_config_value('ingest.ffprobe_cache_file', DEFAULT_PERSIST_FILE)
+        return bool(self._persist_file)
+
+    def _connection(self):
+        if self._persist_loaded:
+            return self._conn
+        self._persist_loaded = True
+        if not self._persist_enabled():
+            return None
+        try:
+            cache_dir = os.path.dirname(self._persist_file)
+            if cache_dir and not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            self._conn = sqlite3.connect(self._persist_file, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS probes "
+                               "(path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, probe TEXT)")
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"WARNING: ffprobe cache persistence disabled: {e}")
+            self._conn = None
+        return self._conn
+
+    def _load_persisted(self, key):
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            path, size, mtime = key
+            try:
+                found = conn.execute("SELECT size, mtime, probe FROM probes WHERE path = ?", (path,)).fetchone()
+            except sqlite3.Error:
+                return None
+        if not found or found[0] != size or found[1] != mtime:
+            return None
+        return json.loads(found[2])
+
+    def _save_persisted(self, key, result):
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            path, size, mtime = key
+            try:
+                conn.execute("INSERT OR REPLACE INTO probes (path, size, mtime, probe) VALUES (?, ?, ?, ?)",
+                             (path, size, mtime, json.dumps(result)))
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"WARNING: Failed to persist ffprobe result for {path}: {e}")
+
+
+FFPROBE_CACHE = FFProbeCache()
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+EXR / DPX 헤더 파서
+
+OpenEXR / pydpx_meta 없이 프레임 앞부분만 mmap 으로 매핑하여
+메타데이터 스캔에 필요한 헤더 값을 직접 디코딩합니다.
+
+- EXR: 속성 테이블 (dataWindow, timeCode, framesPerSecond, 문자열 속성 등)
+- DPX: 파일 / 이미지 / 오리엔테이션 / 필름 / TV 헤더
+
+네트워크 스토리지에서도 헤더 페이지만 읽으므로 가볍습니다.
+파싱할 수 없는 파일은 HeaderError 를 발생시키며,
+호출하는 쪽(FrameHeaderCache)에서 기존 라이브러리로 fallback 합니다.
+"""
+
+import os
+import math
+import mmap
+import struct
+
+
+EXR_MAGIC = b'\x76\x2f\x31\x01'
+EXR_MULTIPART_FLAG = 0x1000
+EXR_HEADER_WINDOW = 16 * 1024
+EXR_HEADER_MAX = 4 * 1024 * 1024
+
+DPX_MAGIC_BE = b'SDPX'
+DPX_MAGIC_LE = b'XPDS'
+DPX_HEADER_SIZE = 2048
+DPX_UNDEFINED_U32 = 0xFFFFFFFF
+
+
+class HeaderError(Exception):
+    """헤더를 파싱할 수 없을 때 발생"""
+    pass
+
+
+class _NeedMore(Exception):
+    """매핑된 영역보다 헤더가 길 때 (내부용)"""
+    pass
+
+
+def _map_file(f, length):
+    """파일 앞부분 length 바이트만 읽기 전용으로 매핑"""
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        raise HeaderError("empty file")
+    return mmap.mmap(f.fileno(), min(size, length), access=mmap.ACCESS_READ), size
+
+
+# ---------------------------------------------------------------------------
+# EXR
+# ---------------------------------------------------------------------------
+
+def _decode_exr_timecode(time_and_flags):
+    """SMPTE 12M BCD timeAndFlags → (hours, minutes, seconds, frame, drop_frame)"""
+    def bcd(value, units_shift, tens_shift, tens_mask):
+        return ((value >> tens_shift) & tens_mask) * 10 + ((value >> units_shift) & 0xF)
+
+    frame = bcd(time_and_flags, 0, 4, 0x3)
+    drop_frame = bool(time_and_flags & (1 << 6))
+    seconds = bcd(time_and_flags, 8, 12, 0x7)
+    minutes = bcd(time_and_flags, 16, 20, 0x7)
+    hours = bcd(time_and_flags, 24, 28, 0x3)
+    return hours, minutes, seconds, frame, drop_frame
+
+
+def _decode_exr_attribute(type_name, data):
+    if type_name == "box2i":
+        return struct.unpack("<4i", data[:16])
+    if type_name == "box2f":
+        return struct.unpack("<4f", data[:16])
+    if type_name == "timecode":
+        time_and_flags, user_data = struct.unpack("<2I", data[:8])
+        return _decode_exr_timecode(time_and_flags)
+    if type_name == "rational":
+        return struct.unpack("<iI", data[:8])
+    if type_name == "string":
+        return data.decode("utf-8", "replace")
+    if type_name == "stringvector":
+        values = []
+        pos = 0
+        while pos + 4 <= len(data):
+            (length,) = struct.unpack_from("<i", data, pos)
+            pos += 4
+            values.append(data[pos:pos + length].decode("utf-8", "replace"))
+            pos += length
+        return values
+    if type_name == "int":
+        return struct.unpack("<i", data[:4])[0]
+    if type_name == "float":
+        return struct.unpack("<f", data[:4])[0]
+    if type_name == "double":
+        return struct.unpack("<d", data[:8])[0]
+    if type_name == "v2i":
+        return struct.unpack("<2i", data[:8])
+    if type_name == "v2f":
+        return struct.unpack("<2f", data[:8])
+    if type_name in ["compression", "lineOrder", "envmap", "deepImageState"]:
+        return data[0] if data else None
+    # chlist, preview, m33f 등 스캔에 필요 없는 타입은 원본 바이트 유지
+    return bytes(data)
+
+
+def _parse_exr_attributes(buf):
+    if buf[:4] != EXR_MAGIC:
+        raise HeaderError("not an OpenEXR file")
+    (version,) = struct.unpack_from("<I", buf, 4)
+
+    attributes = {}
+    pos = 8
+    limit = len(buf)
+    while True:
+        end = buf.find(b'\x00', pos)
+        if end < 0:
+            raise _NeedMore()
+        name = buf[pos:end].decode("latin-1")
+        pos = end + 1
+        if not name:
+            # 첫 번째 part 헤더의 끝 (multipart 는 첫 part 만 사용)
+            break
+        end = buf.find(b'\x00', pos)
+        if end < 0:
+            raise _NeedMore()
+        type_name = buf[pos:end].decode("latin-1")
+        pos = end + 1
+        if pos + 4 > limit:
+            raise _NeedMore()
+        (size,) = struct.unpack_from("<i", buf, pos)
+        pos += 4
+        if size < 0:
+            raise HeaderError("invalid attribute size for %s" % name)
+        if pos + size > limit:
+            raise _NeedMore()
+        attributes[name] = (type_name, _decode_exr_attribute(type_name, buf[pos:pos + size]))
+        pos += size
+
+    return version, attributes, pos
+
+
+def read_exr_header(path):
+    """
+    EXR 헤더 속성 테이블을 읽습니다.
+
+    Args:
+        path: EXR 파일 경로
+
+    Returns:
+        {속성 이름: (타입 이름, 값)} dict
+
+    Raises:
+        HeaderError: EXR 파일이 아니거나 헤더가 손상되었을 때
+        OSError: 파일을 열 수 없을 때
+    """
+    window = EXR_HEADER_WINDOW
+    with open(path, 'rb') as f:
+        while True:
+            mapped, size = _map_file(f, window)
+            try:
+                version, attributes, header_end = _parse_exr_attributes(mapped)
+                return attributes
+            except _NeedMore:
+                if window >= size or window >= EXR_HEADER_MAX:
+                    raise HeaderError("truncated header")
+                window *= 4
+            except (struct.error, IndexError) as e:
+                raise HeaderError(str(e))
+            finally:
+                mapped.close()
+
+
+def parse_exr_header(buf):
+    """
+    메모리에 올라온(또는 mmap 된) EXR 버퍼에서 헤더를 파싱합니다.
+
+    Args:
+        buf: 파일 앞부분을 담은 bytes / mmap
+
+    Returns:
+        (version, {속성 이름: (타입 이름, 값)}, 헤더 끝 오프셋)
+
+    Raises:
+        HeaderError: EXR 파일이 아니거나 헤더가 버퍼보다 길 때
+    """
+    try:
+        return _parse_exr_attributes(buf)
+    except _NeedMore:
+        raise HeaderError("truncated header")
+    except (struct.error, IndexError) as e:
+        raise HeaderError(str(e))
+
+
+def parse_exr_channels(data):
+    """
+    chlist 속성 바이트를 디코딩합니다.
+
+    Returns:
+        [(name, pixel_type, x_sampling, y_sampling), ...] (파일에 기록된 순서, 이름순)
+    """
+    channels = []
+    pos = 0
+    while pos < len(data):
+        end = data.find(b'\x00', pos)
+        if end <= pos:
+            break
+        name = data[pos:end].decode("latin-1")
+        pos = end + 1
+        pixel_type, p_linear, x_sampling, y_sampling = struct.unpack_from("<iB3xii", data, pos)
+        pos += 16
+        channels.append((name, pixel_type, x_sampling, y_sampling))
+    return channels
+
+
+def exr_attribute_text(type_name, value):
+    """클립 이름 검색용 속성 문자열"""
+    if type_name == "timecode":
+        return "%02d:%02d:%02d:%02d" % value[:4]
+    if isinstance(value, bytes):
+        return ""
+    return str(value)
+
+
+# ---------------------------------------------------------------------------
+# DPX
+# ---------------------------------------------------------------------------
+
+def _dpx_float(value):
+    if value is None or math.isnan(value) or math.isinf(value):
+        return None
+    return value
+
+
+def _dpx_u32(value):
+    if value == DPX_UNDEFINED_U32:
+        return 0
+    return value
+
+
+def _dpx_string(data):
+    return data.split(b'\x00', 1)[0].decode("latin-1").strip()
+
+
+def _decode_dpx_timecode(value):
+    """DPX TV 헤더 타임코드 (BCD 0xHHMMSSFF) → 'HH:MM:SS:FF'"""
+    if value == DPX_UNDEFINED_U32:
+        return ""
+    return "%02x:%02x:%02x:%02x" % ((value >> 24) & 0xFF, (value >> 16) & 0xFF,
+                                    (value >> 8) & 0xFF, value & 0xFF)
+
+
+def read_dpx_header(path):
+    """
+    DPX 헤더를 읽습니다.
+
+    Args:
+        path: DPX 파일 경로
+
+    Returns:
+        dict:
+            width, height      - 오리엔테이션 헤더의 원본 크기
+                                 (0 이면 이미지 헤더의 pixels/lines 사용)
+            timecode           - TV 헤더 타임코드 문자열
+            framerate          - TV 헤더 프레임레이트 (없으면 필름 헤더)
+            input_name, file_name, frame_id, slate_info
+
+    Raises:
+        HeaderError: DPX 파일이 아니거나 헤더가 손상되었을 때
+        OSError: 파일을 열 수 없을 때
+    """
+    with open(path, 'rb') as f:
+        mapped, size = _map_file(f, DPX_HEADER_SIZE)
+        try:
+            if len(mapped) < DPX_HEADER_SIZE:
+                raise HeaderError("truncated header")
+            magic = mapped[:4]
+            if magic == DPX_MAGIC_BE:
+                order = ">"
+            elif magic == DPX_MAGIC_LE:
+                order = "<"
+            else:
+                raise HeaderError("not a DPX file")
+
+            def u32(offset):
+                return struct.unpack_from(order + "I", mapped, offset)[0]
+
+            def f32(offset):
+                return struct.unpack_from(order + "f", mapped, offset)[0]
+
+            # 이미지 헤더 (768)
+            pixels_per_line = _dpx_u32(u32(772))
+            lines_per_element = _dpx_u32(u32(776))
+
+            # 오리엔테이션 헤더 (1408)
+            width = _dpx_u32(u32(1424))
+            height = _dpx_u32(u32(1428))
+            if width == 0 or height == 0:
+                width, height = pixels_per_line, lines_per_element
+
+            # 필름 헤더 (1664) / TV 헤더 (1920)
+            film_framerate = _dpx_float(f32(1724))
+            tv_framerate = _dpx_float(f32(1940))
+
+            return {
+                'width': width,
+                'height': height,
+                'timecode': _decode_dpx_timecode(u32(1920)),
+                'framerate': tv_framerate if tv_framerate else film_framerate,
+                'file_name': _dpx_string(mapped[1432:1532]),
+                'input_name': _dpx_string(mapped[1556:1588]),
+                'frame_id': _dpx_string(mapped[1732:1764]),
+                'slate_info': _dpx_string(mapped[1764:1864]),
+            }
+        except struct.error as e:
+            raise HeaderError(str(e))
+        finally:
+            mapped.close()
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+스캔 Ingest 워커
+
+excel.iter_excel() 을 백그라운드 스레드에서 실행하고,
+프로브가 끝난 행을 묶어서 GUI 스레드로 전달합니다.
+
+사용법:
+    thread = QtCore.QThread()
+    worker = IngestWorker(path)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    worker.rows_ready.connect(model.append_rows)
+    thread.start()
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Qt 호환성 레이어 사용
+from ..utils.qt_compat import QtCore, Signal
+from . import excel
+from .probe import get_config_value
+from .scan_index import INDEX_UPDATES
+from .thumbnail import THUMBNAIL_SERVICE
+
+
+class IngestWorker(QtCore.QObject):
+    """
+    스캔 폴더를 프로브하면서 행을 스트리밍하는 워커
+
+    첫 행은 즉시 보내고, 이후 행은 batch_interval 초 단위로 묶어서 보냅니다.
+    """
+
+    rows_ready = Signal(object)     # list of excel.SeqRow
+    progress = Signal(int, int)     # done, total
+    failed = Signal(str)
+    finished = Signal()
+
+    def __init__(self, path, batch_interval=0.2, parent=None):
+        QtCore.QObject.__init__(self, parent)
+        self.path = path
+        self.batch_interval = batch_interval
+        self._cancelled = False
+
+    def cancel(self):
+        """진행 중인 ingest 를 중단합니다 (다음 행에서 멈춤)"""
+        self._cancelled = True
+
+    def run(self):
+        buffer = []
+        last_emit = 0.0
+        rows = excel.iter_excel(self.path)
+        try:
+            for done, total, info in rows:
+                if self._cancelled:
+                    print("[PROGRESS] Ingest cancelled")
+                    break
+                buffer.append(info)
+                now = time.time()
+                if now - last_emit >= self.batch_interval:
+                    self.rows_ready.emit(buffer)
+                    buffer = []
+                    last_emit = now
+                self.progress.emit(done, total)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.failed.emit(str(e))
+        finally:
+            rows.close()
+            if buffer and not self._cancelled:
+                self.rows_ready.emit(buffer)
+            self.finished.emit()
+
+
+class ThumbnailNotifier(QtCore.QObject):
+    """
+    THUMBNAIL_SERVICE 의 완료 알림(워커 스레드)을 GUI 스레드 시그널로 전달
+    """
+
+    ready = Signal(str)
+
+    def __init__(self, parent=None):
+        QtCore.QObject.__init__(self, parent)
+        THUMBNAIL_SERVICE.add_listener(self.ready.emit)
+
+    def close(self):
+        THUMBNAIL_SERVICE.remove_listener(self.ready.emit)
+
+
+class LazyMetadataLoader(QtCore.QObject):
+    """
+    지연 컬럼(LAZY_KEYS)을 백그라운드에서 채우는 로더
+
+    SeqTableModel 이 행을 그리거나 체크할 때 request() 를 부르고,
+    계산이 끝나면 resolved(row, values) 를 GUI 스레드로 보냅니다.
+    같은 행은 한 번만 요청합니다.
+    """
+
+    resolved = Signal(object, object)   # excel.SeqRow, {column: value}
+
+    def __init__(self, workers=None, parent=None):
+        QtCore.QObject.__init__(self, parent)
+        if workers is None:
+            workers = get_config_value('ingest.probe_workers', 4)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)))
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def request(self, row):
+        """
+        행의 지연 컬럼 계산을 예약합니다.
+
+        Args:
+            row: excel.SeqRow
+        """
+        if not getattr(row, 'is_lazy', None) or not row.is_lazy():
+            return
+        with self._lock:
+            if id(row) in self._pending:
+                return
+            self._pending.add(id(row))
+        future = self._executor.submit(excel.resolve_lazy_row, row)
+        future.add_done_callback(lambda f, row=row: self._on_done(row, f))
+
+    def _on_done(self, row, future):
+        with self._lock:
+            self._pending.discard(id(row))
+            idle = not self._pending
+        if idle:
+            # 요청이 모두 끝나면 채운 값을 스캔 인덱스에 한 번에 씀
+            INDEX_UPDATES.flush()
+        try:
+            values = future.result()
+        except Exception as e:
+            print(f"[WARNING] Lazy metadata failed for {row.seq}: {e}")
+            return
+        self.resolved.emit(row, values)
+
+    def resolve(self, rows):
+        """
+        지연 행을 모두 계산할 때까지 기다립니다 (Validate/Publish/저장 직전).
+
+        Args:
+            rows: excel.SeqRow 목록
+
+        Returns:
+            [(row, {column: value})] — 적용은 호출한 쪽에서 합니다.
+        """
+        rows = [row for row in rows if getattr(row, 'is_lazy', None) and row.is_lazy()]
+        results = []
+        for row, values in zip(rows, self._executor.map(excel.resolve_lazy_row, rows)):
+            results.append((row, values))
+        INDEX_UPDATES.flush()
+        return results
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        INDEX_UPDATES.flush()
+
+
+class TimecodeRefresher(QtCore.QObject):
+    """
+    just_in / just_out 을 고쳤을 때 timecode_in / timecode_out 을 백그라운드에서 다시 계산
+
+    같은 (행, 컬럼) 요청은 마지막 것만 남기고, debounce 시간 동안 모은 요청을
+    한 번에 워커로 보냅니다. 결과는 ready([(row, column, timecode), ...]) 로 묶어서 보냅니다.
+    계산 중에 같은 셀이 다시 바뀌면 이전 결과는 버립니다.
+    """
+
+    ready = Signal(object)      # [(SeqRecord, column, timecode)]
+    _computed = Signal(object)
+
+    def __init__(self, debounce=150, workers=2, parent=None):
+        QtCore.QObject.__init__(self, parent)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)))
+        self._pending = {}
+        self._generation = {}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce)
+        self._timer.timeout.connect(self._flush)
+        self._computed.connect(self._on_computed)
+
+    def request(self, row, column, args):
+        """
+        Args:
+            row: 모델 행 (SeqRecord)
+            column: 다시 계산할 타임코드 컬럼 (MODEL_KEYS)
+            args: excel.get_time_code() 인자 (dir_name, head, frame_format, frame, tail)
+        """
+        key = (id(row), column)
+        self._generation[key] = self._generation.get(key, 0) + 1
+        self._pending[key] = (row, column, args, self._generation[key])
+        self._timer.start()
+
+    def _flush(self):
+        jobs = list(self._pending.values())
+        self._pending = {}
+        if jobs:
+            self._executor.submit(self._compute, jobs)
+
+    def _compute(self, jobs):
+        results = []
+        for row, column, args, generation in jobs:
+            try:
+                timecode = excel.get_time_code(*args)
+            except Exception as e:
+                print(f"[WARNING] Timecode refresh failed for {args}: {e}")
+                continue
+            results.append((row, column, timecode, generation))
+        self._computed.emit(results)
+
+    def _on_computed(self, results):
+        fresh = [(row, column, timecode) for row, column, timecode, generation in results
+                 if self._generation.get((id(row), column)) == generation]
+        if fresh:
+            self.ready.emit(fresh)
+
+    def close(self):
+        self._timer.stop()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+메타데이터 프로브 엔진
+
+시퀀스별 프로브(해상도, 프레임레이트, 타임코드, 썸네일)를
+스레드 풀에서 병렬로 실행합니다.
+프로브는 대부분 파일 I/O 대기이고, FrameHeaderCache / FFProbeCache 를 공유해야 하므로
+프로세스 풀은 사용하지 않습니다 (시퀀스 직렬화 비용만 늘고 캐시가 공유되지 않음).
+결과는 입력 순서대로 반환되며, 개별 시퀀스의 실패는
+전체 스캔을 중단하지 않고 failures 목록에 기록됩니다.
+"""
+
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+PROBE_MODES = ["thread", "serial"]
+
+
+def get_config_value(key, default=None):
+    """
+    AppConfig 에서 설정 값을 읽습니다.
+
+    설정이 로드되지 않은 경우(단독 스크립트 실행 등) 기본값을 반환합니다.
+
+    Args:
+        key: 점(.)으로 구분된 설정 키 (예: 'ingest.probe_workers')
+        default: 키가 없을 때 반환할 기본값
+
+    Returns:
+        설정 값
+    """
+    try:
+        from config.app_config import AppConfig
+        return AppConfig.get(key, default)
+    except Exception:
+        return default
+
+
+class ProbeFailure(object):
+    """프로브 실패 정보"""
+
+    def __init__(self, index, item, error, trace=""):
+        self.index = index
+        self.item = item
+        self.error = error
+        self.trace = trace
+
+    def __repr__(self):
+        return "<ProbeFailure #%d %s: %s>" % (self.index, self.item, self.error)
+
+
+class ProbeEngine(object):
+    """
+    시퀀스 프로브를 병렬로 실행하는 엔진
+
+    사용법:
+        engine = ProbeEngine()
+        rows = engine.map(_create_seq_row, sequences, lazy)
+        for failure in engine.failures:
+            print(failure)
+    """
+
+    def __init__(self, workers=None, mode=None):
+        """
+        Args:
+            workers: 워커 수 (None 이면 ingest.probe_workers 설정 또는 DEFAULT_WORKERS)
+            mode: "thread", "serial" (None 이면 ingest.probe_mode 설정)
+        """
+        if workers is None:
+            workers = get_config_value('ingest.probe_workers', DEFAULT_WORKERS)
+        if mode is None:
+            mode = get_config_value('ingest.probe_mode', "thread")
+        if mode not in PROBE_MODES:
+            print(f"WARNING: Unknown probe mode '{mode}', falling back to thread")
+            mode = "thread"
+
+        self.workers = max(1, int(workers))
+        self.mode = mode
+        self.failures = []
+
+    def _executor(self):
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def map(self, func, items, *args):
+        """
+        items 의 각 항목에 func(item, *args) 를 병렬로 적용합니다.
+
+        Args:
+            func: 프로브 함수
+            items: 프로브 대상 목록
+            *args: func 에 전달할 추가 인자
+
+        Returns:
+            입력 순서와 같은 결과 리스트 (실패한 항목은 None)
+        """
+        return list(self.imap(func, items, *args))
+
+    def imap(self, func, items, *args):
+        """
+        map() 의 스트리밍 버전
+
+        결과를 입력 순서대로 yield 하며, 앞쪽 항목이 끝나는 즉시 반환하므로
+        전체 프로브가 끝나기 전에 첫 행을 사용할 수 있습니다.
+        도중에 generator 를 닫으면 아직 시작하지 않은 작업은 취소됩니다.
+
+        Yields:
+            func 결과 (실패한 항목은 None)
+        """
+        items = list(items)
+        self.failures = []
+
+        if self.mode == "serial" or self.workers == 1 or len(items) <= 1:
+            for index, item in enumerate(items):
+                yield self._call(index, item, func, args)
+            return
+
+        executor = self._executor()
+        futures = []
+        try:
+            futures = [executor.submit(func, item, *args) for item in items]
+            for index, future in enumerate(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self._add_failure(index, items[index], e, traceback.format_exc())
+                    result = None
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _call(self, index, item, func, args):
+        try:
+            return func(item, *args)
+        except Exception as e:
+            self._add_failure(index, item, e, traceback.format_exc())
+            return None
+
+    def _add_failure(self, index, item, error, trace):
+        failure = ProbeFailure(index, item, error, trace)
+        self.failures.append(failure)
+        print(f"ERROR: Probe failed for {item}: {error}")
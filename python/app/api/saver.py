@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+scanlist 백그라운드 저장
+
+GUI 스레드에서 모델 스냅샷(excel.ScanlistSnapshot)을 만들어 넘기면
+QThread 의 SaveWorker 가 xlsx 와 상태 파일을 씁니다.
+저장 중에 다시 저장을 누르면 마지막 스냅샷만 남겨 두었다가 이어서 한 번 더 씁니다.
+
+사용법:
+    saver = ScanlistSaver()
+    saver.progress.connect(...)
+    saver.saved.connect(...)
+    saver.save(path, excel.ScanlistSnapshot.from_model(model))
+    saver.wait()        # 창을 닫을 때 (closeEvent)
+"""
+
+import threading
+
+# Qt 호환성 레이어 사용
+from ..utils.qt_compat import QtCore, Signal
+from . import excel
+
+
+class SaveWorker(QtCore.QObject):
+    """
+    ScanlistSaver 에 예약된 저장을 순서대로 실행하는 워커 (QThread 에서 실행)
+
+    예약된 저장이 없으면 finished 를 보내고 끝납니다.
+    """
+
+    progress = Signal(int, int)     # done, total
+    saved = Signal(str)             # scanlist_NN.xlsx
+    failed = Signal(str)
+    finished = Signal()
+
+    def __init__(self, saver):
+        QtCore.QObject.__init__(self)
+        self._saver = saver
+
+    def run(self):
+        try:
+            while True:
+                job = self._saver._next_job()
+                if job is None:
+                    return
+                path, snapshot = job
+
+                print(f"[PROGRESS] Saving scanlist ({len(snapshot)} rows) to {path}")
+                try:
+                    writer = excel.ExcelWriteModel(path)
+                    excel_file = writer.write_snapshot(snapshot, self.progress.emit)
+                except Exception as e:
+                    import traceback
+                    traceback.print_exc()
+                    self.failed.emit(str(e))
+                    continue
+                print(f"[PROGRESS] Saved scanlist {excel_file}")
+                self.saved.emit(excel_file)
+        finally:
+            self.finished.emit()
+
+
+class ScanlistSaver(QtCore.QObject):
+    """
+    scanlist 저장 관리자 (GUI 스레드)
+
+    저장은 한 번에 하나씩 순서대로 실행하며,
+    경로마다 아직 시작하지 않은 저장은 가장 최근 스냅샷 하나로 합칩니다.
+    """
+
+    progress = Signal(int, int)     # done, total
+    saved = Signal(str)             # scanlist_NN.xlsx
+    failed = Signal(str)
+
+    def __init__(self, parent=None):
+        QtCore.QObject.__init__(self, parent)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._running = False
+        self._threads = []      # [(QThread, SaveWorker)] — 워커가 GC 되지 않도록 함께 보관
+
+    @property
+    def busy(self):
+        with self._lock:
+            return self._running
+
+    def save(self, path, snapshot):
+        """
+        저장을 예약합니다.
+
+        Args:
+            path: scanlist 를 저장할 스캔 폴더
+            snapshot: excel.ScanlistSnapshot
+        """
+        with self._lock:
+            if path in self._pending:
+                print(f"[PROGRESS] Coalescing pending save for {path}")
+            self._pending[path] = snapshot
+            if self._running:
+                return
+            self._running = True
+        self._start_worker()
+
+    def _start_worker(self):
+        thread = QtCore.QThread(self)
+        worker = SaveWorker(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self.progress)
+        worker.saved.connect(self.saved)
+        worker.failed.connect(self.failed)
+        # wait() 가 GUI 스레드를 막고 있어도 스레드가 끝나도록 워커 스레드에서 바로 quit
+        worker.finished.connect(thread.quit, QtCore.Qt.DirectConnection)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(self._on_thread_finished)
+
+        self._threads.append((thread, worker))
+        thread.start()
+
+    def _on_thread_finished(self):
+        thread = self.sender()
+        self._threads = [item for item in self._threads if item[0] is not thread]
+        if thread is not None:
+            thread.deleteLater()
+
+    def _next_job(self):
+        """다음 저장 (path, snapshot) — 없으면 None 을 반환하고 실행 중 상태를 끝냄 (워커 스레드)"""
+        with self._lock:
+            if not self._pending:
+                self._running = False
+                return None
+            path = next(iter(self._pending))
+            return path, self._pending.pop(path)
+
+    def wait(self):
+        """진행 중인 저장과 예약된 저장이 모두 끝날 때까지 기다립니다 (창을 닫을 때)."""
+        for thread, _worker in list(self._threads):
+            thread.wait()
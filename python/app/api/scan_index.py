@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+스캔 메타데이터 인덱스
+
+스캔 폴더마다 SQLite 파일(.scan_index.db)을 두고
+디렉토리 목록과 시퀀스별 프로브 결과(해상도, 프레임레이트, 타임코드, 썸네일 경로)를
+저장합니다. 디렉토리 mtime 과 파일 stat 이 같으면 저장된 값을 재사용하므로
+다시 열 때는 새로 추가되었거나 바뀐 시퀀스만 프로브합니다.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+
+
+INDEX_FILE_NAME = ".scan_index.db"
+INDEX_VERSION = 1
+
+
+def stat_signature(paths):
+    """
+    파일 목록의 stat(size, mtime) 으로 변경 감지용 시그니처를 만듭니다.
+
+    Args:
+        paths: 파일 경로 목록
+
+    Returns:
+        시그니처 문자열 또는 None (파일이 없을 때)
+    """
+    parts = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        parts.append("%s:%d:%d" % (os.path.basename(path), st.st_size, st.st_mtime_ns))
+    return "|".join(parts)
+
+
+class ScanIndex(object):
+    """
+    스캔 폴더 단위의 영구 메타데이터 인덱스
+
+    사용법:
+        index = ScanIndex(path)
+        scan = scan_directory(path, list_dir=index.list_dir)
+        row = index.get_row(key, signature)
+        index.put_rows([(key, signature, row), ...])
+        index.close()
+
+    인덱스 파일을 만들 수 없는 경우(읽기 전용 스토리지 등)에는
+    캐시 없이 동작합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.db_file = os.path.join(path, INDEX_FILE_NAME)
+        self._conn = None
+        try:
+            self._conn = sqlite3.connect(self.db_file)
+            self._create_tables()
+        except sqlite3.Error as e:
+            print(f"WARNING: Scan index disabled for {path}: {e}")
+            self._conn = None
+
+    @property
+    def enabled(self):
+        return self._conn is not None
+
+    def _create_tables(self):
+        cur = self._conn.cursor()
+        cur.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        cur.execute("SELECT value FROM meta WHERE key = 'version'")
+        found = cur.fetchone()
+        if found and int(found[0]) != INDEX_VERSION:
+            # 포맷이 바뀌면 기존 인덱스는 버림
+            cur.execute("DROP TABLE IF EXISTS dirs")
+            cur.execute("DROP TABLE IF EXISTS rows")
+        cur.execute("CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, mtime INTEGER, entries TEXT)")
+        cur.execute("CREATE TABLE IF NOT EXISTS rows (key TEXT PRIMARY KEY, signature TEXT, row TEXT)")
+        cur.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(INDEX_VERSION),))
+        self._conn.commit()
+
+    def list_dir(self, dirname):
+        """
+        디렉토리 항목을 [(name, is_dir), ...] 로 반환합니다.
+
+        디렉토리 mtime 이 저장된 값과 같으면 readdir 없이 인덱스에서 반환합니다.
+        """
+        try:
+            mtime = os.stat(dirname).st_mtime_ns
+        except OSError:
+            return []
+
+        if self.enabled:
+            cur = self._conn.execute("SELECT mtime, entries FROM dirs WHERE path = ?", (dirname,))
+            found = cur.fetchone()
+            if found and found[0] == mtime:
+                return [tuple(entry) for entry in json.loads(found[1])]
+
+        entries = []
+        with os.scandir(dirname) as it:
+            for entry in it:
+                try:
+                    entries.append((entry.name, entry.is_dir()))
+                except OSError:
+                    continue
+        entries.sort()
+
+        if self.enabled:
+            self._conn.execute("INSERT OR REPLACE INTO dirs (path, mtime, entries) VALUES (?, ?, ?)",
+                               (dirname, mtime, json.dumps(entries)))
+        return entries
+
+    def get_row(self, key, signature):
+        """시그니처가 같을 때만 저장된 행을 반환합니다. 없으면 None"""
+        if not self.enabled or signature is None:
+            return None
+        cur = self._conn.execute("SELECT signature, row FROM rows WHERE key = ?", (key,))
+        found = cur.fetchone()
+        if not found or found[0] != signature:
+            return None
+        return json.loads(found[1])
+
+    def put_rows(self, items):
+        """
+        프로브 결과를 저장합니다.
+
+        Args:
+            items: [(key, signature, row), ...]
+        """
+        if not self.enabled:
+            return
+        records = [(key, signature, json.dumps(row, default=str))
+                   for key, signature, row in items if signature is not None]
+        self._conn.executemany("INSERT OR REPLACE INTO rows (key, signature, row) VALUES (?, ?, ?)", records)
+
+    def update_rows(self, items):
+        """
+        지연 컬럼(LAZY_KEYS)을 나중에 계산한 값을 저장된 행에 채웁니다.
+
+        Args:
+            items: [(key, signature, {컬럼 인덱스: 값}), ...] — 시그니처가 다르면 건너뜀
+        """
+        if not self.enabled:
+            return
+        for key, signature, values in items:
+            cur = self._conn.execute("SELECT signature, row FROM rows WHERE key = ?", (key,))
+            found = cur.fetchone()
+            if not found or found[0] != signature:
+                continue
+            row = json.loads(found[1])
+            for col, value in values.items():
+                row[col] = value
+            self._conn.execute("UPDATE rows SET row = ? WHERE key = ?", (json.dumps(row, default=str), key))
+
+    def commit(self):
+        """지금까지 쓴 내용을 저장합니다 (다른 연결이 기다리지 않도록 스캔 직후 호출)."""
+        if not self.enabled:
+            return
+        try:
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"WARNING: Failed to write scan index {self.db_file}: {e}")
+
+    def close(self):
+        if not self.enabled:
+            return
+        try:
+            self._conn.commit()
+            self._conn.close()
+        except sqlite3.Error as e:
+            print(f"WARNING: Failed to write scan index {self.db_file}: {e}")
+        self._conn = None
+
+
+class IndexUpdateQueue(object):
+    """
+    지연 컬럼 값을 스캔 폴더별로 모았다가 인덱스에 한 번에 씁니다.
+
+    excel.resolve_lazy_row() 는 LazyMetadataLoader / ScanlistSaver 워커 스레드에서 실행되므로
+    행마다 SQLite 를 열지 않고 여기에 넣어 두고, 로더가 한가해지거나 저장이 끝날 때 flush() 합니다.
+
+    사용법:
+        INDEX_UPDATES.add((path, key, signature), {col: value})
+        INDEX_UPDATES.flush()
+    """
+
+    def __init__(self, flush_size=256):
+        self.flush_size = flush_size
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def add(self, entry, values):
+        """
+        Args:
+            entry: (스캔 폴더, key, signature)
+            values: {컬럼 인덱스: 값}
+        """
+        path, key, signature = entry
+        with self._lock:
+            items = self._items.setdefault(path, [])
+            items.append((key, signature, values))
+            full = len(items) >= self.flush_size
+        if full:
+            self.flush(path)
+
+    def flush(self, path=None):
+        """모아 둔 값을 인덱스에 씁니다 (path 가 None 이면 모든 폴더)."""
+        with self._lock:
+            if path is None:
+                pending, self._items = self._items, {}
+            else:
+                pending = {path: self._items.pop(path, [])}
+        for path, items in pending.items():
+            if not items:
+                continue
+            index = ScanIndex(path)
+            try:
+                index.update_rows(items)
+            except sqlite3.Error as e:
+                print(f"WARNING: Failed to update scan index {index.db_file}: {e}")
+            finally:
+                index.close()
+
+
+INDEX_UPDATES = IndexUpdateQueue()
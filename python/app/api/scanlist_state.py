@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+scanlist 상태 파일 (.state)
+
+scanlist_NN.xlsx 를 저장할 때 같은 이름의 scanlist_NN.state 에
+모델 상태를 컬럼 단위로 저장합니다.
+- check 컬럼은 비트셋
+- thumbnail 컬럼은 디렉토리 목록 + (디렉토리 번호, 파일 이름)
+- 나머지 MODEL_KEYS 컬럼은 값 목록 (int/float/str 타입 유지)
+
+다시 열 때는 상태 파일을 먼저 읽고, 없거나 xlsx 가 그 뒤에 수정되었으면
+(사람이 엑셀을 편집한 경우) xlsx 를 읽습니다. xlsx 는 사람이 보는 출력물입니다.
+
+msgpack 이 설치되어 있으면 msgpack, 없으면 JSON 으로 직렬화하고 zlib 으로 압축합니다.
+"""
+
+import os
+import zlib
+import json
+
+from .constant import MODEL_KEYS
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+STATE_SUFFIX = ".state"
+STATE_MAGIC = b"SCANSTATE"
+STATE_VERSION = 1
+
+
+def get_state_file(excel_file):
+    """scanlist_NN.xlsx → scanlist_NN.state"""
+    return os.path.splitext(excel_file)[0] + STATE_SUFFIX
+
+
+def _pack_bits(flags):
+    data = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            data[i >> 3] |= 1 << (i & 7)
+    return bytes(data)
+
+
+def _unpack_bits(data, count):
+    return [bool(data[i >> 3] & (1 << (i & 7))) for i in range(count)]
+
+
+def _encode(payload):
+    if msgpack is not None:
+        return b"m" + zlib.compress(msgpack.packb(payload, use_bin_type=True), 1)
+    payload = dict(payload, check=payload['check'].hex())
+    return b"j" + zlib.compress(json.dumps(payload).encode('utf-8'), 1)
+
+
+def _decode(codec, data):
+    data = zlib.decompress(data)
+    if codec == b"m":
+        if msgpack is None:
+            raise ValueError("msgpack is not installed")
+        return msgpack.unpackb(data, raw=False)
+    if codec == b"j":
+        payload = json.loads(data.decode('utf-8'))
+        payload['check'] = bytes.fromhex(payload['check'])
+        return payload
+    raise ValueError("unknown state codec %r" % codec)
+
+
+def write_state(excel_file, rows, checks):
+    """
+    모델 상태를 excel_file 옆의 상태 파일로 저장합니다.
+
+    xlsx 를 닫은 뒤에 호출해야 합니다 (xlsx stat 을 함께 기록).
+
+    Args:
+        excel_file: 방금 저장한 scanlist_NN.xlsx 경로
+        rows: 모델 행 목록 (check/thumbnail 외 컬럼은 그대로 저장)
+        checks: 행마다 체크 여부 (bool)
+
+    Returns:
+        상태 파일 경로 또는 None (저장 실패 시)
+    """
+    keys = list(MODEL_KEYS.keys())
+    thumbnail_col = MODEL_KEYS['thumbnail']
+    thumbnail_dirs = []
+    dir_index = {}
+    thumbnail_index = []
+    thumbnail_names = []
+    for row in rows:
+        dirname, name = os.path.split(row[thumbnail_col] or "")
+        if dirname not in dir_index:
+            dir_index[dirname] = len(thumbnail_dirs)
+            thumbnail_dirs.append(dirname)
+        thumbnail_index.append(dir_index[dirname])
+        thumbnail_names.append(name)
+
+    columns = {}
+    for key in keys:
+        col = MODEL_KEYS[key]
+        if col in (MODEL_KEYS['check'], thumbnail_col):
+            continue
+        columns[key] = [row[col] if col < len(row) else None for row in rows]
+
+    state_file = get_state_file(excel_file)
+    try:
+        st = os.stat(excel_file)
+        payload = {
+            'version': STATE_VERSION,
+            'keys': keys,
+            'excel': [st.st_size, st.st_mtime_ns],
+            'rows': len(rows),
+            'check': _pack_bits(checks),
+            'thumbnail_dirs': thumbnail_dirs,
+            'thumbnail_index': thumbnail_index,
+            'thumbnail_names': thumbnail_names,
+            'columns': columns,
+        }
+        temp_file = state_file + ".tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(STATE_MAGIC)
+            f.write(_encode(payload))
+        os.replace(temp_file, state_file)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"WARNING: Failed to write scanlist state {state_file}: {e}")
+        return None
+    return state_file
+
+
+def read_state(excel_file):
+    """
+    excel_file 의 상태 파일을 읽습니다.
+
+    Args:
+        excel_file: scanlist_NN.xlsx 경로
+
+    Returns:
+        [[check(bool), thumbnail_file, ...]] 또는 None
+        (상태 파일이 없거나, 형식이 다르거나, xlsx 가 그 뒤에 수정된 경우)
+    """
+    state_file = get_state_file(excel_file)
+    try:
+        with open(state_file, 'rb') as f:
+            data = f.read()
+        st = os.stat(excel_file)
+    except OSError:
+        return None
+
+    try:
+        if not data.startswith(STATE_MAGIC):
+            raise ValueError("not a scanlist state file")
+        offset = len(STATE_MAGIC)
+        payload = _decode(data[offset:offset + 1], data[offset + 1:])
+        if payload['version'] != STATE_VERSION or payload['keys'] != list(MODEL_KEYS.keys()):
+            print(f"[PROGRESS] Scanlist state format changed, reading xlsx: {state_file}")
+            return None
+        if list(payload['excel']) != [st.st_size, st.st_mtime_ns]:
+            print(f"[PROGRESS] Scanlist edited after save, reading xlsx: {excel_file}")
+            return None
+
+        count = payload['rows']
+        checks = _unpack_bits(payload['check'], count)
+        thumbnail_dirs = payload['thumbnail_dirs']
+        thumbnails = [os.path.join(thumbnail_dirs[i], name) if name else ""
+                      for i, name in zip(payload['thumbnail_index'], payload['thumbnail_names'])]
+        columns = payload['columns']
+    except (KeyError, IndexError, TypeError, ValueError, zlib.error) as e:
+        print(f"WARNING: Failed to read scanlist state {state_file}: {e}")
+        return None
+
+    rows = []
+    for i in range(count):
+        row = [None] * len(MODEL_KEYS)
+        row[MODEL_KEYS['check']] = checks[i]
+        row[MODEL_KEYS['thumbnail']] = thumbnails[i]
+        for key, values in columns.items():
+            row[MODEL_KEYS[key]] = values[i]
+        rows.append(row)
+    return rows
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+"""
+썸네일 생성 서비스
+
+EXR/DPX 첫 프레임의 썸네일(.thumbnail/*.jpg)을 백그라운드 워커 풀에서 만듭니다.
+
+- 이미 있는 썸네일이 원본보다 새로우면 건너뜁니다.
+- 먼저 프로세스 내부 디코더(thumbnail_decoder)로 변환하고,
+  지원하지 않는 압축/포맷만 oiiotool 로 변환합니다.
+- oiiotool 은 요청을 묶어서 한 번 실행으로 여러 장을 변환합니다
+  (rez-env 환경 resolve 비용을 배치당 한 번으로 줄임).
+- MOV/MXF 는 프레임마다 입력 seek(-ss 를 -i 앞에)으로 해당 위치만 디코딩하며,
+  몇 장씩 묶은 ffmpeg 실행을 워커 풀에서 동시에 돌립니다.
+- request() / request_frames() 는 바로 반환되므로 ingest 는 썸네일을 기다리지 않습니다.
+  완료 알림이 필요하면 add_listener() 로 콜백을 등록합니다.
+"""
+
+import os
+import shutil
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from .probe import get_config_value
+
+
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_MOV_BATCH_SIZE = 8
+DEFAULT_SIZE = (960, 540)
+TIMEOUT_PER_IMAGE = 30
+
+
+def is_up_to_date(source, target):
+    """target 이 있고 source 보다 새로우면 True"""
+    try:
+        return os.stat(target).st_mtime >= os.stat(source).st_mtime
+    except OSError:
+        return False
+
+
+def _use_rez():
+    try:
+        from python.app import AppInstance
+        app_config = AppInstance.get_config()
+        return app_config.get('rez.enabled', True) if app_config else True
+    except Exception:
+        # AppInstance를 사용할 수 없으면 환경변수로 판단
+        return os.environ.get('USE_REZ', '1') == '1'
+
+
+def oiiotool_command():
+    """
+    oiiotool 실행 명령 (Rez 사용 여부에 따라 구성)
+
+    Returns:
+        명령 리스트 또는 None (oiiotool 을 찾을 수 없을 때)
+    """
+    if _use_rez():
+        # Rez 환경에서 oiio 패키지 로드
+        return ['rez-env', 'oiio', '--', 'oiiotool']
+    # 로컬 시스템의 oiiotool 직접 사용
+    if not shutil.which('oiiotool'):
+        return None
+    return ['oiiotool']
+
+
+def ffmpeg_command():
+    """
+    ffmpeg 실행 명령 (Rez 사용 여부에 따라 구성)
+
+    Returns:
+        명령 리스트 또는 None (ffmpeg 을 찾을 수 없을 때)
+    """
+    if _use_rez():
+        return ['rez-env', 'ffmpeg', '--', 'ffmpeg']
+    if not shutil.which('ffmpeg'):
+        return None
+    return ['ffmpeg']
+
+
+def seek_time(frame, framerate):
+    """
+    0 부터 시작하는 frame 번호를 입력 seek 위치(초)로 변환합니다.
+
+    반 프레임 앞을 가리키므로 정확한 seek 후 첫 번째로 나오는 프레임이 frame 입니다.
+    """
+    if frame <= 0:
+        return 0.0
+    return (frame - 0.5) / float(framerate)
+
+
+class ThumbnailService(object):
+    """
+    썸네일 생성 워커 풀
+
+    사용법:
+        THUMBNAIL_SERVICE.request(original_file, thumbnail_file)
+        THUMBNAIL_SERVICE.add_listener(lambda thumbnail_file: ...)
+    """
+
+    def __init__(self, workers=None, batch_size=None):
+        self._workers = workers
+        self._batch_size = batch_size
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = []
+        self._queued = set()
+        self._listeners = []
+        self._created_dirs = set()
+        self._warned = set()
+        self._decoder = None
+
+    @property
+    def workers(self):
+        if self._workers is None:
+            self._workers = int(get_config_value('thumbnail.workers', DEFAULT_WORKERS))
+        return max(1, self._workers)
+
+    @property
+    def batch_size(self):
+        if self._batch_size is None:
+            self._batch_size = int(get_config_value('thumbnail.batch_size', DEFAULT_BATCH_SIZE))
+        return max(1, self._batch_size)
+
+    @property
+    def mov_batch_size(self):
+        return max(1, int(get_config_value('thumbnail.mov_batch_size', DEFAULT_MOV_BATCH_SIZE)))
+
+    @property
+    def size(self):
+        return (get_config_value('thumbnail.width', DEFAULT_SIZE[0]),
+                get_config_value('thumbnail.height', DEFAULT_SIZE[1]))
+
+    @property
+    def quality(self):
+        return get_config_value('thumbnail.quality', 90)
+
+    def _get_decoder(self):
+        """thumbnail_decoder 모듈 (NumPy/PIL 이 없거나 꺼져 있으면 None)"""
+        if self._decoder is None:
+            self._decoder = False
+            if get_config_value('thumbnail.fast_decode', True):
+                try:
+                    from . import thumbnail_decoder
+                    self._decoder = thumbnail_decoder
+                except ImportError as e:
+                    print(f"WARNING: In-process thumbnail decoder disabled: {e}")
+        return self._decoder or None
+
+    def add_listener(self, callback):
+        """썸네일이 만들어질 때마다 callback(thumbnail_file) 호출 (워커 스레드에서 호출됨)"""
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def request(self, source, target):
+        """
+        썸네일 생성을 요청합니다. 바로 반환됩니다.
+
+        Args:
+            source: 원본 프레임 경로
+            target: 썸네일 jpg 경로
+
+        Returns:
+            True 이면 새로 생성 예약, False 이면 이미 최신이거나 예약되어 있음
+        """
+        if is_up_to_date(source, target):
+            return False
+
+        self._make_dir(target)
+
+        with self._lock:
+            if target in self._queued:
+                return False
+            self._queued.add(target)
+            self._pending.append((source, target))
+            if len(self._pending) >= self.batch_size:
+                self._submit_locked()
+        return True
+
+    def request_frames(self, source, frames, framerate):
+        """
+        MOV/MXF 의 프레임 썸네일 생성을 요청합니다. 바로 반환됩니다.
+
+        Args:
+            source: MOV/MXF 파일 경로
+            frames: [(frame, target), ...] frame 은 0 부터 시작하는 프레임 번호
+            framerate: 초당 프레임 수 (seek 위치 계산용)
+
+        Returns:
+            새로 생성 예약한 썸네일 수
+        """
+        jobs = []
+        for frame, target in frames:
+            if is_up_to_date(source, target):
+                continue
+            self._make_dir(target)
+            jobs.append((frame, target))
+
+        batch_size = self.mov_batch_size
+        with self._lock:
+            jobs = [job for job in jobs if job[1] not in self._queued]
+            self._queued.update(target for frame, target in jobs)
+            executor = self._get_executor_locked()
+            for i in range(0, len(jobs), batch_size):
+                executor.submit(self._run_mov_batch, source, jobs[i:i + batch_size], framerate)
+        return len(jobs)
+
+    def _make_dir(self, target):
+        thumbnail_path = os.path.dirname(target)
+        if thumbnail_path not in self._created_dirs:
+            os.makedirs(thumbnail_path, exist_ok=True)
+            self._created_dirs.add(thumbnail_path)
+
+    def flush(self):
+        """모아둔 요청을 배치 크기와 관계없이 워커로 보냅니다."""
+        with self._lock:
+            self._submit_locked()
+
+    def _get_executor_locked(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix="thumbnail")
+        return self._executor
+
+    def _submit_locked(self):
+        if not self._pending:
+            return
+        batch = self._pending
+        self._pending = []
+        self._get_executor_locked().submit(self._run_batch, batch)
+
+    def wait(self):
+        """남은 요청을 모두 처리할 때까지 기다립니다."""
+        self.flush()
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _run_batch(self, batch):
+        try:
+            done = self.convert(batch)
+        except Exception as e:
+            print(f"ERROR: Failed to generate thumbnails: {e}")
+            done = []
+        self._finish([target for source, target in batch], done)
+
+    def _run_mov_batch(self, source, batch, framerate):
+        try:
+            done = self.extract_frames(source, batch, framerate)
+        except Exception as e:
+            print(f"ERROR: Failed to extract thumbnails from {source}: {e}")
+            done = []
+        self._finish([target for frame, target in batch], done)
+
+    def _finish(self, targets, done):
+        with self._lock:
+            for target in targets:
+                self._queued.discard(target)
+            listeners = list(self._listeners)
+        for target in done:
+            for callback in listeners:
+                try:
+                    callback(target)
+                except Exception as e:
+                    print(f"ERROR: Thumbnail listener failed: {e}")
+
+    def convert(self, batch):
+        """
+        [(source, target), ...] 를 변환하고 성공한 target 목록을 반환합니다.
+
+        프로세스 내부 디코더로 먼저 변환하고, 디코딩할 수 없는 파일만 모아서
+        oiiotool 한 번으로 실행합니다. oiiotool 이 실패하면 어떤 파일이 문제인지
+        알 수 있도록 한 장씩 다시 실행합니다.
+        """
+        done, batch = self._convert_in_process(batch)
+        if not batch:
+            return done
+
+        command = oiiotool_command()
+        if command is None:
+            if 'oiiotool' not in self._warned:
+                self._warned.add('oiiotool')
+                print("WARNING: oiiotool not found, skipping thumbnail generation")
+                print("         Install OpenImageIO: brew install openimageio (macOS)")
+                print("                             : sudo apt-get install openimageio-tools (Linux)")
+            return done
+
+        if self._run_oiiotool(command, batch) or len(batch) == 1:
+            return done + [target for source, target in batch if os.path.exists(target)]
+
+        for job in batch:
+            if self._run_oiiotool(command, [job]):
+                done.append(job[1])
+        return done
+
+    def _convert_in_process(self, batch):
+        """
+        thumbnail_decoder 로 변환합니다.
+
+        Returns:
+            (성공한 target 목록, oiiotool 로 넘길 [(source, target), ...])
+        """
+        decoder = self._get_decoder()
+        if decoder is None:
+            return [], batch
+
+        size = self.size
+        quality = self.quality
+        done = []
+        fallback = []
+        for source, target in batch:
+            try:
+                decoder.write_thumbnail(source, target, size, quality)
+                done.append(target)
+            except decoder.DecodeError as e:
+                print(f"Thumbnail fast path skipped for {os.path.basename(source)}: {e}")
+                fallback.append((source, target))
+            except Exception as e:
+                print(f"ERROR: Thumbnail decode failed for {source}: {e}")
+                fallback.append((source, target))
+        return done, fallback
+
+    def extract_frames(self, source, batch, framerate):
+        """
+        MOV/MXF 에서 [(frame, target), ...] 프레임을 추출하고 성공한 target 목록을 반환합니다.
+
+        입력마다 -ss 를 -i 앞에 두어 가까운 키프레임부터만 디코딩합니다.
+        배치 실행이 실패하면 한 장씩 다시 실행합니다.
+        """
+        command = ffmpeg_command()
+        if command is None:
+            if 'ffmpeg' not in self._warned:
+                self._warned.add('ffmpeg')
+                print("WARNING: ffmpeg not found, skipping MOV thumbnail generation")
+            return []
+
+        if self._run_ffmpeg(command, source, batch, framerate) or len(batch) == 1:
+            return [target for frame, target in batch if os.path.exists(target)]
+
+        done = []
+        for job in batch:
+            if self._run_ffmpeg(command, source, [job], framerate):
+                done.append(job[1])
+        return done
+
+    def _run_ffmpeg(self, command, source, batch, framerate):
+        width, height = self.size
+        command = list(command) + ["-y", "-loglevel", "error"]
+        for frame, target in batch:
+            command.extend(["-ss", "%.6f" % seek_time(frame, framerate), "-i", source])
+        for i, (frame, target) in enumerate(batch):
+            command.extend(["-map", "%d:v:0" % i, "-frames:v", "1"])
+            command.extend(["-s", "%dx%d" % (width, height)])
+            command.append(target)
+
+        print(f"Extracting {len(batch)} thumbnail(s) from {os.path.basename(source)}")
+        try:
+            result = subprocess.run(command, capture_output=True, text=True,
+                                    timeout=TIMEOUT_PER_IMAGE * len(batch))
+        except subprocess.TimeoutExpired:
+            print(f"ERROR: ffmpeg timeout for {len(batch)} frame(s) of {source}")
+            return False
+        except Exception as e:
+            print(f"ERROR: Failed to extract thumbnail: {e}")
+            return False
+
+        if result.returncode != 0:
+            print(f"ERROR: ffmpeg failed with return code {result.returncode}")
+            if result.stderr:
+                print(f"       {result.stderr}")
+            return False
+        return True
+
+    def _run_oiiotool(self, command, batch):
+        width, height = self.size
+        command = list(command)
+        for source, target in batch:
+            command.append(source)
+            command.extend(["--colorconvert", "linear", "sRGB"])
+            command.extend(["--resize", "%dx%d" % (width, height)])
+            command.extend(["-o", target])
+            command.append("--pop")
+
+        print(f"Generating {len(batch)} thumbnail(s): {' '.join(command[:8])} ...")
+        try:
+            result = subprocess.run(command, capture_output=True, text=True,
+                                    timeout=TIMEOUT_PER_IMAGE * len(batch))
+        except subprocess.TimeoutExpired:
+            print(f"ERROR: oiiotool timeout for {len(batch)} file(s)")
+            return False
+        except Exception as e:
+            print(f"ERROR: Failed to generate thumbnail: {e}")
+            return False
+
+        if result.returncode != 0:
+            print(f"ERROR: oiiotool failed with return code {result.returncode}")
+            if result.stderr:
+                print(f"       {result.stderr}")
+            return False
+        return True
+
+
+THUMBNAIL_SERVICE = ThumbnailService()
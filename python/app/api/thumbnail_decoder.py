@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 내부 썸네일 디코더
+
+oiiotool 프로세스를 띄우지 않고 EXR/DPX 첫 프레임에서
+썸네일 크기에 필요한 스캔라인만 골라 읽은 뒤
+NumPy 로 색 변환(linear → sRGB, log → display)을 하고 PIL 로 JPEG 를 씁니다.
+
+지원 범위:
+- EXR: 단일 part scanline 파일, NONE / ZIPS / ZIP 압축, HALF / FLOAT / UINT 채널
+- DPX: 비압축 8 / 10 / 12 / 16 bit (10, 12 bit 는 filled 패킹), RGB / RGBA / Luma
+
+그 외(PIZ/DWAA 등 압축, tiled/multipart/deep EXR, packed DPX)는 DecodeError 를
+발생시키며 ThumbnailService 가 oiiotool 로 fallback 합니다.
+"""
+
+import os
+import mmap
+import zlib
+import struct
+
+import numpy as np
+from PIL import Image
+
+from .header_reader import (EXR_MAGIC, EXR_MULTIPART_FLAG, DPX_MAGIC_BE, DPX_MAGIC_LE,
+                            DPX_UNDEFINED_U32, HeaderError, parse_exr_header, parse_exr_channels)
+
+
+EXR_TILED_FLAG = 0x200
+EXR_NON_IMAGE_FLAG = 0x800
+
+# compression → 청크당 스캔라인 수 (지원하는 압축만)
+EXR_LINES_PER_CHUNK = {
+    0: 1,       # NO_COMPRESSION
+    2: 1,       # ZIPS_COMPRESSION
+    3: 16,      # ZIP_COMPRESSION
+}
+EXR_PIXEL_DTYPES = {
+    0: np.dtype('<u4'),     # UINT
+    1: np.dtype('<f2'),     # HALF
+    2: np.dtype('<f4'),     # FLOAT
+}
+
+# DPX descriptor → 채널 수
+DPX_DESCRIPTORS = {
+    6: 1,       # Luma
+    50: 3,      # RGB
+    51: 4,      # RGBA
+}
+DPX_TRANSFER_LINEAR = 2
+DPX_TRANSFER_LOG = [1, 3]   # printing density, logarithmic
+
+# Cineon log → linear (ref white 685, ref black 95, density 0.002 / gamma 0.6)
+CINEON_WHITE = 685.0
+CINEON_BLACK = 95.0
+CINEON_SCALE = 0.002 / 0.6
+
+
+class DecodeError(Exception):
+    """빠른 경로로 디코딩할 수 없는 파일 (oiiotool 로 fallback)"""
+    pass
+
+
+# ---------------------------------------------------------------------------
+# 색 변환
+# ---------------------------------------------------------------------------
+
+def linear_to_srgb(values):
+    """linear → sRGB (0~1 로 클램프)"""
+    values = np.clip(values, 0.0, 1.0)
+    return np.where(values <= 0.0031308,
+                    values * 12.92,
+                    1.055 * np.power(values, 1.0 / 2.4) - 0.055)
+
+
+def cineon_to_linear(codes):
+    """10 bit Cineon 코드값 → linear"""
+    black = np.power(10.0, (CINEON_BLACK - CINEON_WHITE) * CINEON_SCALE)
+    linear = np.power(10.0, (codes - CINEON_WHITE) * CINEON_SCALE)
+    return (linear - black) / (1.0 - black)
+
+
+def _to_uint8(values):
+    return (np.clip(values, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+
+def _to_rgb(pixels):
+    """(h, w, c) → (h, w, 3). Luma 는 복제, 알파는 버림"""
+    if pixels.shape[2] == 1:
+        return np.repeat(pixels, 3, axis=2)
+    return pixels[:, :, :3]
+
+
+# ---------------------------------------------------------------------------
+# EXR
+# ---------------------------------------------------------------------------
+
+def _exr_unzip(data, expected):
+    """ZIP/ZIPS 청크 → 원본 바이트 (predictor, 바이트 인터리브 복원)"""
+    try:
+        raw = zlib.decompress(data)
+    except zlib.error as e:
+        raise DecodeError("zip: %s" % e)
+    if len(raw) != expected:
+        raise DecodeError("zip: unexpected size %d (expected %d)" % (len(raw), expected))
+
+    t = np.frombuffer(raw, dtype=np.uint8).copy()
+    t[1:] -= 128
+    t = np.cumsum(t, dtype=np.uint8)
+    half = (len(t) + 1) // 2
+    out = np.empty_like(t)
+    out[0::2] = t[:half]
+    out[1::2] = t[half:]
+    return out.tobytes()
+
+
+def _select_exr_channels(channels):
+    """R/G/B (없으면 Y, 그래도 없으면 첫 채널) 의 chlist 인덱스"""
+    names = [channel[0] for channel in channels]
+    if all(name in names for name in ['R', 'G', 'B']):
+        return [names.index(name) for name in ['R', 'G', 'B']]
+    if 'Y' in names:
+        return [names.index('Y')]
+    if not names:
+        raise DecodeError("no channels")
+    return [0]
+
+
+def _decode_exr(buf, max_width, max_height):
+    try:
+        version, attributes, header_end = parse_exr_header(buf)
+    except HeaderError as e:
+        raise DecodeError(str(e))
+    if version & (EXR_TILED_FLAG | EXR_NON_IMAGE_FLAG | EXR_MULTIPART_FLAG):
+        raise DecodeError("tiled/deep/multipart EXR")
+
+    compression = attributes.get('compression', (None, None))[1]
+    if compression not in EXR_LINES_PER_CHUNK:
+        raise DecodeError("unsupported compression %s" % compression)
+    lines_per_chunk = EXR_LINES_PER_CHUNK[compression]
+
+    xmin, ymin, xmax, ymax = attributes['dataWindow'][1]
+    width = xmax - xmin + 1
+    height = ymax - ymin + 1
+    if width <= 0 or height <= 0:
+        raise DecodeError("empty data window")
+
+    channels = parse_exr_channels(attributes['channels'][1])
+    line_bytes = 0
+    channel_offsets = []
+    for name, pixel_type, x_sampling, y_sampling in channels:
+        if pixel_type not in EXR_PIXEL_DTYPES or x_sampling != 1 or y_sampling != 1:
+            raise DecodeError("unsupported channel %s" % name)
+        channel_offsets.append(line_bytes)
+        line_bytes += width * EXR_PIXEL_DTYPES[pixel_type].itemsize
+    selected = _select_exr_channels(channels)
+
+    chunk_count = (height + lines_per_chunk - 1) // lines_per_chunk
+    offsets = struct.unpack_from("<%dQ" % chunk_count, buf, header_end)
+
+    y_step = max(1, height // max_height)
+    x_step = max(1, width // max_width)
+    rows = []
+    chunk_index = None
+    chunk = None
+    for y in range(0, height, y_step):
+        if y // lines_per_chunk != chunk_index:
+            chunk_index = y // lines_per_chunk
+            chunk_lines = min(lines_per_chunk, height - chunk_index * lines_per_chunk)
+            expected = chunk_lines * line_bytes
+            offset = offsets[chunk_index]
+            chunk_y, size = struct.unpack_from("<ii", buf, offset)
+            if chunk_y != ymin + chunk_index * lines_per_chunk:
+                raise DecodeError("unexpected chunk order")
+            chunk = buf[offset + 8:offset + 8 + size]
+            if compression != 0 and size < expected:
+                chunk = _exr_unzip(chunk, expected)
+            if len(chunk) != expected:
+                raise DecodeError("truncated chunk")
+
+        line_start = (y - chunk_index * lines_per_chunk) * line_bytes
+        row = []
+        for index in selected:
+            dtype = EXR_PIXEL_DTYPES[channels[index][1]]
+            values = np.frombuffer(chunk, dtype=dtype, count=width,
+                                   offset=line_start + channel_offsets[index])
+            row.append(values[::x_step].astype(np.float32))
+        rows.append(np.stack(row, axis=-1))
+
+    return linear_to_srgb(_to_rgb(np.stack(rows)))
+
+
+# ---------------------------------------------------------------------------
+# DPX
+# ---------------------------------------------------------------------------
+
+def _decode_dpx(buf, max_width, max_height):
+    magic = buf[:4]
+    if magic == DPX_MAGIC_BE:
+        order = ">"
+    elif magic == DPX_MAGIC_LE:
+        order = "<"
+    else:
+        raise DecodeError("not a DPX file")
+
+    def u32(offset):
+        return struct.unpack_from(order + "I", buf, offset)[0]
+
+    def u16(offset):
+        return struct.unpack_from(order + "H", buf, offset)[0]
+
+    width = u32(772)
+    height = u32(776)
+    descriptor = buf[800]
+    transfer = buf[801]
+    bit_depth = buf[803]
+    packing = u16(804)
+    encoding = u16(806)
+    data_offset = u32(808)
+    eol_padding = u32(812)
+
+    if encoding != 0:
+        raise DecodeError("RLE encoded DPX")
+    if descriptor not in DPX_DESCRIPTORS:
+        raise DecodeError("unsupported descriptor %d" % descriptor)
+    if width in [0, DPX_UNDEFINED_U32] or height in [0, DPX_UNDEFINED_U32]:
+        raise DecodeError("invalid image size")
+    if data_offset in [0, DPX_UNDEFINED_U32]:
+        data_offset = u32(4)
+    if eol_padding == DPX_UNDEFINED_U32:
+        eol_padding = 0
+
+    components = DPX_DESCRIPTORS[descriptor]
+    samples = width * components
+    if bit_depth == 8:
+        dtype = np.dtype('u1')
+        row_bytes = samples
+    elif bit_depth == 10 and packing in [1, 2]:
+        dtype = np.dtype(order + 'u4')
+        row_bytes = (samples + 2) // 3 * 4
+    elif bit_depth in [12, 16] and (bit_depth == 16 or packing in [1, 2]):
+        dtype = np.dtype(order + 'u2')
+        row_bytes = samples * 2
+    else:
+        raise DecodeError("unsupported bit depth %d / packing %d" % (bit_depth, packing))
+    row_bytes = (row_bytes + 3) // 4 * 4
+    row_stride = row_bytes + eol_padding
+    if data_offset + (height - 1) * row_stride + row_bytes > len(buf):
+        raise DecodeError("truncated image data")
+
+    y_step = max(1, height // max_height)
+    x_step = max(1, width // max_width)
+    rows = []
+    for y in range(0, height, y_step):
+        start = data_offset + y * row_stride
+        words = np.frombuffer(buf[start:start + row_bytes], dtype=dtype)
+        if bit_depth == 10:
+            # 한 워드에 3개 성분 (method A: 하위 2 bit 패딩, method B: 상위 2 bit 패딩)
+            shift = 2 if packing == 1 else 0
+            words = words.astype(np.uint32)
+            values = np.stack([(words >> (20 + shift)) & 0x3FF,
+                               (words >> (10 + shift)) & 0x3FF,
+                               (words >> shift) & 0x3FF], axis=-1).reshape(-1)[:samples]
+        elif bit_depth == 12:
+            values = words[:samples] >> 4 if packing == 1 else words[:samples] & 0xFFF
+        else:
+            values = words[:samples]
+        rows.append(values.reshape(width, components)[::x_step])
+
+    codes = np.stack(rows).astype(np.float32)
+    max_code = float((1 << bit_depth) - 1)
+    if transfer in DPX_TRANSFER_LOG:
+        pixels = linear_to_srgb(cineon_to_linear(codes * (1023.0 / max_code)))
+    elif transfer == DPX_TRANSFER_LINEAR:
+        pixels = linear_to_srgb(codes / max_code)
+    else:
+        # 비디오 / 미지정 전달 특성은 이미 디스플레이 값
+        pixels = codes / max_code
+    return _to_rgb(pixels)
+
+
+# ---------------------------------------------------------------------------
+# 썸네일
+# ---------------------------------------------------------------------------
+
+def decode_frame(path, max_width, max_height):
+    """
+    프레임을 썸네일 크기 근처로 서브샘플링하여 디코딩합니다.
+
+    Args:
+        path: EXR/DPX 파일 경로
+        max_width, max_height: 썸네일 크기 (이 크기 이상이 되도록 행/열을 건너뜀)
+
+    Returns:
+        (h, w, 3) float 배열 (디스플레이 값, 0~1)
+
+    Raises:
+        DecodeError: 빠른 경로로 디코딩할 수 없을 때
+        OSError: 파일을 열 수 없을 때
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise DecodeError("empty file")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic = mapped[:4]
+            if magic == EXR_MAGIC:
+                return _decode_exr(mapped, max_width, max_height)
+            if magic in [DPX_MAGIC_BE, DPX_MAGIC_LE]:
+                return _decode_dpx(mapped, max_width, max_height)
+            raise DecodeError("unsupported format")
+        except (struct.error, IndexError, KeyError, ValueError) as e:
+            raise DecodeError(str(e))
+        finally:
+            mapped.close()
+
+
+def write_thumbnail(source, target, size, quality=90):
+    """
+    source 의 썸네일 JPEG 를 target 에 씁니다.
+
+    Args:
+        source: EXR/DPX 파일 경로
+        target: 썸네일 jpg 경로
+        size: (width, height)
+        quality: JPEG 품질
+
+    Raises:
+        DecodeError: 빠른 경로로 디코딩할 수 없을 때 (oiiotool 로 fallback)
+        OSError: 파일 읽기/쓰기 실패
+    """
+    width, height = size
+    pixels = decode_frame(source, width, height)
+    image = Image.fromarray(_to_uint8(pixels), "RGB")
+    if image.size != (width, height):
+        image = image.resize((width, height), Image.BILINEAR)
+
+    # 쓰는 도중의 파일이 최신 썸네일로 보이지 않도록 임시 파일에 쓴 뒤 교체
+    temp_file = target + ".tmp"
+    image.save(temp_file, "JPEG", quality=quality)
+    os.replace(temp_file, target)
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+프레임 ↔ 타임코드 변환
+
+timecode.Timecode 객체를 행마다 만들지 않고, NumPy 로
+타임코드/프레임 배열 전체를 한 번에 변환합니다.
+
+프레임레이트 규칙:
+- 타임코드는 정수 기준 fps(timecode_base)로 셉니다.
+  23.976 → 24, 29.97 → 30, 59.94 → 60 (Timecode(round(fps), ...) 와 같음)
+- drop-frame 은 29.97 / 59.94 에서만 적용하며,
+  drop_frame=None 이면 구분자 ';' 로 판단합니다 (SMPTE 표기).
+- 프레임 번호는 Timecode(...).frame_number 와 같은 0 기준 값입니다.
+
+사용법:
+    frames = timecodes_to_frames(["01:00:00:00", "01:00:00:12"], 23.976)
+    timecodes = frames_to_timecodes(frames + 24, 23.976)
+"""
+
+import re
+
+import numpy as np
+
+
+DROP_FRAME_RATES = [29.97, 59.94]
+_TIMECODE_RE = re.compile(r"^(\d{1,2})[:;.](\d{1,2})[:;.](\d{1,2})([:;.])(\d{1,3})$")
+
+
+def timecode_base(framerate):
+    """타임코드를 셀 때 쓰는 정수 fps (23.976 → 24, 29.97 → 30)"""
+    return int(round(float(framerate)))
+
+
+def is_drop_frame_rate(framerate):
+    """drop-frame 타임코드를 쓸 수 있는 프레임레이트인지"""
+    return any(abs(float(framerate) - rate) < 0.01 for rate in DROP_FRAME_RATES)
+
+
+def _drop_count(framerate):
+    """분마다 건너뛰는 프레임 수 (29.97 → 2, 59.94 → 4)"""
+    return int(round(float(framerate) * 0.066666))
+
+
+def _parse_fixed(timecodes):
+    """
+    'HH:MM:SS:FF' 형식(11 자)만 있으면 바이트 배열로 한 번에 파싱합니다.
+
+    Returns:
+        (fields (N, 4), drop (N,)) 또는 None (다른 형식이 섞여 있을 때)
+    """
+    if any(len(timecode) != 11 for timecode in timecodes):
+        return None
+    try:
+        raw = np.array(timecodes, dtype='S11')
+    except (UnicodeEncodeError, ValueError):
+        return None
+    chars = raw.view(np.uint8).reshape(-1, 11)
+    separators = chars[:, [2, 5, 8]]
+    if not np.all((separators == ord(':')) | (separators == ord(';')) | (separators == ord('.'))):
+        return None
+    digits = chars[:, [0, 1, 3, 4, 6, 7, 9, 10]].astype(np.int64) - ord('0')
+    if np.any((digits < 0) | (digits > 9)):
+        return None
+    fields = digits[:, 0::2] * 10 + digits[:, 1::2]
+    drop = chars[:, 8] == ord(';')
+    return fields, drop
+
+
+def parse_timecodes(timecodes):
+    """
+    타임코드 문자열 목록을 (시, 분, 초, 프레임) 배열로 파싱합니다.
+
+    Args:
+        timecodes: 'HH:MM:SS:FF' 문자열 목록 (';' 는 drop-frame 표기)
+
+    Returns:
+        (fields (N, 4) int64 배열, drop (N,) bool 배열)
+
+    Raises:
+        ValueError: 타임코드 형식이 아닐 때
+    """
+    timecodes = [str(timecode).strip() for timecode in timecodes]
+    if not timecodes:
+        return np.zeros((0, 4), dtype=np.int64), np.zeros(0, dtype=bool)
+
+    parsed = _parse_fixed(timecodes)
+    if parsed is not None:
+        return parsed
+
+    fields = np.empty((len(timecodes), 4), dtype=np.int64)
+    drop = np.zeros(len(timecodes), dtype=bool)
+    for i, timecode in enumerate(timecodes):
+        match = _TIMECODE_RE.match(timecode)
+        if not match:
+            raise ValueError("invalid timecode: %r" % timecode)
+        hours, minutes, seconds, separator, frames = match.groups()
+        fields[i] = (int(hours), int(minutes), int(seconds), int(frames))
+        drop[i] = separator == ";"
+    return fields, drop
+
+
+def timecodes_to_frames(timecodes, framerate, drop_frame=None):
+    """
+    타임코드 배열 → 프레임 번호 배열
+
+    Args:
+        timecodes: 타임코드 문자열 목록
+        framerate: 프레임레이트 (23.976, 24, 29.97 ...)
+        drop_frame: True/False 로 강제하거나 None 이면 ';' 표기를 따름
+
+    Returns:
+        int64 배열
+    """
+    fields, drop = parse_timecodes(timecodes)
+    base = timecode_base(framerate)
+    hours, minutes, seconds, frames = fields.T
+    result = ((hours * 60 + minutes) * 60 + seconds) * base + frames
+
+    if is_drop_frame_rate(framerate):
+        if drop_frame is not None:
+            drop = np.full(len(result), bool(drop_frame))
+        total_minutes = hours * 60 + minutes
+        dropped = _drop_count(framerate) * (total_minutes - total_minutes // 10)
+        result = np.where(drop, result - dropped, result)
+    return result
+
+
+def frames_to_timecodes(frames, framerate, drop_frame=False):
+    """
+    프레임 번호 배열 → 타임코드 문자열 목록
+
+    Args:
+        frames: 프레임 번호 (정수 배열 또는 목록)
+        framerate: 프레임레이트
+        drop_frame: True 이면 29.97/59.94 에서 drop-frame 으로 표기 (';')
+
+    Returns:
+        'HH:MM:SS:FF' 문자열 목록
+    """
+    frames = np.asarray(frames, dtype=np.int64)
+    base = timecode_base(framerate)
+    drop_frame = bool(drop_frame) and is_drop_frame_rate(framerate)
+
+    if drop_frame:
+        drop = _drop_count(framerate)
+        frames_per_10min = base * 600 - drop * 9
+        frames_per_min = base * 60 - drop
+        tens, remainder = np.divmod(frames, frames_per_10min)
+        extra = np.where(remainder > drop, drop * ((remainder - drop) // frames_per_min), 0)
+        frames = frames + drop * 9 * tens + extra
+
+    seconds, frame = np.divmod(frames, base)
+    minutes, seconds = np.divmod(seconds, 60)
+    hours, minutes = np.divmod(minutes, 60)
+    hours = hours % 24
+
+    last = ";" if drop_frame else ":"
+    template = "%02d:%02d:%02d" + last + "%02d"
+    return [template % values for values in zip(hours.tolist(), minutes.tolist(),
+                                                 seconds.tolist(), frame.tolist())]
+
+
+def digits_to_timecodes(values):
+    """
+    숫자로 저장된 타임코드 배열 → 'HH:MM:SS:FF' 문자열 목록
+
+    엑셀이 01000000 같은 타임코드 셀을 숫자 1000000 으로 읽는 경우에 사용합니다.
+
+    Args:
+        values: HHMMSSFF 정수 (또는 실수) 목록
+
+    Returns:
+        'HH:MM:SS:FF' 문자열 목록
+    """
+    values = np.asarray(values, dtype=np.float64).astype(np.int64)
+    hours, rest = np.divmod(values, 1000000)
+    minutes, rest = np.divmod(rest, 10000)
+    seconds, frames = np.divmod(rest, 100)
+    return ["%02d:%02d:%02d:%02d" % fields for fields in zip(hours.tolist(), minutes.tolist(),
+                                                             seconds.tolist(), frames.tolist())]
+
+
+def timecode_to_frame(timecode, framerate, drop_frame=None):
+    """타임코드 하나 → 프레임 번호"""
+    return int(timecodes_to_frames([timecode], framerate, drop_frame)[0])
+
+
+def frame_to_timecode(frame, framerate, drop_frame=False):
+    """프레임 번호 하나 → 타임코드"""
+    return frames_to_timecodes([frame], framerate, drop_frame)[0]
+
+
+def offset_timecode(timecode, offset, framerate):
+    """
+    timecode 에서 offset 프레임 뒤의 타임코드 (drop-frame 표기는 유지)
+
+    str(Timecode(round(fps), timecode) + offset) 에 해당합니다.
+    """
+    drop_frame = ";" in timecode and is_drop_frame_rate(framerate)
+    return frame_to_timecode(timecode_to_frame(timecode, framerate) + offset, framerate, drop_frame)
@@ -1,69 +1,16 @@
 # -*- coding: utf-8 -*-
 
 import os
+import bisect
 # Qt 호환성 레이어 사용
 from ..utils.qt_compat import QtCore, QtGui
-from timecode import Timecode
 import pyseq
-import pydpx_meta
-import OpenEXR
-import math
+import numpy as np
 from .constant import *
-import ffmpeg
-
-
-def _safe_open_exr(file_path):
-    """
-    OpenEXR 파일을 안전하게 열기
-
-    Returns:
-        OpenEXR.InputFile 객체 또는 None (실패 시)
-    """
-    try:
-        # 파일 존재 확인
-        if not os.path.exists(file_path):
-            print(f"WARNING: EXR file not found: {file_path}")
-            return None
-
-        # 파일 접근 권한 확인
-        if not os.access(file_path, os.R_OK):
-            print(f"WARNING: No read permission for: {file_path}")
-            return None
-
-        # OpenEXR 파일 열기
-        exr = OpenEXR.InputFile(file_path)
-        return exr
-
-    except Exception as e:
-        print(f"ERROR: Failed to open EXR file {file_path}: {e}")
-        return None
-
-
-def _safe_open_dpx(file_path):
-    """
-    DPX 파일을 안전하게 열기
-
-    Returns:
-        pydpx_meta.DpxHeader 객체 또는 None (실패 시)
-    """
-    try:
-        # 파일 존재 확인
-        if not os.path.exists(file_path):
-            print(f"WARNING: DPX file not found: {file_path}")
-            return None
-
-        # 파일 접근 권한 확인
-        if not os.access(file_path, os.R_OK):
-            print(f"WARNING: No read permission for: {file_path}")
-            return None
-
-        # DPX 헤더 읽기
-        dpx = pydpx_meta.DpxHeader(file_path)
-        return dpx
-
-    except Exception as e:
-        print(f"ERROR: Failed to open DPX file {file_path}: {e}")
-        return None
+from .excel import FRAME_HEADER_CACHE
+from .ffprobe_cache import FFPROBE_CACHE
+from .timecode_math import timecodes_to_frames, timecode_to_frame, offset_timecode
+from .probe import get_config_value
 
 
 class MOV_INFO:
@@ -74,14 +21,7 @@ class MOV_INFO:
     
     @property
     def video_stream(self):
-        probe = ffmpeg.probe(self.mov_file)
-        video_stream = next((stream for stream in probe['streams'] 
-                             if stream['codec_type'] == 'video'), None)
-        
-        if video_stream : 
-            return video_stream
-        
-        return None
+        return FFPROBE_CACHE.video_stream(self.mov_file)
 
 
 class Validate(object):
@@ -105,49 +45,68 @@ class Validate(object):
         self.project = context.project
     
     def timecode(self):
-        
-        rows = self.model.rowCount(None)
-        timecode_in = MODEL_KEYS['timecode_in']
-        timecode_out = MODEL_KEYS['timecode_out']
+        """
+        체크된 행의 just_in / just_out 을 timecode_in / timecode_out 기준으로 다시 계산합니다.
+
+        타임코드 → 프레임 변환은 프레임레이트별로 모아서 timecode_math 로 한 번에 처리합니다.
+        """
+        rows = len(self.model.store)
+        groups = {}
         for row in range(0,rows):
 
-            index = self.model.createIndex(row,0)
-            check = self.model.data(index,QtCore.Qt.CheckStateRole )
-            if check == QtCore.Qt.CheckState.Unchecked:
+            if not self.model.store.is_checked(row):
                 continue
-            
-            framerate = math.ceil(self._get_data(row,MODEL_KEYS['framerate']))
-            mod_start_frame = self._get_data(row,MODEL_KEYS['start_frame'])
 
+            framerate = float(self._get_data(row,MODEL_KEYS['framerate']))
+            mod_start_frame = self._get_data(row,MODEL_KEYS['start_frame'])
 
             seq_path = self._get_data(row,MODEL_KEYS['scan_path'])
             ext = self._get_data(row,MODEL_KEYS['ext'])
             if ext == "mov":
-                return
-                scan_name = self._get_data(row, MODEL_KEYS['scan_name'])
-                seq_path = os.path.join(seq_path,scan_name)
+                break
             seq = pyseq.get_sequences(seq_path)
 
             if not seq:
-                return
+                break
             seq = seq[0]
             start_timecode = self._get_timecode(seq,self._get_start(seq))
-            start_frame = Timecode(framerate,start_timecode).frame_number
-            
             timecode_in = self._get_data(row,MODEL_KEYS['timecode_in'])
-            just_in_frame = Timecode(round(framerate),timecode_in).frame_number
-            
             timecode_out = self._get_data(row,MODEL_KEYS['timecode_out'])
-            just_out_frame = Timecode(framerate,timecode_out).frame_number
-            
-            just_in = mod_start_frame + (just_in_frame - start_frame)
-            just_out = mod_start_frame + (just_out_frame - start_frame)
-            
-            self._set_data(row,MODEL_KEYS['just_in'],just_in)
-            self._set_data(row,MODEL_KEYS['just_out'],just_out)
+            if not (start_timecode and timecode_in and timecode_out):
+                print(f"WARNING: Missing timecode for row {row}, skipping")
+                continue
+
+            group = groups.setdefault(framerate, {'rows': [], 'mod_start': [], 'start': [], 'in': [], 'out': []})
+            group['rows'].append(row)
+            group['mod_start'].append(int(mod_start_frame))
+            group['start'].append(start_timecode)
+            group['in'].append(timecode_in)
+            group['out'].append(timecode_out)
+
+        just_in_values = {}
+        just_out_values = {}
+        for framerate, group in groups.items():
+            try:
+                start_frame = timecodes_to_frames(group['start'], framerate)
+                just_in_frame = timecodes_to_frames(group['in'], framerate)
+                just_out_frame = timecodes_to_frames(group['out'], framerate)
+            except ValueError as e:
+                print(f"ERROR: Invalid timecode ({framerate} fps): {e}")
+                continue
+
+            mod_start_frame = np.asarray(group['mod_start'], dtype=np.int64)
+            just_in = (mod_start_frame + (just_in_frame - start_frame)).tolist()
+            just_out = (mod_start_frame + (just_out_frame - start_frame)).tolist()
+
+            just_in_values.update(zip(group['rows'], just_in))
+            just_out_values.update(zip(group['rows'], just_out))
+
+        with self.model.batch():
+            self.model.set_column(MODEL_KEYS['just_in'], just_in_values)
+            self.model.set_column(MODEL_KEYS['just_out'], just_out_values)
 
     def shotname(self):
-        rows = self.model.rowCount(None)
+        rows = len(self.model.store)
         pass
 
 
@@ -155,26 +114,25 @@ class Validate(object):
         pass
     
     def uploade_status(self):
-        rows = self.model.rowCount(None)
-        for row in range(0,rows):
+        """
+        체크된 행의 version / date 를 Shotgun 에 등록된 PublishedFile 기준으로 채웁니다.
 
-            index = self.model.createIndex(row,0)
-            check = self.model.data(index,QtCore.Qt.CheckStateRole )
-            if check == QtCore.Qt.CheckState.Unchecked:
-                continue
-            version,date = self._get_version(row)
-            self._set_data(row,MODEL_KEYS['version'],version)
-            self._set_data(row,MODEL_KEYS['date'],str(date))
+        행마다 Shot / PublishedFileType / PublishedFile 을 따로 조회하지 않고
+        _get_versions() 에서 'in' 필터로 모아서 조회합니다.
+        """
+        rows = [row for row in range(0,len(self.model.store)) if self.model.store.is_checked(row)]
+        versions = self._get_versions(rows)
+        with self.model.batch():
+            self.model.set_column(MODEL_KEYS['version'], dict((row, version) for row, (version, _) in versions.items()))
+            self.model.set_column(MODEL_KEYS['date'], dict((row, str(date)) for row, (_, date) in versions.items()))
     
     def check_src_version(self):
         
         group_model = {}
 
-        for row in range(0,self.model.rowCount(None)):
+        for row in range(0,len(self.model.store)):
 
-            index = self.model.createIndex(row,0)
-            check = self.model.data(index,QtCore.Qt.CheckStateRole )
-            if check == QtCore.Qt.CheckState.Unchecked:
+            if not self.model.store.is_checked(row):
                 continue
 
             type_value = self._get_data(row,MODEL_KEYS['type'])
@@ -186,83 +144,203 @@ class Validate(object):
                 group_model[shot_name] = []
                 group_model[shot_name].append(row)
         
+        versions = {}
         for value in group_model.values():
             print(value)
             add_value = 0
             for row in value:
                 version = self._get_data(row,MODEL_KEYS['version'])
-                self._set_data(row,MODEL_KEYS['version'],int(version)+add_value)
+                versions[row] = int(version)+add_value
                 add_value += 1
+        self.model.set_column(MODEL_KEYS['version'], versions)
     
     def check_editor_shot(self):
+        """
+        체크된 editor 행의 seq_name / shot_name 을 Shotgun Shot 의 클립 이름 + 타임코드로 찾아 채웁니다.
 
-        for row in range(0,self.model.rowCount(None)):
+        프로젝트 Shot 을 한 번에 가져와서 (클립 이름, timecode_in) 인덱스로 맞추고,
+        정확히 같은 타임코드가 없으면 클립별 정렬된 프레임 목록에서
+        shotgun.editor_timecode_tolerance 프레임 이내의 가장 가까운 Shot 을 찾습니다.
+        """
+        rows = []
+        for row in range(0,len(self.model.store)):
 
-            index = self.model.createIndex(row,0)
-            check = self.model.data(index,QtCore.Qt.CheckStateRole )
-            if check == QtCore.Qt.CheckState.Unchecked:
+            if not self.model.store.is_checked(row):
                 continue
+            if self._get_data(row,MODEL_KEYS['type']) == "editor":
+                rows.append(row)
+        if not rows:
+            return
 
-            type_value = self._get_data(row,MODEL_KEYS['type'])
-            if type_value == "editor":
-                clibname = self._get_data(row,MODEL_KEYS['clip_name']) 
+        key = [
+                ['project','is',self.project],
+                ['sg_clib_name','is_not',None]
+                ]
+        order = [{'field_name': 'id', 'direction': 'asc'}]
+        shot_ents = self._sg.find("Shot",key,['code','sg_sequence','sg_clib_name','sg_timecode_in'],order)
+
+        # (클립 이름, 타임코드) → Shot (find_one 과 같이 id 가 가장 작은 Shot)
+        # Shotgun 'is' 필터처럼 대소문자를 구분하지 않도록 클립 이름은 casefold 해서 키로 사용
+        exact = {}
+        clips = {}
+        for shot_ent in shot_ents:
+            clip = shot_ent['sg_clib_name'].casefold()
+            timecode = shot_ent['sg_timecode_in']
+            if not timecode:
+                continue
+            exact.setdefault((clip, timecode), shot_ent)
+            clips.setdefault(clip, []).append(shot_ent)
+
+        tolerance = int(get_config_value('shotgun.editor_timecode_tolerance', 1))
+        frame_index = {}
+        with self.model.batch():
+            for row in rows:
+                clibname = self._get_data(row,MODEL_KEYS['clip_name'])
+                clip = (clibname.split(".")[0]+".").casefold()
                 start_tc = self._get_data(row,MODEL_KEYS['timecode_in'])
-                filter_shot = [
-                    ['sg_clib_name','is',clibname.split(".")[0]+"."],
-                    #['project','is',{"id":124,'type':"Project"}],
-                    ['project','is',self.project],
-                    ['sg_timecode_in','is',start_tc]
-                    ]
 
-                shot_ent = self._sg.find_one("Shot",filter_shot,['code','sg_sequence'])
+                shot_ent = exact.get((clip, start_tc))
+                if shot_ent is None and tolerance > 0 and clip in clips:
+                    shot_ent = self._nearest_shot(clips[clip], start_tc,
+                                                  self._get_data(row,MODEL_KEYS['framerate']),
+                                                  tolerance, frame_index)
                 if shot_ent:
                     print(shot_ent)
                     self._set_data(row,MODEL_KEYS['seq_name'],shot_ent['sg_sequence']['name'])
                     self._set_data(row,MODEL_KEYS['shot_name'],shot_ent['code'])
 
+    def _nearest_shot(self,shot_ents,timecode,framerate,tolerance,frame_index):
+        """
+        timecode 에서 tolerance 프레임 이내에 있는 가장 가까운 Shot
+
+        Args:
+            shot_ents: 같은 클립 이름의 Shot 목록
+            timecode: 행의 timecode_in
+            framerate: 행의 프레임레이트
+            tolerance: 허용 프레임 수
+            frame_index: (클립 이름, 프레임레이트) → (정렬된 프레임 목록, Shot 목록) 캐시
+
+        Returns:
+            Shot 엔티티 또는 None
+        """
+        try:
+            framerate = float(framerate)
+            frame = timecode_to_frame(timecode, framerate)
+        except ValueError:
+            return None
+
+        index_key = (shot_ents[0]['sg_clib_name'].casefold(), framerate)
+        if index_key not in frame_index:
+            timecodes = [shot_ent['sg_timecode_in'] for shot_ent in shot_ents]
+            try:
+                frames = timecodes_to_frames(timecodes, framerate).tolist()
+            except ValueError:
+                frames = []
+                for shot_timecode in timecodes:
+                    try:
+                        frames.append(timecode_to_frame(shot_timecode, framerate))
+                    except ValueError:
+                        frames.append(None)
+            pairs = sorted((shot_frame, i) for i, shot_frame in enumerate(frames) if shot_frame is not None)
+            frame_index[index_key] = ([pair[0] for pair in pairs], [shot_ents[pair[1]] for pair in pairs])
+        frames, ents = frame_index[index_key]
+
+        position = bisect.bisect_left(frames, frame - tolerance)
+        best = None
+        while position < len(frames) and frames[position] <= frame + tolerance:
+            if best is None or abs(frames[position] - frame) < abs(frames[best] - frame):
+                best = position
+            position += 1
+        return ents[best] if best is not None else None
 
     def _get_version(self,row):
-        
-        file_type = self._get_data(row,MODEL_KEYS['type'])
-        file_type_ent = self.published_file_type(file_type)
-        shot_name = self._get_data(row,MODEL_KEYS['shot_name'])
-        version_name = shot_name + "_" + file_type
-        key = [
-                ['project','is',self.project],
-                ['code','is',shot_name]
-                ]
 
-        shot_ent = self._sg.find_one('Shot',key)
+        return self._get_versions([row])[row]
 
-        key = [
-                ['project','is',self.project],
-                ['entity','is',shot_ent],
-                ["published_file_type","is",file_type_ent],
-                ['name','is',version_name]
-               ]
-        published_ents = self._sg.find("PublishedFile",key,['version_number','created_at'])
-        if not published_ents:
-            return 1,""
-        else:
-            return published_ents[-1]['version_number']+1 ,published_ents[-1]['created_at']
+    def _get_versions(self,rows):
+        """
+        행마다 다음 버전 번호와 마지막 PublishedFile 생성 날짜를 계산합니다.
+
+        Shot, PublishedFileType, PublishedFile 을 각각 'in' 필터로 조회하므로
+        (shotgun.batch_size 개씩 나눠서) 행이 몇 개든 요청 수는 몇 번이면 됩니다.
 
+        Args:
+            rows: 모델 행 번호 목록
+
+        Returns:
+            {row: (version, date)} — PublishedFile 이 없으면 (1, "")
+        """
+        if not rows:
+            return {}
+        batch_size = max(1, int(get_config_value('shotgun.batch_size', 200)))
+
+        row_keys = {}
+        for row in rows:
+            file_type = self._get_data(row,MODEL_KEYS['type'])
+            shot_name = self._get_data(row,MODEL_KEYS['shot_name'])
+            row_keys[row] = (shot_name, self._published_file_type_code(file_type), shot_name + "_" + file_type)
+
+        type_codes = sorted(set(key[1] for key in row_keys.values()))
+        type_ents = self._sg.find("PublishedFileType",[['code','in',type_codes]],['id','code'])
+        type_ids = dict((ent['code'], ent['id']) for ent in type_ents)
+
+        shot_names = sorted(set(key[0] for key in row_keys.values()))
+        shot_ids = {}
+        for i in range(0, len(shot_names), batch_size):
+            key = [
+                    ['project','is',self.project],
+                    ['code','in',shot_names[i:i + batch_size]]
+                    ]
+            for shot_ent in self._sg.find('Shot',key,['code']):
+                shot_ids.setdefault(shot_ent['code'], shot_ent['id'])
+
+        # (shot id, type id, name) → 가장 마지막(id 가 가장 큰) PublishedFile
+        latest = {}
+        shot_versions = {}
+        for shot_name, _, version_name in row_keys.values():
+            if shot_name in shot_ids:
+                shot_versions.setdefault(shot_ids[shot_name], set()).add(version_name)
+        shots = sorted(shot_versions)
+        types = [{'type': 'PublishedFileType', 'id': type_id} for type_id in sorted(set(type_ids.values()))]
+        for i in range(0, len(shots), batch_size):
+            chunk = shots[i:i + batch_size]
+            version_names = sorted(set().union(*[shot_versions[shot_id] for shot_id in chunk]))
+            key = [
+                    ['project','is',self.project],
+                    ['entity','in',[{'type': 'Shot', 'id': shot_id} for shot_id in chunk]],
+                    ["published_file_type","in",types],
+                    ['name','in',version_names]
+                   ]
+            fields = ['version_number','created_at','entity','published_file_type','name']
+            order = [{'field_name': 'id', 'direction': 'asc'}]
+            for ent in self._sg.find("PublishedFile",key,fields,order):
+                latest[(ent['entity']['id'], ent['published_file_type']['id'], ent['name'])] = ent
+
+        versions = {}
+        for row, (shot_name, type_code, version_name) in row_keys.items():
+            ent = latest.get((shot_ids.get(shot_name), type_ids.get(type_code), version_name))
+            if ent is None:
+                versions[row] = (1, "")
+            else:
+                versions[row] = (ent['version_number']+1, ent['created_at'])
+        return versions
 
     def published_file_type(self,file_type):
 
+        key  = [['code','is',self._published_file_type_code(file_type)]]
+        return self._sg.find_one("PublishedFileType",key,['id'])
+
+    def _published_file_type_code(self,file_type):
+
         if file_type== "org":
-            key  = [['code','is','Plate']]
-            return self._sg.find_one("PublishedFileType",key,['id'])
-        else:
-            key  = [['code','is','Source']]
-            return self._sg.find_one("PublishedFileType",key,['id'])
+            return 'Plate'
+        return 'Source'
             
 
     def _get_data(self,row,col):
 
-        index = self.model.createIndex(row,col)
-        data = self.model.data(index,QtCore.Qt.DisplayRole)
-
-        return data
+        # 화면에 보이는 값과 같은 문자열 (SeqTableModel.data DisplayRole)
+        return self.model.store.text(row,col)
     def _set_data(self,row,col,data):
 
         index = self.model.createIndex(row,col)
@@ -270,44 +348,27 @@ class Validate(object):
 
     def _get_timecode(self,seq,frame):
 
-        if seq.head().split(".")[-1] == "mov":
+        if seq.head().split(".")[-1].lower() == "mov":
 
             mov_file = os.path.join(seq.dirname,seq.head())
             mov_info = MOV_INFO(mov_file)
             start_timecode = mov_info.video_stream['tags']['timecode']
             n ,d = mov_info.video_stream['r_frame_rate'].split("/")
             frame_rate = float(n) / float(d)
-            start_timecode = Timecode(round(frame_rate),str(start_timecode))
-            return str(start_timecode + (int(frame) - 1))
-
-        if seq.tail() == ".exr":
-            exr_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%frame+seq.tail())
-            exr = _safe_open_exr(exr_file)
-            if exr is None:
-                return ""
-            try:
-                if "timeCode" in exr.header():
-                    ti = exr.header()['timeCode']
-                    return "%02d:%02d:%02d:%02d"%(ti.hours,ti.minutes,ti.seconds,ti.frame)
-            except Exception as e:
-                print(f"ERROR: Failed to read timecode from {exr_file}: {e}")
+            return offset_timecode(str(start_timecode), int(frame) - 1, frame_rate)
+
+        if seq.tail() not in [".exr", ".dpx"]:
             return ""
-        elif seq.tail() == ".dpx":
-            dpx_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%frame+seq.tail())
-            dpx = _safe_open_dpx(dpx_file)
-            if dpx is None:
-                return ""
-            try:
-                return dpx.tv_header.time_code
-            except Exception as e:
-                print(f"ERROR: Failed to read timecode from {dpx_file}: {e}")
-                return ""
-        else:
+
+        frame_file = os.path.join(seq.dirname,seq.head()+seq.format("%p")%frame+seq.tail())
+        header = FRAME_HEADER_CACHE.get(frame_file)
+        if header is None:
             return ""
+        return header.timecode
 
     def _get_start(self,seq):
 
-        if seq.head().split(".")[-1] == "mov":
+        if seq.head().split(".")[-1].lower() == "mov":
             return 1
         return seq.start()
 
@@ -15,13 +15,16 @@ import subprocess
 from collections import OrderedDict
 
 # Qt 호환성 레이어 사용
-from .utils.qt_compat import QtCore, QtGui, QWidget, QFileDialog
+from .utils.qt_compat import QtCore, QtGui, QWidget, QFileDialog, QLabel, QLineEdit, QComboBox, QHBoxLayout
 from .ui.dialog import Ui_Dialog
 from .model.seq_item_model import *
+from .model.seq_proxy_model import SeqSortFilterProxyModel
 from .api import excel
 from .api import publish
 from .api import collect
 from .api import validate
+from .api import ingest
+from .api import saver
 from .api.constant import *
 
 
@@ -92,6 +95,27 @@ class AppDialog(QWidget):
         self.ui.v_editor.clicked.connect(lambda: self._validate("editor"))
         self.ui.edit_excel.setEnabled(False)
 
+        # 진행 중인 ingest (새 폴더를 열면 기다리지 않고 중단)
+        self._ingest_worker = None
+        self._ingest_thread = None
+        self._ingest_model = None
+
+        # 썸네일 알림 / 지연 컬럼 로더 / 타임코드 재계산 (모델을 바꿀 때마다 새로 만듦)
+        self._create_background_helpers()
+
+        # scanlist 저장은 스냅샷을 떠서 백그라운드에서 씀
+        self._saver = saver.ScanlistSaver(self)
+        self._saver.progress.connect(self._on_save_progress)
+        self._saver.saved.connect(self._on_save_finished)
+        self._saver.failed.connect(self._on_save_failed)
+
+        # 뷰는 항상 정렬/필터 프록시를 거쳐서 모델을 봄 (대용량 모드에서 정렬/필터 사용)
+        self._model = None
+        self._large_mode = False
+        self._preview_path = None
+        self._proxy = SeqSortFilterProxyModel(self)
+        self._setup_large_mode_widgets()
+
     def _set_colorspace(self):
         """컬러스페이스 설정을 Shotgun에서 로드합니다."""
         try:
@@ -127,9 +151,16 @@ class AppDialog(QWidget):
             import traceback
             traceback.print_exc()
 
+    def _resolve_checked(self, model):
+        """체크된 행의 지연 컬럼을 모두 채웁니다 (Validate/Publish/Collect 직전)."""
+        if not isinstance(model, SeqTableModel):
+            return
+        model.resolve_lazy(model.store.checked_rows())
+
     def _validate(self, command):
 
-        model = self.ui.seq_model_view.model()
+        model = self._source_model()
+        self._resolve_checked(model)
         v = validate.Validate(model)
         if command == "timecode":
             v.timecode()
@@ -150,21 +181,21 @@ class AppDialog(QWidget):
 
     def _check_all(self):
 
-        model = self.ui.seq_model_view.model()
+        model = self._source_model()
         if model:
-            for row in range(0, model.rowCount(None)):
-                index = model.createIndex(row, 0)
-                model.setData(index, QtCore.Qt.Checked, QtCore.Qt.CheckStateRole)
+            model.set_checked(range(0, len(model.store)), True)
 
     def _uncheck_all(self):
 
-        model = self.ui.seq_model_view.model()
+        model = self._source_model()
         if model:
-            for row in range(0, model.rowCount(None)):
-                index = model.createIndex(row, 0)
-                model.setData(index, QtCore.Qt.Unchecked, QtCore.Qt.CheckStateRole)
+            model.set_checked(range(0, len(model.store)), False)
 
-    def _set_timecode(self, index):
+    def _set_timecode(self, index, bottom_right=None, roles=None):
+
+        # 여러 셀을 한 번에 바꾼 경우(model.batch / set_column)는 값을 함께 계산해서 넣으므로 건너뜀
+        if bottom_right is not None and bottom_right != index:
+            return
 
         row = index.row()
         column = index.column()
@@ -176,9 +207,12 @@ class AppDialog(QWidget):
         else:
             return
 
-        model = self.ui.seq_model_view.model()
+        model = self._source_model()
 
-        frame = int(model.data(index, QtCore.Qt.DisplayRole))
+        try:
+            frame = int(model.data(index, QtCore.Qt.DisplayRole))
+        except ValueError:
+            return
 
         index = model.createIndex(row, MODEL_KEYS["scan_path"])
         dir_name = model.data(index, QtCore.Qt.DisplayRole)
@@ -192,10 +226,14 @@ class AppDialog(QWidget):
         index = model.createIndex(row, MODEL_KEYS['ext'])
         tail = model.data(index, QtCore.Qt.DisplayRole)
 
-        time_code = excel.get_time_code(dir_name, head, frame_format, frame, tail)
+        # 헤더/ffprobe 는 워커에서 읽고, 결과는 _on_timecode_ready 에서 묶어서 적용
+        self._timecode_refresher.request(model.store[row], timecode_col,
+                                         (dir_name, head, frame_format, frame, tail))
 
-        index = model.createIndex(row, timecode_col)
-        model.setData(index, time_code, 3)
+    def _on_timecode_ready(self, results):
+        model = self._source_model()
+        if isinstance(model, SeqTableModel):
+            model.set_record_values(results)
 
     def _set_index_by_timecode(self, index):
 
@@ -227,94 +265,287 @@ class AppDialog(QWidget):
         print("[PROGRESS] ========================================")
         print("[PROGRESS] _create_excel() in dialog.py START")
         print("[PROGRESS] ========================================")
+        self._stop_ingest()
         path = self.ui.lineEdit.text()
         print(f"[PROGRESS] Path: {path}")
         excel_file = excel.ExcelWriteModel.get_last_excel_file(path)
         if excel_file:
             print(f"[PROGRESS] Found existing excel file: {excel_file}")
-            model = SeqTableModel(excel.ExcelWriteModel.read_excel(excel_file))
+            model = SeqTableModel(excel.ExcelWriteModel.read_scanlist(excel_file))
             self.ui.excel_file_label.setText(excel_file)
             self.ui.edit_excel.setEnabled(True)
+            self._set_model(model)
         else:
-            print("[PROGRESS] No existing excel file, calling excel.create_excel()")
-            array = excel.create_excel(path)
-            print(f"[PROGRESS] excel.create_excel() returned, array length: {len(array)}")
-
-            # Debug: array 내용 확인
-            print("[DEBUG] ========== Inspecting array contents ==========")
-            if len(array) > 0:
-                print(f"[DEBUG] First row has {len(array[0])} columns")
-                for i, item in enumerate(array[0]):
-                    print(f"[DEBUG] Column {i}: type={type(item).__name__}, value preview={str(item)[:100]}")
-            print("[DEBUG] ==========================================")
-
-            print("[PROGRESS] Creating SeqTableModel...")
-            model = SeqTableModel(array)
-            print("[PROGRESS] SeqTableModel created successfully")
-            print("[PROGRESS] Calling model.rowCount()...")
-            rows = model.rowCount(None)
-            print(f"[PROGRESS] model.rowCount() returned: {rows}")
-            print("[PROGRESS] Calling model.columnCount()...")
-            cols = model.columnCount(None)
-            print(f"[PROGRESS] model.columnCount() returned: {cols}")
-            print(f"[PROGRESS] Model dimensions: {rows} x {cols}")
-            self.ui.excel_file_label.setText("No Saved Status")
-
-        print("[PROGRESS] Setting model to view...", flush=True)
+            print("[PROGRESS] No existing excel file, starting ingest worker")
+            model = SeqTableModel([])
+            self.ui.excel_file_label.setText("Scanning...")
+            self._set_model(model)
+            self._start_ingest(path, model)
 
-        # Debug: view 상태 확인
-        print(f"[DEBUG] View type: {type(self.ui.seq_model_view).__name__}", flush=True)
-        print(f"[DEBUG] View object: {self.ui.seq_model_view}", flush=True)
-        print(f"[DEBUG] View isVisible: {self.ui.seq_model_view.isVisible()}", flush=True)
-        print(f"[DEBUG] Model type: {type(model).__name__}", flush=True)
-        print(f"[DEBUG] Model parent: {model.parent()}", flush=True)
-
-        # Debug: 빈 모델로 먼저 테스트
-        print("[DEBUG] Testing with empty QStandardItemModel first...", flush=True)
-        from .utils.qt_compat import QtGui as _QtGui
-        test_model = _QtGui.QStandardItemModel(0, 0)
-        self.ui.seq_model_view.setModel(test_model)
-        print("[DEBUG] Empty model set OK", flush=True)
-
-        # Debug: 1x1 모델로 테스트
-        print("[DEBUG] Testing with 1x1 QStandardItemModel...", flush=True)
-        test_model2 = _QtGui.QStandardItemModel(1, 1)
-        test_model2.setItem(0, 0, _QtGui.QStandardItem("test"))
-        self.ui.seq_model_view.setModel(test_model2)
-        print("[DEBUG] 1x1 model set OK", flush=True)
-
-        # 실제 모델 설정
-        print("[PROGRESS] About to call setModel() with actual model...", flush=True)
-        import sys
-        sys.stdout.flush()
-        self.ui.seq_model_view.setModel(model)
-        print("[PROGRESS] setModel() returned successfully", flush=True)
-        print("[PROGRESS] Qt is now rendering the view (may call data() methods)...")
-        import time
-        time.sleep(0.1)  # Give Qt time to process
-        print("[PROGRESS] View rendering phase completed")
-        print("[PROGRESS] Setting vertical header size...")
-        self.ui.seq_model_view.verticalHeader().setDefaultSectionSize(144);
-        print("[PROGRESS] Vertical header size set")
-        print("[PROGRESS] Connecting dataChanged signal...")
-        model.dataChanged.connect(self._set_timecode)
-        print("[PROGRESS] Signal connected")
         print("[PROGRESS] _create_excel() in dialog.py COMPLETED")
         print("[PROGRESS] ========================================\n")
 
+    def _source_model(self):
+        """뷰(프록시) 뒤의 SeqTableModel (행 번호는 store 기준)"""
+        return self._model
+
+    def _create_background_helpers(self):
+        """모델마다 쓰는 백그라운드 헬퍼를 만들고 시그널을 연결합니다."""
+        # 백그라운드 썸네일 생성이 끝나면 해당 셀을 다시 그림
+        self._thumbnail_notifier = ingest.ThumbnailNotifier(self)
+        self._thumbnail_notifier.ready.connect(self._on_thumbnail_ready)
+
+        # 지연 컬럼(해상도/타임코드 등)은 보이거나 체크된 행부터 백그라운드로 채움
+        self._lazy_loader = ingest.LazyMetadataLoader(parent=self)
+        self._lazy_loader.resolved.connect(self._on_lazy_resolved)
+
+        # just_in/just_out 을 고치면 타임코드는 백그라운드에서 다시 계산
+        self._timecode_refresher = ingest.TimecodeRefresher(parent=self)
+        self._timecode_refresher.ready.connect(self._on_timecode_ready)
+
+    def _close_background_helpers(self):
+        """
+        백그라운드 헬퍼를 닫습니다 (모델을 바꾸거나 창을 닫을 때).
+
+        THUMBNAIL_SERVICE 리스너를 떼고, 로더/재계산 executor 를 끝내고, 스캔 인덱스 갱신을 씁니다.
+        executor 에 남은 작업이 끝날 때까지 객체가 살아 있도록 부모만 떼고 Python 쪽 참조에 맡깁니다.
+        """
+        for helper, signal, slot in [
+                (self._thumbnail_notifier, self._thumbnail_notifier.ready, self._on_thumbnail_ready),
+                (self._lazy_loader, self._lazy_loader.resolved, self._on_lazy_resolved),
+                (self._timecode_refresher, self._timecode_refresher.ready, self._on_timecode_ready)]:
+            signal.disconnect(slot)
+            helper.close()
+            helper.setParent(None)
+
+    def _set_model(self, model):
+        print("[PROGRESS] Setting model to view...", flush=True)
+        if self._model is not None and self._model is not model:
+            # 이전 모델의 요청이 새 모델에 섞이지 않도록 헬퍼를 새로 만듦
+            self._close_background_helpers()
+            self._create_background_helpers()
+        self._model = model
+        self._large_mode = False
+        # 뷰에는 _setup_large_mode_widgets() 에서 프록시를 한 번만 지정하고 소스 모델만 바꿈
+        self._proxy.setSourceModel(model)
+        model.dataChanged.connect(self._set_timecode)
+        model.set_lazy_loader(self._lazy_loader)
+        model.pixmap_cache.ready.connect(self._on_preview_ready)
+        self._set_large_mode(len(model.store) >= self._large_delivery_rows())
+        print("[PROGRESS] setModel() returned successfully", flush=True)
+
+    def _setup_large_mode_widgets(self):
+        """대용량 모드용 필터 입력과 썸네일 미리보기 패널 (대용량 모드에서만 표시)"""
+        view = self.ui.seq_model_view
+        layout = self.ui.verticalLayout
+        position = layout.indexOf(view)
+        layout.removeWidget(view)
+
+        self._filter_column = QComboBox(self)
+        for key in ['shot_name', 'type', 'resolution', 'scan_name', 'clip_name', 'seq_name']:
+            self._filter_column.addItem(key, MODEL_KEYS[key])
+        self._filter_edit = QLineEdit(self)
+        self._filter_edit.setPlaceholderText("Filter")
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._filter_edit.textChanged.connect(self._filter_timer.start)
+        self._filter_column.currentIndexChanged.connect(self._filter_timer.start)
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(self._filter_column)
+        filter_layout.addWidget(self._filter_edit)
+
+        self._preview = QLabel(self)
+        self._preview.setFixedSize(240, 144)
+        self._preview.setAlignment(QtCore.Qt.AlignTop)
+        table_layout = QHBoxLayout()
+        table_layout.addWidget(view)
+        table_layout.addWidget(self._preview, 0, QtCore.Qt.AlignTop)
+
+        layout.insertLayout(position, filter_layout)
+        layout.insertLayout(position + 1, table_layout)
+        view.setModel(self._proxy)
+        view.selectionModel().currentChanged.connect(self._show_preview)
+        view.setMouseTracking(True)
+        view.entered.connect(self._show_preview)
+        self._filter_column.setVisible(False)
+        self._filter_edit.setVisible(False)
+        self._preview.setVisible(False)
+
+    def _large_delivery_rows(self):
+        from .api.probe import get_config_value
+        return int(get_config_value('ui.large_delivery_rows', 1000))
+
+    def _set_large_mode(self, enabled):
+        """
+        대용량 모드: 썸네일 없이 낮은 행 높이, fetchMore 페이지, 헤더 정렬, 필터, 미리보기 패널
+        """
+        from .api.probe import get_config_value
+        model = self._source_model()
+        view = self.ui.seq_model_view
+        self._large_mode = enabled
+        model.compact = enabled
+        if enabled:
+            print(f"[PROGRESS] Large delivery mode ({len(model.store)} rows)")
+            model.set_paging(int(get_config_value('ui.page_size', 200)))
+            view.verticalHeader().setDefaultSectionSize(int(get_config_value('ui.compact_row_height', 24)))
+            view.horizontalHeader().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+        else:
+            model.set_paging(None)
+            view.verticalHeader().setDefaultSectionSize(144)
+        view.setColumnHidden(MODEL_KEYS['thumbnail'], enabled)
+        view.setSortingEnabled(enabled)
+        self._filter_column.setVisible(enabled)
+        self._filter_edit.setVisible(enabled)
+        self._preview.setVisible(enabled)
+        if not enabled:
+            self._filter_edit.clear()
+            self._proxy.sort(-1)
+
+    def _apply_filter(self):
+        col = self._filter_column.itemData(self._filter_column.currentIndex())
+        self._proxy.set_filter(col, self._filter_edit.text())
+
+    def _show_preview(self, index, previous=None):
+        if not self._large_mode or not index.isValid():
+            return
+        model = self._source_model()
+        row = self._proxy.mapToSource(index).row()
+        self._preview_path = model.store.value(row, MODEL_KEYS['thumbnail'])
+        pixmap = model.thumbnail_pixmap(row)
+        if pixmap is None:
+            self._preview.clear()
+        else:
+            self._preview.setPixmap(pixmap)
+
+    def _on_preview_ready(self, thumbnail_file):
+        if self._large_mode and thumbnail_file == self._preview_path:
+            self._show_preview(self.ui.seq_model_view.currentIndex())
+
+    def _start_ingest(self, path, model):
+        """스캔 폴더 프로브를 백그라운드로 실행하고 행이 끝나는 대로 모델에 추가"""
+        thread = QtCore.QThread(self)
+        worker = ingest.IngestWorker(path)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.rows_ready.connect(model.append_rows)
+        worker.progress.connect(self._on_ingest_progress)
+        worker.failed.connect(self._on_ingest_failed)
+        worker.finished.connect(self._on_ingest_finished)
+        # closeEvent 의 wait() 가 GUI 스레드를 막고 있어도 스레드가 끝나도록 워커 스레드에서 바로 quit
+        worker.finished.connect(thread.quit, QtCore.Qt.DirectConnection)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._ingest_thread = thread
+        self._ingest_worker = worker
+        self._ingest_model = model
+        thread.start()
+
+    def _stop_ingest(self):
+        """
+        진행 중인 ingest 를 중단합니다 (기다리지 않음).
+
+        이전 워커의 시그널은 끊고, 이미 큐에 들어간 시그널은 _is_current_ingest() 로 버립니다.
+        스레드는 프로브 중인 시퀀스가 끝나면 스스로 종료하고 deleteLater 로 정리됩니다.
+        """
+        worker = self._ingest_worker
+        if worker is not None:
+            for signal, slot in [(worker.rows_ready, self._ingest_model.append_rows),
+                                 (worker.progress, self._on_ingest_progress),
+                                 (worker.failed, self._on_ingest_failed),
+                                 (worker.finished, self._on_ingest_finished)]:
+                signal.disconnect(slot)
+            worker.cancel()
+        self._ingest_worker = None
+        self._ingest_thread = None
+        self._ingest_model = None
+
+    def _is_current_ingest(self):
+        """시그널을 보낸 워커가 지금 ingest 중인 워커인지 (중단한 워커의 늦은 시그널 무시)"""
+        return self.sender() is self._ingest_worker
+
+    def _on_thumbnail_ready(self, thumbnail_file):
+        model = self._source_model()
+        if isinstance(model, SeqTableModel):
+            model.refresh_thumbnail(thumbnail_file)
+
+    def _on_lazy_resolved(self, row_data, values):
+        model = self._source_model()
+        if isinstance(model, SeqTableModel):
+            model.apply_lazy_values(row_data, values)
+
+    def _on_ingest_progress(self, done, total):
+        if not self._is_current_ingest():
+            return
+        self.ui.excel_file_label.setText("Scanning... %d / %d" % (done, total))
+        if not self._large_mode and total >= self._large_delivery_rows():
+            self._set_large_mode(True)
+
+    def _on_ingest_failed(self, message):
+        if not self._is_current_ingest():
+            return
+        print(f"ERROR: Ingest failed: {message}")
+        self.ui.excel_file_label.setText("Scan failed: %s" % message)
+
+    def _on_ingest_finished(self):
+        if not self._is_current_ingest():
+            return
+        model = self._source_model()
+        rows = len(model.store) if model else 0
+        print(f"[PROGRESS] Ingest finished, {rows} rows")
+        if not self.ui.excel_file_label.text().startswith("Scan failed"):
+            self.ui.excel_file_label.setText("No Saved Status")
+        # 워커/스레드는 thread.finished 의 deleteLater 로 정리됨
+        self._ingest_worker = None
+        self._ingest_thread = None
+        self._ingest_model = None
+
     def _save_excel(self):
 
         path = self.ui.lineEdit.text()
-        excel_writer = excel.ExcelWriteModel(path)
-        excel_writer.write_model_to_excel(self.ui.seq_model_view.model())
-        self.ui.excel_file_label.setText(excel.ExcelWriteModel.get_last_excel_file(path))
+        model = self._source_model()
+        if not isinstance(model, SeqTableModel):
+            return
+        # 지연 컬럼은 저장 워커에서 채움 (ScanlistSnapshot.resolve_lazy)
+        snapshot = excel.ScanlistSnapshot.from_model(model)
+        self.ui.excel_file_label.setText("Saving...")
+        self._saver.save(path, snapshot)
+
+    def _on_save_progress(self, done, total):
+        self.ui.excel_file_label.setText("Saving... %d / %d" % (done, total))
+
+    def _on_save_finished(self, excel_file):
+        self.ui.excel_file_label.setText(excel_file)
         self.ui.edit_excel.setEnabled(True)
 
+    def _on_save_failed(self, message):
+        print(f"ERROR: Save failed: {message}")
+        self.ui.excel_file_label.setText("Save failed: %s" % message)
+
+    def closeEvent(self, event):
+        # 저장 스레드가 끝나기 전에 창이 닫히면 scanlist/상태 파일이 만들어지지 않으므로 기다림
+        if self._saver.busy:
+            print("[PROGRESS] Waiting for scanlist save to finish before closing...")
+            self.ui.excel_file_label.setText("Saving... (closing)")
+        self._saver.wait()
+
+        # ingest 는 중단하고 프로브 중인 시퀀스가 끝날 때까지만 기다림
+        thread = self._ingest_thread
+        self._stop_ingest()
+        if thread is not None:
+            thread.wait()
+
+        self._close_background_helpers()
+        QWidget.closeEvent(self, event)
+
     def _publish(self):
-        model = self.ui.seq_model_view.model()
+        model = self._source_model()
+        self._resolve_checked(model)
         colorspace = str(self.ui.colorspace_combo.currentText())
         group_model = OrderedDict()
-        for row in range(0, model.rowCount(None)):
+        for row in range(0, len(model.store)):
             index = model.createIndex(row, 0)
             check = model.data(index, QtCore.Qt.CheckStateRole)
             if check == QtCore.Qt.CheckState.Checked:
@@ -352,7 +583,7 @@ class AppDialog(QWidget):
 
     def _collect(self):
         """Collect 작업을 수행합니다."""
-        model = self.ui.seq_model_view.model()
+        model = self._source_model()
         colorspace = str(self.ui.colorspace_combo.currentText())
 
         # 프로젝트 경로 가져오기
@@ -369,9 +600,11 @@ class AppDialog(QWidget):
         if not collect_path:
             return
 
+        self._resolve_checked(model)
+
         group_model = OrderedDict()
         shot_group_model = OrderedDict()
-        for row in range(0, model.rowCount(None)):
+        for row in range(0, len(model.store)):
 
             index = model.createIndex(row, 0)
             check = model.data(index, QtCore.Qt.CheckStateRole)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+썸네일 QPixmap 캐시
+
+SeqTableModel 이 그릴 썸네일을 QThreadPool 에서 읽고 줄인 뒤(QImage)
+GUI 스레드에서 QPixmap 으로 바꿔 LRU 로 보관합니다.
+아직 읽지 않은 썸네일은 placeholder 를 돌려주고, 다 읽으면 ready 시그널을 보냅니다.
+"""
+
+import os
+from collections import OrderedDict
+
+# Qt 호환성 레이어 사용
+from ..utils.qt_compat import QtCore, QtGui, Signal
+from ..api.probe import get_config_value
+
+
+PIXMAP_SIZE = (240, 144)
+DEFAULT_CACHE_SIZE = 512
+
+
+class _ImageLoadTask(QtCore.QRunnable):
+    """썸네일 JPEG 하나를 읽어서 PIXMAP_SIZE 로 줄임 (QImage 는 스레드에서 사용 가능)"""
+
+    def __init__(self, cache, path, size):
+        QtCore.QRunnable.__init__(self)
+        self.cache = cache
+        self.path = path
+        self.size = size
+
+    def run(self):
+        image = QtGui.QImage()
+        if image.load(self.path):
+            image = image.scaled(self.size[0], self.size[1],
+                                 QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        else:
+            image = None
+        self.cache._loaded.emit(self.path, image)
+
+
+class PixmapCache(QtCore.QObject):
+    """
+    썸네일 경로 → QPixmap LRU 캐시
+
+    사용법:
+        cache = PixmapCache(parent=model)
+        cache.ready.connect(model._on_pixmap_ready)
+        pixmap = cache.get(path)    # 없으면 읽기를 예약하고 placeholder 반환
+    """
+
+    ready = Signal(str)
+    _loaded = Signal(str, object)
+
+    def __init__(self, max_entries=None, size=PIXMAP_SIZE, parent=None):
+        QtCore.QObject.__init__(self, parent)
+        if max_entries is None:
+            max_entries = get_config_value('thumbnail.pixmap_cache_size', DEFAULT_CACHE_SIZE)
+        self.max_entries = max(1, int(max_entries))
+        self.size = size
+        self._entries = OrderedDict()
+        self._pending = set()
+        self._failed = set()
+        self._placeholder = None
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, int(get_config_value('thumbnail.workers', 4)) // 2))
+        self._loaded.connect(self._on_loaded)
+
+    @property
+    def placeholder(self):
+        if self._placeholder is None:
+            self._placeholder = QtGui.QPixmap(self.size[0], self.size[1])
+            self._placeholder.fill(QtGui.QColor(48, 48, 48))
+        return self._placeholder
+
+    def get(self, path):
+        """
+        Args:
+            path: 썸네일 파일 경로
+
+        Returns:
+            QPixmap (캐시 또는 placeholder) 또는 None (파일이 없거나 읽지 못했을 때)
+        """
+        pixmap = self._entries.get(path)
+        if pixmap is not None:
+            self._entries.move_to_end(path)
+            return pixmap
+        if path in self._failed:
+            return None
+        if path not in self._pending:
+            if not os.path.exists(path):
+                return None
+            self._pending.add(path)
+            self._pool.start(_ImageLoadTask(self, path, self.size))
+        return self.placeholder
+
+    def invalidate(self, path):
+        """썸네일 파일이 다시 만들어졌을 때 캐시를 버림"""
+        self._entries.pop(path, None)
+        self._failed.discard(path)
+
+    def clear(self):
+        self._entries.clear()
+        self._failed.clear()
+
+    def _on_loaded(self, path, image):
+        self._pending.discard(path)
+        if image is None:
+            self._failed.add(path)
+            return
+        self._entries[path] = QtGui.QPixmap.fromImage(image)
+        self._entries.move_to_end(path)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self.ready.emit(path)
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+SeqTableModel 행 저장소
+
+행마다 list + QCheckBox 위젯을 두지 않고
+- 행 값은 MODEL_KEYS 이름의 __slots__ 를 가진 SeqRecord
+- check 컬럼은 RowStore 의 비트 배열
+- 프레임/프레임레이트 컬럼은 int/float 로 저장
+합니다. QWidget 을 만들지 않으므로 GUI 스레드가 아닌 곳에서도 읽을 수 있습니다.
+
+SeqTableModel, ExcelWriteModel(ScanlistSnapshot), Validate, MasterInput 이
+모두 model.store 를 통해 값을 읽습니다.
+"""
+
+from ..api.constant import MODEL_KEYS, LAZY_KEYS, LAZY_VALUE
+
+
+_COLUMNS = sorted(MODEL_KEYS.items(), key=lambda item: item[1])
+_FIELDS = tuple(key for key, _ in _COLUMNS)
+_CHECK = MODEL_KEYS['check']
+_THUMBNAIL = MODEL_KEYS['thumbnail']
+
+# 숫자 컬럼 타입 (값이 같은 문자열로 되돌아올 때만 변환하므로 화면 표시는 그대로)
+COLUMN_TYPES = {
+    'start_frame': int,
+    'end_frame': int,
+    'duration': int,
+    'retime_duration': int,
+    'retime_start_frame': int,
+    'just_in': int,
+    'just_out': int,
+    'retime_percent': float,
+    'framerate': float,
+}
+_TYPES = tuple(COLUMN_TYPES.get(key) for key in _FIELDS)
+
+
+def _coerce(value, value_type):
+    if value_type is None or not isinstance(value, str):
+        return value
+    try:
+        converted = value_type(value)
+    except ValueError:
+        return value
+    if str(converted) != value:
+        return value
+    return converted
+
+
+def to_text(value):
+    """DisplayRole 문자열 (None → "")"""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+class SeqRecord(object):
+    """
+    모델 행 하나
+
+    record[col] / record[col] = value 로 MODEL_KEYS 컬럼 번호를 사용할 수 있고
+    (excel.resolve_lazy_row 등), record.framerate 처럼 이름으로도 읽을 수 있습니다.
+    check 컬럼은 RowStore 가 가지고 있으므로 record[0] 은 항상 None 입니다.
+    """
+
+    __slots__ = _FIELDS[1:] + ('seq',)
+
+    def __init__(self, values, seq=None):
+        self.seq = seq
+        for col in range(1, len(_FIELDS)):
+            value = values[col] if col < len(values) else None
+            setattr(self, _FIELDS[col], _coerce(value, _TYPES[col]))
+
+    def __len__(self):
+        return len(_FIELDS)
+
+    def __getitem__(self, col):
+        if col == _CHECK:
+            return None
+        return getattr(self, _FIELDS[col])
+
+    def __setitem__(self, col, value):
+        if col == _CHECK:
+            raise IndexError("check column is stored in RowStore")
+        setattr(self, _FIELDS[col], _coerce(value, _TYPES[col]))
+
+    def is_lazy(self):
+        return self.seq is not None and any(getattr(self, key) == LAZY_VALUE for key in LAZY_KEYS)
+
+
+class RowStore(object):
+    """
+    SeqRecord 목록 + check 비트 배열
+
+    사용법:
+        store = RowStore(rows)          # rows: [[check, thumbnail, ...]]
+        store.is_checked(row)
+        store.value(row, MODEL_KEYS['framerate'])
+        store.text(row, col)            # 화면/엑셀에 쓰는 문자열
+        store.thumbnail_rows(path)      # 썸네일 경로 → 행 번호 목록
+    """
+
+    def __init__(self, rows=None):
+        self.records = []
+        self._checks = bytearray()
+        self._index = {}
+        self._thumbnails = {}
+        if rows:
+            self.append_rows(rows)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, row):
+        return self.records[row]
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def append_rows(self, rows):
+        """
+        Args:
+            rows: [[check(bool/None), thumbnail, ...]] — excel.SeqRow 의 seq 도 함께 보관
+        """
+        for values in rows:
+            row = len(self.records)
+            record = SeqRecord(values, getattr(values, 'seq', None))
+            self.records.append(record)
+            self._index[id(record)] = row
+            self._add_thumbnail(record[_THUMBNAIL], row)
+            if row % 8 == 0:
+                self._checks.append(0)
+            self.set_checked(row, bool(values[_CHECK]) if len(values) else False)
+
+    def _add_thumbnail(self, path, row):
+        if path:
+            self._thumbnails.setdefault(path, []).append(row)
+
+    def _remove_thumbnail(self, path, row):
+        rows = self._thumbnails.get(path)
+        if rows and row in rows:
+            rows.remove(row)
+            if not rows:
+                del self._thumbnails[path]
+
+    def thumbnail_rows(self, path):
+        """썸네일 경로를 쓰는 행 번호 목록 (MOV 이벤트는 여러 행이 같은 파일을 쓸 수 있음)"""
+        return list(self._thumbnails.get(path, ()))
+
+    def row_of(self, record):
+        """record 의 행 번호 (없으면 None)"""
+        return self._index.get(id(record))
+
+    def is_checked(self, row):
+        return bool(self._checks[row >> 3] & (1 << (row & 7)))
+
+    def set_checked(self, row, checked):
+        if checked:
+            self._checks[row >> 3] |= 1 << (row & 7)
+        else:
+            self._checks[row >> 3] &= ~(1 << (row & 7)) & 0xff
+
+    def checked_rows(self):
+        return [row for row in range(len(self.records)) if self.is_checked(row)]
+
+    def value(self, row, col):
+        if col == _CHECK:
+            return self.is_checked(row)
+        return self.records[row][col]
+
+    def set_value(self, row, col, value):
+        if col == _CHECK:
+            self.set_checked(row, bool(value))
+            return
+        if col == _THUMBNAIL:
+            self._remove_thumbnail(self.records[row][col], row)
+            self._add_thumbnail(value, row)
+        self.records[row][col] = value
+
+    def text(self, row, col):
+        return to_text(self.records[row][col])
+
+    def row_values(self, row):
+        """[check(bool), thumbnail, ...] 목록 (저장/스냅샷용)"""
+        record = self.records[row]
+        values = [record[col] for col in range(len(_FIELDS))]
+        values[_CHECK] = self.is_checked(row)
+        return values
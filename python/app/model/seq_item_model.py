@@ -1,22 +1,191 @@
 # Qt 호환성 레이어 사용
 from ..utils.qt_compat import QtCore, QtGui
 from ..api.constant import *
+from .pixmap_cache import PixmapCache
+from .row_store import RowStore, to_text
 import os
 import sys
+from contextlib import contextmanager
+
+def _sort_value(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value, "")
+    return (1, 0, to_text(value).lower())
+
 
 class SeqTableModel(QtCore.QAbstractTableModel):
 
     def __init__(self,array ,parent=None, *args):
 
         QtCore.QAbstractTableModel.__init__(self, parent, *args)
-        self.arraydata = array
+        self.store = RowStore(array)
         self.header = list(MODEL_KEYS.keys())
+        self._lazy_loader = None
+        self._batch_depth = 0
+        self._batch_range = None
+        self._pixmap_cache = PixmapCache(parent=self)
+        self._pixmap_cache.ready.connect(self._emit_thumbnail_changed)
+        # 대용량 모드: 썸네일 없이 텍스트만, page_size 행씩 fetchMore 로 노출
+        self.compact = False
+        self._page_size = None
+        self._loaded = len(self.store)
+        self._keys = {}
+
+    @property
+    def pixmap_cache(self):
+        return self._pixmap_cache
+
+    @property
+    def arraydata(self):
+        """이전 이름 호환용 (SeqRecord 목록)"""
+        return self.store
+
+    def set_lazy_loader(self, loader):
+        """지연 컬럼을 채울 ingest.LazyMetadataLoader 를 지정합니다."""
+        self._lazy_loader = loader
+
+    def _request_lazy(self, row):
+        if self._lazy_loader is not None:
+            self._lazy_loader.request(self.store[row])
+
+    def apply_lazy_values(self, row_data, values):
+        """
+        LazyMetadataLoader 가 계산한 값을 행에 넣고 바뀐 구간만 다시 그리도록 알림
+
+        Args:
+            row_data: 계산을 요청한 행 객체 (SeqRecord)
+            values: {컬럼 인덱스: 값}
+        """
+        if not values:
+            return
+        row = self.store.row_of(row_data)
+        if row is None:
+            return
+        for col, value in values.items():
+            self.store.set_value(row, col, value)
+        # just_in/just_out 을 top-left 로 보내지 않도록 범위로 알림 (dialog._set_timecode)
+        self._changed(row, min(values), row, max(values))
+
+    def resolve_lazy(self, rows=None):
+        """
+        지연 컬럼을 모두 채울 때까지 기다립니다 (Validate/Publish/저장 직전).
+
+        Args:
+            rows: 행 번호 목록, None 이면 전체
+        """
+        if self._lazy_loader is None:
+            return
+        if rows is None:
+            rows = range(len(self.store))
+        targets = [self.store[row] for row in rows]
+        with self.batch():
+            for row_data, values in self._lazy_loader.resolve(targets):
+                self.apply_lazy_values(row_data, values)
 
     def rowCount(self, parent=QtCore.QModelIndex()):
-        return len(self.arraydata)
+        return self._loaded
 
     def columnCount(self, parent=QtCore.QModelIndex()):
-        return len(self.arraydata[0])
+        return len(self.header)
+
+    def set_paging(self, page_size):
+        """
+        뷰에 노출할 행을 page_size 단위로 나눕니다 (None 이면 전체 노출).
+
+        나머지 행은 뷰가 끝까지 스크롤될 때 fetchMore() 로 노출합니다.
+        Validate/Publish/저장은 노출 여부와 관계없이 store 전체를 사용합니다.
+        """
+        self.beginResetModel()
+        self._page_size = page_size
+        if page_size:
+            self._loaded = min(len(self.store), page_size)
+        else:
+            self._loaded = len(self.store)
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self.store)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return
+        self._expose(self._page_size or len(self.store))
+
+    def fetch_all(self):
+        """남은 행을 모두 노출합니다 (정렬/필터 전)."""
+        self._expose(len(self.store))
+
+    def _expose(self, count):
+        count = min(count, len(self.store) - self._loaded)
+        if count <= 0:
+            return
+        first = self._loaded
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def append_rows(self, rows):
+        """
+        Ingest 중에 프로브가 끝난 행을 뒤에 추가합니다.
+
+        check 컬럼이 None 이면 체크 해제 상태로 추가합니다.
+        페이지 모드에서는 첫 페이지가 찰 때까지만 바로 노출합니다.
+        """
+        if not rows:
+            return
+        self.store.append_rows(rows)
+        self._keys.clear()
+        if self._page_size:
+            self._expose(self._page_size - self._loaded)
+        else:
+            self._expose(len(rows))
+
+    def sort_keys(self, col):
+        """
+        컬럼 정렬 순위 목록 (store 행 번호 → int)
+
+        숫자 컬럼은 값, 나머지는 소문자 문자열 기준이며, 컬럼 값이 바뀌면 다시 계산합니다.
+        """
+        key = ('sort', col)
+        ranks = self._keys.get(key)
+        if ranks is None:
+            values = [self.store.value(row, col) for row in range(len(self.store))]
+            order = sorted(range(len(values)), key=lambda row: _sort_value(values[row]))
+            ranks = [0] * len(values)
+            for rank, row in enumerate(order):
+                ranks[row] = rank
+            self._keys[key] = ranks
+        return ranks
+
+    def filter_texts(self, col):
+        """컬럼 필터용 소문자 문자열 목록 (store 행 번호 순)"""
+        key = ('filter', col)
+        texts = self._keys.get(key)
+        if texts is None:
+            texts = [self.store.text(row, col).lower() for row in range(len(self.store))]
+            self._keys[key] = texts
+        return texts
+
+    def thumbnail_pixmap(self, row):
+        """미리보기 패널용 썸네일 (읽는 중이면 placeholder, pixmap_cache.ready 로 완료 알림)"""
+        thumbnail_path = self.store.value(row, MODEL_KEYS['thumbnail'])
+        if not thumbnail_path:
+            return None
+        return self._pixmap_cache.get(thumbnail_path)
+
+    def refresh_thumbnail(self, thumbnail_file):
+        """썸네일 파일이 새로 만들어지면 해당 행의 thumbnail 셀을 다시 그리도록 알림"""
+        self._pixmap_cache.invalidate(thumbnail_file)
+        self._emit_thumbnail_changed(thumbnail_file)
+
+    def _emit_thumbnail_changed(self, thumbnail_file):
+        col = MODEL_KEYS['thumbnail']
+        for row in self.store.thumbnail_rows(thumbnail_file):
+            if row < self._loaded:
+                index = self.createIndex(row, col)
+                self.dataChanged.emit(index, index)
 
     def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
         try:
@@ -43,39 +212,27 @@ class SeqTableModel(QtCore.QAbstractTableModel):
                     return None
                 if col == 1:
                     return None
-                val = self.arraydata[row][col]
-                if val is None:
-                    return ""
-                return str(val)
+                val = self.store.text(row, col)
+                if val == LAZY_VALUE:
+                    self._request_lazy(row)
+                return val
 
             elif role == QtCore.Qt.EditRole:
                 if col == 0:
                     return None
-                val = self.arraydata[row][col]
-                if val is None:
-                    return ""
-                return str(val)
+                return self.store.text(row, col)
 
             elif role == QtCore.Qt.CheckStateRole and col == 0:
-                checkbox = self.arraydata[row][col]
-                if checkbox.isChecked():
+                if self.store.is_checked(row):
                     return QtCore.Qt.Checked
                 else:
                     return QtCore.Qt.Unchecked
 
-            elif role == QtCore.Qt.DecorationRole and col == 1:
-                thumbnail_path = self.arraydata[row][col]
-                if thumbnail_path and os.path.exists(thumbnail_path):
-                    try:
-                        pixmap = QtGui.QPixmap(240,144)
-                        success = pixmap.load(thumbnail_path)
-                        if not success:
-                            return None
-                        pixmap = pixmap.scaled(240, 144)
-                        return pixmap
-                    except Exception as e:
-                        print(f"[DEBUG] data() - Thumbnail error: {e}", flush=True)
-                        return None
+            elif role == QtCore.Qt.DecorationRole and col == 1 and not self.compact:
+                thumbnail_path = self.store.value(row, col)
+                if thumbnail_path:
+                    # 캐시에 없으면 백그라운드로 읽고 그동안 placeholder 표시
+                    return self._pixmap_cache.get(thumbnail_path)
                 return None
 
             return None
@@ -95,10 +252,100 @@ class SeqTableModel(QtCore.QAbstractTableModel):
             return False
         if role == QtCore.Qt.CheckStateRole and index.column() == 0:
             if value == QtCore.Qt.Checked:
-                self.arraydata[index.row()][index.column()].setChecked(True)
+                self.store.set_checked(index.row(), True)
+                self._request_lazy(index.row())
             else:
-                self.arraydata[index.row()][index.column()].setChecked(False)
+                self.store.set_checked(index.row(), False)
+        else:
+
+            self.store.set_value(index.row(), index.column(), value)
+        self._changed(index.row(), index.column(), index.row(), index.column())
+        return True
+
+    @contextmanager
+    def batch(self):
+        """
+        여러 셀을 고칠 때 dataChanged 를 한 번만 보냅니다.
+
+        with 블록 안의 setData()/set_checked()/set_column() 은 값만 바꾸고,
+        블록이 끝나면 바뀐 셀을 모두 덮는 범위로 dataChanged 를 한 번 보냅니다.
+
+        사용법:
+            with model.batch():
+                for row in rows:
+                    model.setData(model.createIndex(row, col), value, QtCore.Qt.EditRole)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_range is not None:
+                batch_range = self._batch_range
+                self._batch_range = None
+                self._emit_changed(*batch_range)
+
+    def _emit_changed(self, top, left, bottom, right):
+        # 아직 노출하지 않은 행은 뷰에 알리지 않음 (fetchMore 때 새로 그림)
+        bottom = min(bottom, self._loaded - 1)
+        if top > bottom:
+            return
+        self.dataChanged.emit(self.createIndex(top, left), self.createIndex(bottom, right))
+
+    def _changed(self, top, left, bottom, right):
+        for key in [key for key in self._keys if left <= key[1] <= right]:
+            del self._keys[key]
+        if self._batch_depth == 0:
+            self._emit_changed(top, left, bottom, right)
+            return
+        if self._batch_range is None:
+            self._batch_range = (top, left, bottom, right)
         else:
+            old = self._batch_range
+            self._batch_range = (min(old[0], top), min(old[1], left), max(old[2], bottom), max(old[3], right))
+
+    def set_checked(self, rows, checked):
+        """
+        여러 행의 check 를 한 번에 바꿉니다 (dataChanged 한 번).
+
+        Args:
+            rows: 행 번호 목록
+            checked: True/False
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        for row in rows:
+            self.store.set_checked(row, checked)
+            if checked:
+                self._request_lazy(row)
+        self._changed(min(rows), 0, max(rows), 0)
+
+    def set_record_values(self, items):
+        """
+        백그라운드에서 계산한 값을 행 객체 기준으로 넣습니다 (dataChanged 한 번).
+
+        Args:
+            items: [(SeqRecord, 컬럼, 값)] — 모델에 없는 행은 건너뜀
+        """
+        with self.batch():
+            for record, col, value in items:
+                row = self.store.row_of(record)
+                if row is None:
+                    continue
+                self.store.set_value(row, col, value)
+                self._changed(row, col, row, col)
+
+    def set_column(self, col, values):
+        """
+        한 컬럼의 여러 행 값을 한 번에 바꿉니다 (dataChanged 한 번).
 
-            self.arraydata[index.row()][index.column()] = value
-        self.dataChanged.emit(index, index)
+        Args:
+            col: 컬럼 번호 (MODEL_KEYS)
+            values: {행 번호: 값}
+        """
+        if not values:
+            return
+        for row, value in values.items():
+            self.store.set_value(row, col, value)
+        self._changed(min(values), col, max(values), col)
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+대용량 모드 정렬/필터 프록시
+
+SeqTableModel.sort_keys() / filter_texts() 에 미리 계산해 둔 값으로
+보여줄 행 순서(store 행 번호 목록)를 한 번에 만듭니다.
+
+QSortFilterProxyModel 은 비교할 때마다 Python lessThan() 을 부르므로
+5,000 행 정렬에 약 60,000 번 호출(0.3 초)이 들지만, 여기서는 sorted() 한 번으로
+순서를 만들고 mapToSource/mapFromSource 는 배열 조회만 합니다.
+"""
+
+# Qt 호환성 레이어 사용
+from ..utils.qt_compat import QtCore
+
+
+class SeqSortFilterProxyModel(QtCore.QAbstractProxyModel):
+    """
+    사용법:
+        proxy = SeqSortFilterProxyModel()
+        proxy.setSourceModel(model)
+        proxy.sort(MODEL_KEYS['shot_name'])
+        proxy.set_filter(MODEL_KEYS['type'], "src")
+    """
+
+    def __init__(self, parent=None):
+        QtCore.QAbstractProxyModel.__init__(self, parent)
+        self._rows = []             # proxy 행 → source 행
+        self._positions = {}        # source 행 → proxy 행
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.AscendingOrder
+        self._filter_col = None
+        self._filter_text = ""
+        self._connections = []
+
+    # ------------------------------------------------------------------
+    # 소스 모델 연결
+
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            for signal, slot in self._connections:
+                signal.disconnect(slot)
+        self._connections = []
+        self.beginResetModel()
+        QtCore.QAbstractProxyModel.setSourceModel(self, model)
+        self._sort_column = -1
+        self._filter_text = ""
+        if model is not None:
+            self._connections = [
+                (model.dataChanged, self._on_data_changed),
+                (model.rowsInserted, self._on_rows_inserted),
+                (model.modelReset, self._on_model_reset),
+                (model.headerDataChanged, self.headerDataChanged.emit),
+            ]
+            for signal, slot in self._connections:
+                signal.connect(slot)
+        self._build()
+        self.endResetModel()
+
+    @property
+    def _identity(self):
+        return self._sort_column < 0 and not self._filter_text
+
+    def _build(self):
+        model = self.sourceModel()
+        rows = list(range(model.rowCount())) if model is not None else []
+        if model is not None and self._filter_text:
+            texts = model.filter_texts(self._filter_col)
+            rows = [row for row in rows if self._filter_text in texts[row]]
+        if model is not None and self._sort_column >= 0:
+            keys = model.sort_keys(self._sort_column)
+            rows.sort(key=keys.__getitem__, reverse=self._sort_order == QtCore.Qt.DescendingOrder)
+        self._rows = rows
+        self._positions = dict((row, position) for position, row in enumerate(rows))
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        positions = [self._positions[row] for row in range(top_left.row(), bottom_right.row() + 1)
+                     if row in self._positions]
+        if positions:
+            self.dataChanged.emit(self.index(min(positions), top_left.column()),
+                                  self.index(max(positions), bottom_right.column()))
+
+    def _on_rows_inserted(self, parent, first, last):
+        if self._identity:
+            self.beginInsertRows(QtCore.QModelIndex(), first, last)
+            self._build()
+            self.endInsertRows()
+        else:
+            self.beginResetModel()
+            self._build()
+            self.endResetModel()
+
+    def _on_model_reset(self):
+        self.beginResetModel()
+        self._build()
+        self.endResetModel()
+
+    # ------------------------------------------------------------------
+    # 정렬 / 필터
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        model = self.sourceModel()
+        if model is None:
+            return
+        if column >= 0:
+            # 아직 노출하지 않은 페이지까지 정렬 대상에 포함
+            model.fetch_all()
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self.mapToSource(index) for index in persistent]
+        self._sort_column = column
+        self._sort_order = order
+        self._build()
+        self.changePersistentIndexList(persistent, [self.mapFromSource(index) for index in sources])
+        self.layoutChanged.emit()
+
+    def set_filter(self, col, text):
+        """
+        Args:
+            col: 필터할 컬럼 (MODEL_KEYS)
+            text: 포함 검색어 (빈 문자열이면 필터 해제)
+        """
+        model = self.sourceModel()
+        if model is None:
+            return
+        self._filter_col = col
+        self._filter_text = text.strip().lower()
+        if self._filter_text:
+            model.fetch_all()
+        self.beginResetModel()
+        self._build()
+        self.endResetModel()
+
+    # ------------------------------------------------------------------
+    # QAbstractProxyModel
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._rows):
+            return QtCore.QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QtCore.QModelIndex()
+        position = self._positions.get(source_index.row())
+        if position is None:
+            return QtCore.QModelIndex()
+        return self.index(position, source_index.column())
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if parent.isValid() or row < 0 or row >= len(self._rows):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        if index is None:
+            return QtCore.QObject.parent(self)
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        model = self.sourceModel()
+        return model.columnCount() if model is not None else 0
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        model = self.sourceModel()
+        if model is None:
+            return None
+        if orientation == QtCore.Qt.Vertical:
+            return section + 1 if role == QtCore.Qt.DisplayRole else None
+        return model.headerData(section, orientation, role)
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        model = self.sourceModel()
+        return model is not None and model.canFetchMore(QtCore.QModelIndex())
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        model = self.sourceModel()
+        if model is not None:
+            model.fetchMore(QtCore.QModelIndex())
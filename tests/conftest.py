@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+공용 pytest fixture
+
+Qt 모델 테스트는 화면 없이 offscreen 플랫폼으로 실행합니다.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication (세션에서 하나)"""
+    from python.app.utils.qt_compat import QtWidgets
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
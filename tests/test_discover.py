@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+discover 테스트
+
+scan_directory 가 시퀀스와 MOV/MXF/EDL 을 나누는지, 대문자 확장자(.MOV/.MXF)도
+excel 에서 MOV 로 처리되는지, 프레임 패딩이 pyseq 와 같은지 확인합니다.
+"""
+
+import os
+
+import pytest
+
+from python.app.api import excel
+from python.app.api.discover import group_frames, scan_directory
+
+
+@pytest.fixture
+def scan_dir(tmp_path):
+    (tmp_path / "A.MOV").write_bytes(b"mov")
+    (tmp_path / "reel_01.edl").write_text("TITLE: A\n")
+    (tmp_path / "top.1001.exr").write_bytes(b"exr")
+    roll = tmp_path / "roll"
+    roll.mkdir()
+    (roll / "B.MXF").write_bytes(b"mxf")
+    (roll / "c.mov").write_bytes(b"mov")
+    for frame in (1001, 1002, 1003):
+        (roll / ("A001C003.%d.exr" % frame)).write_bytes(b"exr")
+    (roll / ".hidden.1001.exr").write_bytes(b"exr")
+    return tmp_path
+
+
+class FakeProbeCache(object):
+
+    def video_stream(self, path):
+        return {'codec_type': 'video', 'r_frame_rate': '24/1', 'width': 1920, 'height': 1080,
+                'nb_frames': '48', 'tags': {'timecode': '01:00:00:00'}}
+
+
+@pytest.mark.unit
+class TestScanDirectory:
+
+    def test_split(self, scan_dir):
+        result = scan_directory(str(scan_dir), depth=1, ignore=['.*'])
+        assert result.movs == [str(scan_dir / "A.MOV"), str(scan_dir / "roll" / "B.MXF"),
+                               str(scan_dir / "roll" / "c.mov")]
+        assert result.edls == [str(scan_dir / "reel_01.edl")]
+        # 최상위 이미지 파일은 시퀀스가 아님
+        assert [(seq.head(), seq.tail(), seq.start(), seq.end()) for seq in result.sequences] == [
+            ("A001C003.", ".exr", 1001, 1003)]
+
+    def test_depth(self, scan_dir):
+        result = scan_directory(str(scan_dir), depth=0, ignore=[])
+        assert result.movs == [str(scan_dir / "A.MOV")]
+        assert result.sequences == []
+
+
+@pytest.mark.unit
+class TestUppercaseMov:
+
+    def test_handled_as_mov(self, scan_dir, monkeypatch):
+        monkeypatch.setattr(excel, 'FFPROBE_CACHE', FakeProbeCache())
+        result = scan_directory(str(scan_dir), depth=1, ignore=['.*'])
+        movs = excel._get_movs(str(scan_dir), result.movs, result.edls)
+        assert [excel._get_ext(mov) for mov in movs] == ["mov", "mxf", "mov"]
+
+        key, signature = excel._get_index_key(movs[0])
+        assert key == str(scan_dir / "A.MOV")
+        assert signature.startswith("A.MOV:")
+
+        excel._number_mov_thumbnails(movs)
+        assert [mov.thumbnail_number for mov in movs] == [1, 1, 1]
+
+    def test_frame_ext(self, tmp_path):
+        sequences, _ = group_frames(str(tmp_path), ["A.1001.EXR", "A.1002.EXR"])
+        assert excel._get_frame_ext(sequences[0]) == "exr"
+
+
+@pytest.mark.unit
+class TestPadding:
+
+    @pytest.mark.parametrize("frames, pad", [
+        (["0998", "0999", "1000"], 4),
+        (["998", "999", "1000"], 0),
+        (["01", "02", "10"], 2),
+        (["7", "8", "9"], 0),
+    ])
+    def test_matches_pyseq(self, tmp_path, frames, pad):
+        names = ["A." + frame + ".exr" for frame in frames]
+        sequences, _ = group_frames(str(tmp_path), names)
+        assert len(sequences) == 1
+        assert sequences[0].format("%p") == ("%%0%dd" % pad if pad else "%d")
+
+    def test_same_as_pyseq(self, tmp_path):
+        pyseq = pytest.importorskip("pyseq")
+        names = ["B.%d.dpx" % frame for frame in (8, 9, 10, 11)] + ["C.%04d.exr" % frame for frame in (1, 2)]
+        for name in names:
+            (tmp_path / name).write_bytes(b"")
+        ours = sorted((seq.head(), seq.format("%p"), seq.start(), seq.end())
+                      for seq in group_frames(str(tmp_path), names)[0])
+        theirs = sorted((seq.head(), seq.format("%p"), seq.start(), seq.end())
+                        for seq in pyseq.get_sequences(str(tmp_path)))
+        assert ours == theirs
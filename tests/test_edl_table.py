@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+edl_table 테스트
+
+CMX3600 EDL 의 M2 리타임, 디졸브 이벤트 병합, FROM/TO CLIP NAME, drop-frame 타임코드,
+master_frame 을 확인합니다.
+"""
+
+import os
+
+import pytest
+
+from python.app.api.edl_table import CUT_TABLE_CACHE, parse_edl
+
+
+EDL_TEXT = """TITLE: REEL_01
+FCM: NON-DROP FRAME
+
+001  A001C003 V     C        01:00:10:00 01:00:12:00 01:00:00:00 01:00:02:00
+* FROM CLIP NAME: A001C003.mov
+M2   A001C003       048.0                01:00:10:00
+
+002  A001C003 V     C        01:00:12:00 01:00:12:00 01:00:02:00 01:00:02:00
+002  B002C001 V     D    024 02:00:00:00 02:00:03:00 01:00:02:00 01:00:05:00
+* FROM CLIP NAME: A001C003.mov
+* TO CLIP NAME: B002C001.mov
+
+003  C003C007 V     C        03:00:00:00 03:00:01:12 01:00:05:00 01:00:06:12
+* FROM CLIP NAME: C003C007.mov
+"""
+
+
+@pytest.fixture
+def edl_file(tmp_path):
+    path = tmp_path / "reel_01.edl"
+    path.write_text(EDL_TEXT)
+    return str(path)
+
+
+@pytest.mark.unit
+class TestParseEdl:
+
+    def test_events(self, edl_file):
+        table = parse_edl(edl_file, 24)
+        assert table.title == "REEL_01"
+        assert [event.number for event in table] == [1, 2, 3]
+        first = table[0]
+        assert (first.reel, first.clip_name) == ("A001C003", "A001C003.mov")
+        assert (first.src_start_tc, first.rec_end_tc) == ("01:00:10:00", "01:00:02:00")
+        assert first.duration == 48
+
+    def test_m2_retime(self, edl_file):
+        table = parse_edl(edl_file, 24)
+        assert table[0].m2_retime == 48.0
+        assert table[1].m2_retime is None
+
+    def test_dissolve_merged(self, edl_file):
+        event = parse_edl(edl_file, 24)[1]
+        assert (event.reel, event.transition) == ("B002C001", "D")
+        assert event.clip_name == "B002C001.mov"
+        assert (event.src_start_tc, event.src_end_tc) == ("02:00:00:00", "02:00:03:00")
+        assert (event.rec_start_tc, event.rec_end_tc) == ("01:00:02:00", "01:00:05:00")
+        assert event.duration == 72
+
+    def test_frames(self, edl_file):
+        event = parse_edl(edl_file, 24)[2]
+        assert event.src_start == 3 * 3600 * 24
+        assert event.src_end - event.src_start == 36
+
+    def test_master_frame(self, tmp_path, edl_file):
+        assert parse_edl(edl_file, 24).master_frame == 86400
+        path = tmp_path / "zero.edl"
+        path.write_text("001  AX       V     C        00:00:00:00 00:00:01:00 00:00:10:00 00:00:11:00\n")
+        table = parse_edl(str(path), 24)
+        assert len(table) == 1 and table.master_frame == 0
+        path.write_text("")
+        assert parse_edl(str(path), 24).master_frame == 0
+
+
+@pytest.mark.unit
+class TestDropFrame:
+
+    def test_drop_frame_events(self, tmp_path):
+        path = tmp_path / "df.edl"
+        path.write_text("FCM: DROP FRAME\n"
+                        "001  A001C003 V     C        00:00:59;28 00:01:00;02 01:00:00;00 01:00:00;02\n")
+        event = parse_edl(str(path), 30)[0]
+        assert event.src_end - event.src_start == 2
+        assert (event.src_start_tc, event.src_end_tc) == ("00:00:59;28", "00:01:00;02")
+        assert event.rec_start == 107892
+        assert event.rec_end_tc == "01:00:00;02"
+
+    def test_non_drop_rate(self, tmp_path):
+        path = tmp_path / "ndf.edl"
+        path.write_text("001  A001C003 V     C        00:00:59;23 00:01:00;01 01:00:00;00 01:00:00;02\n")
+        event = parse_edl(str(path), 24)[0]
+        assert event.src_end - event.src_start == 2
+        assert (event.src_start_tc, event.src_end_tc) == ("00:00:59:23", "00:01:00:01")
+
+
+@pytest.mark.unit
+def test_cut_table_cache(edl_file):
+    CUT_TABLE_CACHE.clear()
+    table = CUT_TABLE_CACHE.get(edl_file, 24)
+    assert CUT_TABLE_CACHE.get(edl_file, 24) is table
+    assert CUT_TABLE_CACHE.get(edl_file, 25) is not table
+
+    # 파일이 바뀌면 다시 읽음
+    with open(edl_file, 'a') as f:
+        f.write("004  D004     V     C        04:00:00:00 04:00:01:00 01:00:06:12 01:00:07:12\n")
+    os.utime(edl_file, ns=(0, os.stat(edl_file).st_mtime_ns + 1000000000))
+    assert len(CUT_TABLE_CACHE.get(edl_file, 24)) == 4
+    CUT_TABLE_CACHE.clear()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+excel._get_time_code_out 테스트
+
+derive 모드에서 timecode_samples 설정에 따라 읽는 프레임과 결과를 확인합니다.
+프레임 헤더 읽기(_get_time_code)는 읽은 프레임을 기록하는 함수로 바꿔서 실행합니다.
+"""
+
+import pytest
+
+from python.app.api import excel
+from python.app.api.discover import FrameSequence
+from python.app.api.timecode_math import offset_timecode
+
+
+START, END = 1001, 1100
+
+
+class FrameReads(list):
+    """읽은 프레임 번호 목록 (broken: 다른 타임코드를 돌려줄 프레임)"""
+
+    def __init__(self):
+        list.__init__(self)
+        self.broken = {}
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    frames = FrameReads()
+
+    def get_time_code(seq, frame):
+        frames.append(frame)
+        if frame in frames.broken:
+            return frames.broken[frame]
+        return offset_timecode("01:00:00:00", frame - START, 24)
+    monkeypatch.setattr(excel, '_get_time_code', get_time_code)
+    return frames
+
+
+def configure(monkeypatch, values):
+    values = dict({'ingest.timecode_out': 'derive'}, **values)
+    monkeypatch.setattr(excel, 'get_config_value', lambda key, default=None: values.get(key, default))
+
+
+@pytest.fixture
+def seq(tmp_path):
+    return FrameSequence(str(tmp_path), "A001C003.", ".exr", range(START, END + 1), 4)
+
+
+@pytest.mark.unit
+class TestTimecodeOut:
+
+    def test_default_reads_no_frame(self, monkeypatch, reads, seq):
+        configure(monkeypatch, {})
+        assert excel._get_time_code_out(seq, START, END, "01:00:00:00", 24.0) == ("01:00:04:03", False)
+        assert reads == []
+
+    def test_tail_check_opt_in(self, monkeypatch, reads, seq):
+        configure(monkeypatch, {'ingest.timecode_samples': 2})
+        assert excel._get_time_code_out(seq, START, END, "01:00:00:00", 24.0) == ("01:00:04:03", False)
+        assert reads == [END]
+
+    def test_discontinuity(self, monkeypatch, reads, seq):
+        configure(monkeypatch, {'ingest.timecode_samples': 3})
+        reads.broken[END] = "02:00:00:00"
+        assert excel._get_time_code_out(seq, START, END, "01:00:00:00", 24.0) == ("02:00:00:00", True)
+        assert reads == [END]
+
+    def test_middle_samples(self, monkeypatch, reads, seq):
+        configure(monkeypatch, {'ingest.timecode_samples': 4})
+        excel._get_time_code_out(seq, START, END, "01:00:00:00", 24.0)
+        assert reads[0] == END and len(reads) == 3 and all(START < frame < END for frame in reads[1:])
+
+    def test_read_mode(self, monkeypatch, reads, seq):
+        configure(monkeypatch, {'ingest.timecode_out': 'read'})
+        excel._get_time_code_out(seq, START, END, "01:00:00:00", 24.0)
+        assert reads == [END]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+ffprobe_cache 테스트
+
+(path, size, mtime) 키로 ffprobe 를 한 번만 실행하고, 파일이 바뀌면 다시 실행하는지 확인합니다.
+ffmpeg.probe 는 호출을 기록하는 함수로 바꿔서 실행합니다.
+"""
+
+import os
+
+import pytest
+
+from python.app.api import ffprobe_cache
+from python.app.api.ffprobe_cache import FFProbeCache
+
+
+class ProbeError(Exception):
+    pass
+
+
+@pytest.fixture
+def probe_calls(monkeypatch):
+    calls = []
+
+    def probe(path):
+        calls.append(path)
+        if os.path.basename(path).startswith("broken"):
+            raise ProbeError(path)
+        return {'streams': [{'codec_type': 'audio'},
+                            {'codec_type': 'video', 'r_frame_rate': '24000/1001', 'size': os.path.getsize(path)}]}
+    monkeypatch.setattr(ffprobe_cache.ffmpeg, 'probe', probe)
+    return calls
+
+
+@pytest.fixture
+def mov_file(tmp_path):
+    path = tmp_path / "A001C003.mov"
+    path.write_bytes(b"mov")
+    return str(path)
+
+
+@pytest.mark.unit
+class TestFFProbeCache:
+
+    def test_probe_once(self, probe_calls, mov_file):
+        cache = FFProbeCache(persist_file="")
+        first = cache.probe(mov_file)
+        assert cache.probe(mov_file) is first
+        assert cache.video_stream(mov_file)['r_frame_rate'] == '24000/1001'
+        assert probe_calls == [mov_file]
+
+    def test_invalidated_by_size(self, probe_calls, mov_file):
+        cache = FFProbeCache(persist_file="")
+        cache.probe(mov_file)
+        with open(mov_file, 'ab') as f:
+            f.write(b"more")
+        assert cache.video_stream(mov_file)['size'] == 7
+        assert len(probe_calls) == 2
+
+    def test_invalidated_by_mtime(self, probe_calls, mov_file):
+        cache = FFProbeCache(persist_file="")
+        cache.probe(mov_file)
+        st = os.stat(mov_file)
+        os.utime(mov_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+        cache.probe(mov_file)
+        assert len(probe_calls) == 2
+
+    def test_failure_not_cached(self, probe_calls, tmp_path):
+        path = tmp_path / "broken.mov"
+        path.write_bytes(b"")
+        cache = FFProbeCache(persist_file="")
+        for _ in range(2):
+            with pytest.raises(ProbeError):
+                cache.probe(str(path))
+        assert len(probe_calls) == 2
+        assert cache._key_locks == {}
+
+    def test_persisted(self, probe_calls, mov_file, tmp_path):
+        persist_file = str(tmp_path / "cache" / "ffprobe_cache.db")
+        FFProbeCache(persist_file=persist_file).probe(mov_file)
+
+        cache = FFProbeCache(persist_file=persist_file)
+        assert cache.video_stream(mov_file)['r_frame_rate'] == '24000/1001'
+        assert len(probe_calls) == 1
+
+        # 저장된 stat 과 다르면 다시 실행
+        st = os.stat(mov_file)
+        os.utime(mov_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+        FFProbeCache(persist_file=persist_file).probe(mov_file)
+        assert len(probe_calls) == 2
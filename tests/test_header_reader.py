@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+header_reader 테스트
+
+EXR 속성 테이블 / SMPTE BCD 타임코드, DPX big/little endian 헤더 오프셋을
+직접 만든 바이트로 확인합니다.
+"""
+
+import struct
+
+import pytest
+
+from python.app.api.header_reader import (
+    EXR_MAGIC, HeaderError, read_exr_header, parse_exr_header, parse_exr_channels,
+    exr_attribute_text, read_dpx_header, _decode_exr_timecode,
+)
+
+
+def _bcd_timecode(hours, minutes, seconds, frame, drop_frame=False):
+    def bcd(value):
+        return ((value // 10) << 4) | (value % 10)
+    value = (bcd(hours) << 24) | (bcd(minutes) << 16) | (bcd(seconds) << 8) | bcd(frame)
+    if drop_frame:
+        value |= 1 << 6
+    return value
+
+
+def _exr_attribute(name, type_name, data):
+    return name.encode() + b'\x00' + type_name.encode() + b'\x00' + struct.pack("<i", len(data)) + data
+
+
+def _exr_file(path, attributes):
+    data = EXR_MAGIC + struct.pack("<I", 2) + b"".join(attributes) + b'\x00'
+    path.write_bytes(data + b'\x00' * 64)
+    return str(path)
+
+
+def _exr_channels(names):
+    data = b""
+    for name in names:
+        data += name.encode() + b'\x00' + struct.pack("<iB3xii", 1, 0, 1, 1)
+    return data + b'\x00'
+
+
+@pytest.mark.unit
+class TestExrTimecode:
+
+    def test_bcd_fields(self):
+        assert _decode_exr_timecode(_bcd_timecode(1, 2, 3, 4)) == (1, 2, 3, 4, False)
+        assert _decode_exr_timecode(_bcd_timecode(23, 59, 59, 29)) == (23, 59, 59, 29, False)
+
+    def test_drop_frame_flag(self):
+        assert _decode_exr_timecode(_bcd_timecode(10, 0, 0, 2, drop_frame=True)) == (10, 0, 0, 2, True)
+
+    def test_attribute_text(self):
+        value = _decode_exr_timecode(_bcd_timecode(1, 0, 10, 12))
+        assert exr_attribute_text("timecode", value) == "01:00:10:12"
+        assert exr_attribute_text("chlist", b"\x00") == ""
+
+
+@pytest.mark.unit
+class TestExrHeader:
+
+    def test_attributes(self, tmp_path):
+        path = _exr_file(tmp_path / "a.exr", [
+            _exr_attribute("channels", "chlist", _exr_channels(["B", "G", "R"])),
+            _exr_attribute("compression", "compression", b'\x03'),
+            _exr_attribute("dataWindow", "box2i", struct.pack("<4i", 0, 0, 1919, 1079)),
+            _exr_attribute("framesPerSecond", "rational", struct.pack("<iI", 24000, 1001)),
+            _exr_attribute("timeCode", "timecode", struct.pack("<2I", _bcd_timecode(1, 2, 3, 4), 0)),
+            _exr_attribute("reelName", "string", b"A001C003"),
+            _exr_attribute("pixelAspectRatio", "float", struct.pack("<f", 1.0)),
+        ])
+        attributes = read_exr_header(path)
+        assert attributes["dataWindow"] == ("box2i", (0, 0, 1919, 1079))
+        assert attributes["framesPerSecond"] == ("rational", (24000, 1001))
+        assert attributes["timeCode"] == ("timecode", (1, 2, 3, 4, False))
+        assert attributes["reelName"] == ("string", "A001C003")
+        assert attributes["compression"] == ("compression", 3)
+        assert attributes["pixelAspectRatio"] == ("float", 1.0)
+        assert [c[0] for c in parse_exr_channels(attributes["channels"][1])] == ["B", "G", "R"]
+
+    def test_header_larger_than_first_window(self, tmp_path):
+        comment = b"x" * (40 * 1024)
+        path = _exr_file(tmp_path / "big.exr", [
+            _exr_attribute("comments", "string", comment),
+            _exr_attribute("dataWindow", "box2i", struct.pack("<4i", 0, 0, 63, 31)),
+        ])
+        attributes = read_exr_header(path)
+        assert attributes["dataWindow"][1] == (0, 0, 63, 31)
+        assert len(attributes["comments"][1]) == len(comment)
+
+    def test_not_exr(self, tmp_path):
+        path = tmp_path / "a.exr"
+        path.write_bytes(b"SDPX" + b"\x00" * 64)
+        with pytest.raises(HeaderError):
+            read_exr_header(str(path))
+
+    def test_truncated_file(self, tmp_path):
+        path = tmp_path / "a.exr"
+        path.write_bytes(EXR_MAGIC + struct.pack("<I", 2) + b"dataWindow\x00box2i\x00" + struct.pack("<i", 16))
+        with pytest.raises(HeaderError):
+            read_exr_header(str(path))
+
+    def test_truncated_buffer(self):
+        buf = EXR_MAGIC + struct.pack("<I", 2) + b"dataWindow\x00box2i\x00" + struct.pack("<i", 16) + b"\x00" * 4
+        with pytest.raises(HeaderError):
+            parse_exr_header(buf)
+
+
+def _dpx_file(path, order, width=1920, height=1080, orient=(0, 0), timecode=0x01000000,
+              tv_rate=24.0, film_rate=0.0, input_name=b"A001C003"):
+    header = bytearray(2048)
+    header[0:4] = b"SDPX" if order == ">" else b"XPDS"
+    struct.pack_into(order + "I", header, 4, 2048)
+    struct.pack_into(order + "II", header, 772, width, height)
+    struct.pack_into(order + "II", header, 1424, *orient)
+    header[1556:1556 + len(input_name)] = input_name
+    struct.pack_into(order + "f", header, 1724, film_rate)
+    struct.pack_into(order + "I", header, 1920, timecode)
+    struct.pack_into(order + "f", header, 1940, tv_rate)
+    path.write_bytes(bytes(header))
+    return str(path)
+
+
+@pytest.mark.unit
+class TestDpxHeader:
+
+    @pytest.mark.parametrize("order", [">", "<"])
+    def test_offsets(self, tmp_path, order):
+        path = _dpx_file(tmp_path / "a.dpx", order, timecode=0x01020304, tv_rate=23.976)
+        header = read_dpx_header(path)
+        assert (header['width'], header['height']) == (1920, 1080)
+        assert header['timecode'] == "01:02:03:04"
+        assert header['framerate'] == pytest.approx(23.976, abs=1e-3)
+        assert header['input_name'] == "A001C003"
+
+    @pytest.mark.parametrize("order", [">", "<"])
+    def test_orientation_size_wins(self, tmp_path, order):
+        path = _dpx_file(tmp_path / "a.dpx", order, orient=(4096, 2160))
+        header = read_dpx_header(path)
+        assert (header['width'], header['height']) == (4096, 2160)
+
+    def test_undefined_values(self, tmp_path):
+        path = _dpx_file(tmp_path / "a.dpx", ">", orient=(0xFFFFFFFF, 0xFFFFFFFF),
+                         timecode=0xFFFFFFFF, tv_rate=float("nan"), film_rate=25.0)
+        header = read_dpx_header(path)
+        assert (header['width'], header['height']) == (1920, 1080)
+        assert header['timecode'] == ""
+        assert header['framerate'] == 25.0
+
+    def test_not_dpx(self, tmp_path):
+        path = tmp_path / "a.dpx"
+        path.write_bytes(b"\x00" * 2048)
+        with pytest.raises(HeaderError):
+            read_dpx_header(str(path))
+
+    def test_truncated(self, tmp_path):
+        path = tmp_path / "a.dpx"
+        path.write_bytes(b"SDPX" + b"\x00" * 100)
+        with pytest.raises(HeaderError):
+            read_dpx_header(str(path))
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+ingest 백그라운드 헬퍼 close() 테스트
+
+창을 닫거나 모델을 바꿀 때 부르는 close() 가 THUMBNAIL_SERVICE 리스너를 떼고,
+executor 를 끝내고, 스캔 인덱스 갱신을 쓰는지 확인합니다.
+"""
+
+import pytest
+
+from python.app.api import ingest
+from python.app.api.thumbnail import THUMBNAIL_SERVICE
+
+
+@pytest.mark.qt
+class TestClose:
+
+    def test_notifier_removes_listener(self, qapp):
+        before = len(THUMBNAIL_SERVICE._listeners)
+        notifier = ingest.ThumbnailNotifier()
+        assert len(THUMBNAIL_SERVICE._listeners) == before + 1
+        notifier.close()
+        assert len(THUMBNAIL_SERVICE._listeners) == before
+
+    def test_loader_shuts_down_and_flushes(self, qapp, monkeypatch):
+        flushed = []
+        monkeypatch.setattr(ingest.INDEX_UPDATES, 'flush', lambda path=None: flushed.append(path))
+        loader = ingest.LazyMetadataLoader(workers=1)
+        loader.close()
+        assert flushed == [None]
+        with pytest.raises(RuntimeError):
+            loader._executor.submit(lambda: None)
+
+    def test_refresher_stops_timer_and_executor(self, qapp):
+        refresher = ingest.TimecodeRefresher(workers=1)
+        refresher.request(object(), 0, ())
+        assert refresher._timer.isActive()
+        refresher.close()
+        assert not refresher._timer.isActive()
+        with pytest.raises(RuntimeError):
+            refresher._executor.submit(lambda: None)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+row_store 테스트
+
+check 비트 배열, 숫자 컬럼 변환, 썸네일 경로 인덱스, 지연 행 판별을 확인합니다.
+"""
+
+import pytest
+
+from python.app.api.constant import MODEL_KEYS, LAZY_VALUE
+from python.app.model.row_store import RowStore, SeqRecord
+
+
+COLUMNS = len(MODEL_KEYS)
+CHECK = MODEL_KEYS['check']
+THUMBNAIL = MODEL_KEYS['thumbnail']
+FRAMERATE = MODEL_KEYS['framerate']
+JUST_IN = MODEL_KEYS['just_in']
+
+
+def make_row(check=False, thumbnail="", **values):
+    row = [None] * COLUMNS
+    row[CHECK] = check
+    row[THUMBNAIL] = thumbnail
+    for key, value in values.items():
+        row[MODEL_KEYS[key]] = value
+    return row
+
+
+class SeqRow(list):
+    """excel.SeqRow 처럼 seq 를 가진 행"""
+    seq = None
+
+
+@pytest.mark.unit
+class TestChecks:
+
+    def test_bitset_across_bytes(self):
+        store = RowStore([make_row(check=row % 3 == 0) for row in range(20)])
+        assert store.checked_rows() == [0, 3, 6, 9, 12, 15, 18]
+        store.set_checked(7, True)
+        store.set_checked(8, True)
+        store.set_checked(0, False)
+        assert store.checked_rows() == [3, 6, 7, 8, 9, 12, 15, 18]
+
+    def test_check_column_goes_through_store(self):
+        store = RowStore([make_row(), make_row()])
+        store.set_value(1, CHECK, 1)
+        assert store.value(1, CHECK) is True
+        assert store[1][CHECK] is None
+        with pytest.raises(IndexError):
+            store[1][CHECK] = True
+
+    def test_append_keeps_bits(self):
+        store = RowStore([make_row(check=True)] * 7)
+        store.append_rows([make_row(check=False), make_row(check=True)])
+        assert store.checked_rows() == [0, 1, 2, 3, 4, 5, 6, 8]
+
+
+@pytest.mark.unit
+class TestValues:
+
+    def test_numeric_coercion(self):
+        store = RowStore([make_row(framerate="23.976", just_in="1001", start_frame="0101")])
+        assert store.value(0, FRAMERATE) == 23.976
+        assert store.value(0, JUST_IN) == 1001
+        # 되돌렸을 때 같은 문자열이 아니면 그대로 (화면 표시 유지)
+        assert store.value(0, MODEL_KEYS['start_frame']) == "0101"
+        store.set_value(0, JUST_IN, "abc")
+        assert store.value(0, JUST_IN) == "abc"
+
+    def test_text(self):
+        store = RowStore([make_row(framerate=24.0)])
+        assert store.text(0, FRAMERATE) == "24.0"
+        assert store.text(0, MODEL_KEYS['shot_name']) == ""
+
+    def test_row_values(self):
+        row = make_row(check=True, thumbnail="/t/a.jpg", shot_name="E001_S010_0010", just_in="1001")
+        values = RowStore([row]).row_values(0)
+        assert values[CHECK] is True
+        assert values[THUMBNAIL] == "/t/a.jpg"
+        assert values[MODEL_KEYS['shot_name']] == "E001_S010_0010"
+        assert values[JUST_IN] == 1001
+        assert len(values) == COLUMNS
+
+    def test_row_of(self):
+        store = RowStore([make_row(), make_row()])
+        assert store.row_of(store[1]) == 1
+        assert store.row_of(SeqRecord(make_row())) is None
+
+
+@pytest.mark.unit
+class TestThumbnails:
+
+    def test_shared_path(self):
+        store = RowStore([make_row(thumbnail="/t/a.jpg"), make_row(thumbnail="/t/b.jpg"),
+                          make_row(thumbnail="/t/a.jpg"), make_row()])
+        assert store.thumbnail_rows("/t/a.jpg") == [0, 2]
+        assert store.thumbnail_rows("/t/b.jpg") == [1]
+        assert store.thumbnail_rows("") == []
+
+    def test_set_value_moves_row(self):
+        store = RowStore([make_row(thumbnail="/t/a.jpg"), make_row(thumbnail="/t/a.jpg")])
+        store.set_value(0, THUMBNAIL, "/t/c.jpg")
+        assert store.thumbnail_rows("/t/a.jpg") == [1]
+        assert store.thumbnail_rows("/t/c.jpg") == [0]
+        store.set_value(1, THUMBNAIL, None)
+        assert store.thumbnail_rows("/t/a.jpg") == []
+
+
+@pytest.mark.unit
+def test_is_lazy():
+    lazy = SeqRow(make_row(resolution=LAZY_VALUE))
+    lazy.seq = object()
+    store = RowStore([lazy, make_row(resolution=LAZY_VALUE)])
+    assert store[0].is_lazy()
+    # seq 가 없으면 다시 계산할 수 없으므로 지연 행이 아님
+    assert not store[1].is_lazy()
+    store.set_value(0, MODEL_KEYS['resolution'], "1920x1080")
+    assert not store[0].is_lazy()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+ScanlistSaver 테스트
+
+저장 워커(QThread)가 scanlist_NN.xlsx 와 상태 파일을 쓰고, wait() 가 저장이 끝날 때까지 기다리며,
+실패하면 스캔 폴더에 임시 파일을 남기지 않는지 확인합니다.
+"""
+
+import os
+
+import pytest
+
+from python.app.api import excel
+from python.app.api.constant import MODEL_KEYS
+from python.app.api.saver import ScanlistSaver
+from python.app.api.scanlist_state import get_state_file, read_state
+
+
+def make_snapshot(count):
+    rows = []
+    for i in range(count):
+        row = [None] * len(MODEL_KEYS)
+        row[MODEL_KEYS['check']] = i % 2 == 0
+        row[MODEL_KEYS['thumbnail']] = ""
+        row[MODEL_KEYS['shot_name']] = "E001_S010_%04d" % (i * 10)
+        row[MODEL_KEYS['just_in']] = 1001 + i
+        rows.append(row)
+    checks = [row[MODEL_KEYS['check']] for row in rows]
+    return excel.ScanlistSnapshot(list(MODEL_KEYS.keys()), rows, checks)
+
+
+def leftovers(path):
+    return [name for name in os.listdir(str(path)) if name.endswith(".tmp")]
+
+
+@pytest.fixture
+def saver(qapp):
+    saver = ScanlistSaver()
+    saver.results = []
+    saver.saved.connect(lambda excel_file: saver.results.append(('saved', excel_file)))
+    saver.failed.connect(lambda message: saver.results.append(('failed', message)))
+    return saver
+
+
+@pytest.mark.qt
+class TestScanlistSaver:
+
+    def test_writer_creates_no_file_before_save(self, tmp_path):
+        excel.ExcelWriteModel(str(tmp_path))
+        assert os.listdir(str(tmp_path)) == []
+
+    def test_save_and_wait(self, qapp, saver, tmp_path):
+        snapshot = make_snapshot(3)
+        saver.save(str(tmp_path), snapshot)
+        saver.wait()
+        assert not saver.busy
+        excel_file = os.path.join(str(tmp_path), "scanlist_01.xlsx")
+        assert os.path.isfile(excel_file)
+        assert os.path.isfile(get_state_file(excel_file))
+        assert read_state(excel_file)[2][MODEL_KEYS['just_in']] == 1003
+        assert leftovers(tmp_path) == []
+
+        qapp.processEvents()
+        assert saver.results == [('saved', excel_file)]
+
+    def test_consecutive_saves(self, qapp, saver, tmp_path):
+        saver.save(str(tmp_path), make_snapshot(2))
+        saver.wait()
+        saver.save(str(tmp_path), make_snapshot(2))
+        saver.wait()
+        assert sorted(name for name in os.listdir(str(tmp_path)) if name.endswith(".xlsx")) == [
+            "scanlist_01.xlsx", "scanlist_02.xlsx"]
+
+    def test_failure_removes_temp_file(self, qapp, saver, tmp_path, monkeypatch):
+        def fail(self, snapshot, progress=None):
+            raise IOError("disk full")
+        monkeypatch.setattr(excel.ExcelWriteModel, '_write_rows', fail)
+        saver.save(str(tmp_path), make_snapshot(2))
+        saver.wait()
+        assert os.listdir(str(tmp_path)) == []
+
+        qapp.processEvents()
+        assert saver.results == [('failed', "disk full")]
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+scan_index 테스트
+
+디렉토리 목록/프로브 행 재사용, mtime·stat 이 바뀌었을 때의 무효화,
+인덱스 파일을 만들 수 없는 폴더에서의 캐시 없는 동작을 확인합니다.
+"""
+
+import os
+
+import pytest
+
+from python.app.api import scan_index
+from python.app.api.scan_index import INDEX_FILE_NAME, ScanIndex, stat_signature
+
+
+def bump_mtime(path, seconds=10):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1000000000))
+
+
+@pytest.fixture
+def scan_dir(tmp_path):
+    roll = tmp_path / "roll_01"
+    roll.mkdir()
+    for frame in (1001, 1002):
+        (roll / ("A001C003.%d.exr" % frame)).write_bytes(b"exr")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestListDir:
+
+    def test_reuse_while_mtime_unchanged(self, scan_dir, monkeypatch):
+        roll = str(scan_dir / "roll_01")
+        index = ScanIndex(str(scan_dir))
+        entries = index.list_dir(roll)
+        assert entries == [("A001C003.1001.exr", False), ("A001C003.1002.exr", False)]
+        index.close()
+
+        def fail(path):
+            raise AssertionError("readdir on cached directory")
+        monkeypatch.setattr(scan_index.os, 'scandir', fail)
+        index = ScanIndex(str(scan_dir))
+        assert index.list_dir(roll) == entries
+        index.close()
+
+    def test_invalidated_by_mtime(self, scan_dir):
+        roll = scan_dir / "roll_01"
+        index = ScanIndex(str(scan_dir))
+        index.list_dir(str(roll))
+        (roll / "A001C003.1003.exr").write_bytes(b"exr")
+        bump_mtime(str(roll))
+        assert ("A001C003.1003.exr", False) in index.list_dir(str(roll))
+        index.close()
+
+    def test_missing_directory(self, scan_dir):
+        index = ScanIndex(str(scan_dir))
+        assert index.list_dir(str(scan_dir / "missing")) == []
+        index.close()
+
+
+@pytest.mark.unit
+class TestRows:
+
+    def test_reuse_and_invalidate(self, scan_dir):
+        files = [str(scan_dir / "roll_01" / ("A001C003.%d.exr" % frame)) for frame in (1001, 1002)]
+        signature = stat_signature(files)
+        row = [False, "/t/a.jpg", "roll_01", "", "", 1, "org"]
+
+        index = ScanIndex(str(scan_dir))
+        index.put_rows([("roll_01/A001C003", signature, row)])
+        index.close()
+        assert os.path.exists(str(scan_dir / INDEX_FILE_NAME))
+
+        index = ScanIndex(str(scan_dir))
+        assert index.get_row("roll_01/A001C003", signature) == row
+        assert index.get_row("roll_01/other", signature) is None
+
+        # 마지막 프레임이 바뀌면 시그니처가 달라져서 다시 프로브
+        with open(files[-1], 'ab') as f:
+            f.write(b"more")
+        changed = stat_signature(files)
+        assert changed != signature
+        assert index.get_row("roll_01/A001C003", changed) is None
+        index.close()
+
+    def test_missing_file_signature(self, scan_dir):
+        assert stat_signature([str(scan_dir / "missing.exr")]) is None
+        index = ScanIndex(str(scan_dir))
+        index.put_rows([("key", None, [1])])
+        assert index.get_row("key", None) is None
+        index.close()
+
+
+@pytest.mark.unit
+class TestDisabled:
+
+    def test_unwritable_location(self, scan_dir):
+        # 폴더 자리에 파일이 있으면 인덱스 파일을 만들 수 없음
+        blocker = scan_dir / "blocker"
+        blocker.write_bytes(b"")
+        index = ScanIndex(str(blocker))
+        assert not index.enabled
+        assert index.list_dir(str(scan_dir / "roll_01"))[0] == ("A001C003.1001.exr", False)
+        index.put_rows([("key", "sig", [1])])
+        assert index.get_row("key", "sig") is None
+        index.close()
+
+    @pytest.mark.skipif(not hasattr(os, 'geteuid') or os.geteuid() == 0,
+                        reason="root 는 읽기 전용 폴더에도 쓸 수 있음")
+    def test_read_only_folder(self, scan_dir):
+        os.chmod(str(scan_dir), 0o555)
+        try:
+            index = ScanIndex(str(scan_dir))
+            assert not index.enabled
+            assert index.list_dir(str(scan_dir / "roll_01"))
+            index.close()
+        finally:
+            os.chmod(str(scan_dir), 0o755)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+scanlist_state 테스트
+
+상태 파일 저장/읽기 왕복과, xlsx 가 저장 뒤에 바뀌었을 때 상태 파일을 버리는지 확인합니다.
+"""
+
+import os
+
+import pytest
+
+from python.app.api import scanlist_state
+from python.app.api.constant import MODEL_KEYS
+from python.app.api.scanlist_state import STATE_MAGIC, get_state_file, read_state, write_state
+
+
+def make_rows(count):
+    rows = []
+    for i in range(count):
+        row = [None] * len(MODEL_KEYS)
+        row[MODEL_KEYS['check']] = i % 2 == 0
+        row[MODEL_KEYS['thumbnail']] = "/show/scan/.thumbnail/A%03d.jpg" % i if i % 5 else ""
+        row[MODEL_KEYS['shot_name']] = "E001_S010_%04d" % (i * 10)
+        row[MODEL_KEYS['just_in']] = 1001 + i
+        row[MODEL_KEYS['framerate']] = 23.976
+        row[MODEL_KEYS['timecode_in']] = "01:00:00:%02d" % (i % 24)
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture(params=["json", "msgpack"])
+def codec(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(scanlist_state, 'msgpack', None)
+    else:
+        monkeypatch.setattr(scanlist_state, 'msgpack', pytest.importorskip("msgpack"))
+    return request.param
+
+
+@pytest.fixture
+def excel_file(tmp_path):
+    path = tmp_path / "scanlist_01.xlsx"
+    path.write_bytes(b"xlsx")
+    return str(path)
+
+
+@pytest.mark.unit
+class TestRoundTrip:
+
+    def test_round_trip(self, codec, excel_file):
+        rows = make_rows(21)
+        checks = [row[MODEL_KEYS['check']] for row in rows]
+        state_file = write_state(excel_file, rows, checks)
+        assert state_file == get_state_file(excel_file)
+        assert state_file.endswith("scanlist_01.state")
+        with open(state_file, 'rb') as f:
+            assert f.read().startswith(STATE_MAGIC + (b"j" if codec == "json" else b"m"))
+
+        loaded = read_state(excel_file)
+        assert loaded == rows
+        assert isinstance(loaded[0][MODEL_KEYS['just_in']], int)
+        assert isinstance(loaded[0][MODEL_KEYS['framerate']], float)
+
+    def test_empty(self, codec, excel_file):
+        write_state(excel_file, [], [])
+        assert read_state(excel_file) == []
+
+
+@pytest.mark.unit
+class TestStale:
+
+    def test_missing_state(self, excel_file):
+        assert read_state(excel_file) is None
+
+    def test_excel_edited_after_save(self, excel_file):
+        rows = make_rows(3)
+        write_state(excel_file, rows, [True] * 3)
+        with open(excel_file, 'ab') as f:
+            f.write(b" edited")
+        assert read_state(excel_file) is None
+
+    def test_excel_touched_after_save(self, excel_file):
+        rows = make_rows(3)
+        write_state(excel_file, rows, [True] * 3)
+        st = os.stat(excel_file)
+        os.utime(excel_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+        assert read_state(excel_file) is None
+
+    def test_format_changed(self, excel_file, monkeypatch):
+        write_state(excel_file, make_rows(3), [True] * 3)
+        monkeypatch.setattr(scanlist_state, 'STATE_VERSION', scanlist_state.STATE_VERSION + 1)
+        assert read_state(excel_file) is None
+
+    def test_corrupt_state(self, excel_file):
+        with open(get_state_file(excel_file), 'wb') as f:
+            f.write(STATE_MAGIC + b"jnot zlib")
+        assert read_state(excel_file) is None
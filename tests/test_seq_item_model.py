@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+SeqTableModel 일괄 수정 테스트
+
+batch() / set_checked() / set_column() 이 바뀐 셀을 덮는 범위로 dataChanged 를 한 번만 보내는지 확인합니다.
+"""
+
+import pytest
+
+from python.app.api.constant import MODEL_KEYS
+from python.app.model.seq_item_model import SeqTableModel
+from python.app.utils.qt_compat import QtCore
+
+
+SHOT_NAME = MODEL_KEYS['shot_name']
+VERSION = MODEL_KEYS['version']
+
+
+def make_rows(count):
+    rows = []
+    for i in range(count):
+        row = [None] * len(MODEL_KEYS)
+        row[MODEL_KEYS['check']] = False
+        row[MODEL_KEYS['thumbnail']] = ""
+        row[SHOT_NAME] = "E001_S010_%04d" % i
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture
+def model(qapp):
+    model = SeqTableModel(make_rows(10))
+    changes = []
+    model.dataChanged.connect(lambda top, bottom, roles=None: changes.append(
+        (top.row(), top.column(), bottom.row(), bottom.column())))
+    model.changes = changes
+    return model
+
+
+@pytest.mark.qt
+class TestBatch:
+
+    def test_single_ranged_signal(self, model):
+        with model.batch():
+            model.setData(model.createIndex(2, SHOT_NAME), "A", QtCore.Qt.EditRole)
+            model.setData(model.createIndex(7, VERSION), "3", QtCore.Qt.EditRole)
+            model.setData(model.createIndex(4, SHOT_NAME), "B", QtCore.Qt.EditRole)
+            assert model.changes == []
+        assert model.changes == [(2, SHOT_NAME, 7, VERSION)]
+        assert model.store.text(7, VERSION) == "3"
+
+    def test_nested(self, model):
+        with model.batch():
+            model.set_column(VERSION, {1: "1", 5: "2"})
+            with model.batch():
+                model.set_checked([0, 3], True)
+            assert model.changes == []
+        assert model.changes == [(0, 0, 5, VERSION)]
+        assert model.store.checked_rows() == [0, 3]
+
+    def test_empty_batch(self, model):
+        with model.batch():
+            pass
+        assert model.changes == []
+
+    def test_without_batch(self, model):
+        model.set_checked(range(10), True)
+        model.set_column(VERSION, {8: "1", 2: "2"})
+        assert model.changes == [(0, 0, 9, 0), (2, VERSION, 8, VERSION)]
+
+    def test_emits_after_exception(self, model):
+        with pytest.raises(RuntimeError):
+            with model.batch():
+                model.set_column(VERSION, {3: "1"})
+                raise RuntimeError("stop")
+        assert model.changes == [(3, VERSION, 3, VERSION)]
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+thumbnail_decoder 테스트
+
+EXR ZIP predictor 복원과 DPX 10 bit filled 패킹(method A/B) 해제를 확인합니다.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from python.app.api.thumbnail_decoder import DecodeError, decode_frame, linear_to_srgb, _exr_unzip
+
+
+def _exr_zip(raw):
+    """OpenEXR 의 ZIP 압축과 같은 순서 (바이트 인터리브 → predictor → zlib)"""
+    data = np.frombuffer(raw, dtype=np.uint8)
+    t = np.concatenate([data[0::2], data[1::2]])
+    predicted = t.copy()
+    predicted[1:] = (t[1:].astype(np.int16) - t[:-1].astype(np.int16) + 128).astype(np.uint8)
+    return zlib.compress(predicted.tobytes())
+
+
+@pytest.mark.unit
+class TestExrUnzip:
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 1001])
+    def test_round_trip(self, size):
+        raw = np.random.RandomState(size).randint(0, 256, size, dtype=np.uint8).tobytes()
+        assert _exr_unzip(_exr_zip(raw), len(raw)) == raw
+
+    def test_half_values(self):
+        raw = np.linspace(0.0, 4.0, 33, dtype=np.float16).astype('<f2').tobytes()
+        assert _exr_unzip(_exr_zip(raw), len(raw)) == raw
+
+    def test_size_mismatch(self):
+        raw = b"\x01\x02\x03\x04"
+        with pytest.raises(DecodeError):
+            _exr_unzip(_exr_zip(raw), len(raw) + 1)
+
+    def test_corrupt_data(self):
+        with pytest.raises(DecodeError):
+            _exr_unzip(b"not zlib", 4)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("compression", ["NO_COMPRESSION", "ZIPS_COMPRESSION", "ZIP_COMPRESSION"])
+def test_exr_decode(tmp_path, compression):
+    OpenEXR = pytest.importorskip("OpenEXR")
+    height, width = 40, 64
+    yy, xx = np.mgrid[0:height, 0:width]
+    channels = {
+        "R": (xx / width).astype(np.float16),
+        "G": (yy / height).astype(np.float16),
+        "B": np.full((height, width), 0.18, np.float16),
+    }
+    path = str(tmp_path / "a.exr")
+    header = {"compression": getattr(OpenEXR, compression), "type": OpenEXR.scanlineimage}
+    OpenEXR.File(header, dict(channels)).write(path)
+
+    pixels = decode_frame(path, width, height)
+    expected = linear_to_srgb(np.stack([channels[c].astype(np.float32) for c in "RGB"], axis=-1))
+    assert pixels.shape == (height, width, 3)
+    assert np.abs(pixels - expected).max() < 1e-3
+
+
+def _dpx_10bit(path, order, codes, packing):
+    """(h, w, 3) 10 bit 코드값으로 filled 패킹 RGB DPX 를 만듭니다."""
+    height, width, _ = codes.shape
+    header = bytearray(2048)
+    header[0:4] = b"SDPX" if order == ">" else b"XPDS"
+    struct.pack_into(order + "I", header, 4, 2048)
+    struct.pack_into(order + "II", header, 772, width, height)
+    header[800] = 50        # RGB
+    header[801] = 0         # 사용자 정의 전달 특성 (색 변환 없음)
+    header[803] = 10
+    struct.pack_into(order + "HHII", header, 804, packing, 0, 2048, 0)
+    flat = codes.reshape(height, -1).astype(np.uint32)
+    shift = 2 if packing == 1 else 0
+    words = (flat[:, 0::3] << (20 + shift)) | (flat[:, 1::3] << (10 + shift)) | (flat[:, 2::3] << shift)
+    path.write_bytes(bytes(header) + words.astype(order + "u4").tobytes())
+    return str(path)
+
+
+@pytest.mark.unit
+class TestDpx10Bit:
+
+    @pytest.mark.parametrize("order", [">", "<"])
+    @pytest.mark.parametrize("packing", [1, 2])
+    def test_unpack(self, tmp_path, order, packing):
+        codes = np.random.RandomState(packing).randint(0, 1024, (4, 6, 3))
+        path = _dpx_10bit(tmp_path / "a.dpx", order, codes, packing)
+        pixels = decode_frame(path, 6, 4)
+        assert pixels.shape == (4, 6, 3)
+        assert np.allclose(pixels * 1023.0, codes, atol=1e-3)
+
+    def test_subsampling(self, tmp_path):
+        codes = np.random.RandomState(0).randint(0, 1024, (8, 12, 3))
+        path = _dpx_10bit(tmp_path / "a.dpx", ">", codes, 1)
+        pixels = decode_frame(path, 6, 4)
+        assert np.allclose(pixels * 1023.0, codes[::2, ::2], atol=1e-3)
+
+    def test_truncated_data(self, tmp_path):
+        codes = np.zeros((4, 6, 3), dtype=np.int64)
+        path = tmp_path / "a.dpx"
+        _dpx_10bit(path, ">", codes, 1)
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(DecodeError):
+            decode_frame(str(path), 6, 4)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+timecode_math 테스트
+
+drop-frame(29.97 / 59.94) 와 non-drop 변환이 프레임 ↔ 타임코드 왕복에서 같은 값을 내는지 확인합니다.
+"""
+
+import numpy as np
+import pytest
+
+from python.app.api.timecode_math import (
+    parse_timecodes, timecodes_to_frames, frames_to_timecodes, digits_to_timecodes,
+    timecode_to_frame, frame_to_timecode, offset_timecode,
+)
+
+
+@pytest.mark.unit
+class TestDropFrame:
+
+    @pytest.mark.parametrize("framerate", [29.97, 59.94])
+    def test_round_trip(self, framerate):
+        # drop-frame 하루 = 실제 프레임레이트 x 86400 프레임
+        frames = np.arange(0, int(round(framerate * 86400)), 997)
+        timecodes = frames_to_timecodes(frames, framerate, drop_frame=True)
+        assert all(";" in timecode for timecode in timecodes)
+        assert np.array_equal(timecodes_to_frames(timecodes, framerate), frames)
+
+    @pytest.mark.parametrize("framerate, skipped", [(29.97, 2), (59.94, 4)])
+    def test_minute_boundary(self, framerate, skipped):
+        first = timecode_to_frame("00:01:00;%02d" % skipped, framerate)
+        assert frame_to_timecode(first - 1, framerate, drop_frame=True) == "00:00:59;%02d" % (
+            int(round(framerate)) - 1)
+        # 10 분 단위에서는 건너뛰지 않음
+        tenth = timecode_to_frame("00:10:00;00", framerate)
+        assert frame_to_timecode(tenth, framerate, drop_frame=True) == "00:10:00;00"
+
+    def test_known_values(self):
+        assert timecode_to_frame("00:01:00;02", 29.97) == 1800
+        assert timecode_to_frame("01:00:00;00", 29.97) == 107892
+        assert frame_to_timecode(107892, 29.97, drop_frame=True) == "01:00:00;00"
+
+    def test_forced_drop_flag(self):
+        assert timecode_to_frame("00:01:00:02", 29.97, drop_frame=True) == 1800
+        assert timecode_to_frame("00:01:00;02", 29.97, drop_frame=False) == 1802
+
+
+@pytest.mark.unit
+class TestNonDropFrame:
+
+    @pytest.mark.parametrize("framerate", [23.976, 24, 25, 29.97, 30])
+    def test_round_trip(self, framerate):
+        frames = np.arange(0, int(round(framerate)) * 86400, 1009)
+        timecodes = frames_to_timecodes(frames, framerate)
+        assert np.array_equal(timecodes_to_frames(timecodes, framerate), frames)
+
+    def test_drop_frame_ignored_for_integer_rates(self):
+        assert frame_to_timecode(1800, 24, drop_frame=True) == "00:01:15:00"
+        assert timecode_to_frame("00:01:15;00", 24) == 1800
+
+    def test_wraps_at_24_hours(self):
+        assert frame_to_timecode(24 * 3600 * 24 + 1, 24) == "00:00:00:01"
+
+
+@pytest.mark.unit
+class TestParse:
+
+    def test_mixed_formats(self):
+        fields, drop = parse_timecodes(["1:2:3:4", "01:00:00;00", " 10:00:00.12 "])
+        assert fields.tolist() == [[1, 2, 3, 4], [1, 0, 0, 0], [10, 0, 0, 12]]
+        assert drop.tolist() == [False, True, False]
+
+    def test_empty(self):
+        fields, drop = parse_timecodes([])
+        assert fields.shape == (0, 4) and drop.shape == (0,)
+
+    @pytest.mark.parametrize("timecode", ["", "01:00:00", "aa:bb:cc:dd", "01-00-00-00"])
+    def test_invalid(self, timecode):
+        with pytest.raises(ValueError):
+            parse_timecodes([timecode])
+
+
+@pytest.mark.unit
+class TestHelpers:
+
+    def test_offset_timecode(self):
+        assert offset_timecode("01:00:00:00", 24, 23.976) == "01:00:01:00"
+        assert offset_timecode("00:00:59;29", 1, 29.97) == "00:01:00;02"
+        assert offset_timecode("00:00:59:29", 1, 29.97) == "00:01:00:00"
+
+    def test_digits_to_timecodes(self):
+        assert digits_to_timecodes([1000000, 23595923.0, 0]) == ["01:00:00:00", "23:59:59:23", "00:00:00:00"]
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Validate Shotgun 조회 테스트
+
+find 호출을 기록하는 가짜 Shotgun 으로
+- _get_versions 가 shotgun.batch_size 단위의 'in' 조회로 버전을 찾는지
+- check_editor_shot 이 정확한 (클립 이름, 타임코드) 와 허용 프레임 이내의 Shot 을 찾는지
+확인합니다.
+"""
+
+import pytest
+
+from python.app.api import validate
+from python.app.api.constant import MODEL_KEYS
+from python.app.api.validate import Validate
+from python.app.model.seq_item_model import SeqTableModel
+
+
+PROJECT = {'type': 'Project', 'id': 1}
+
+
+def _same(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.get('type') == b.get('type') and a.get('id') == b.get('id')
+    return a == b
+
+
+class FakeShotgun(object):
+    """filters 의 is / is_not / in 만 지원하는 Shotgun.find"""
+
+    def __init__(self, entities):
+        self.entities = entities
+        self.calls = []
+
+    def find(self, entity_type, filters, fields=None, order=None):
+        self.calls.append((entity_type, filters))
+        found = []
+        for ent in self.entities.get(entity_type, []):
+            if all(self._match(ent, f) for f in filters):
+                found.append(dict(ent, type=entity_type))
+        if order:
+            for item in reversed(order):
+                found.sort(key=lambda ent: ent[item['field_name']], reverse=item['direction'] == 'desc')
+        return found
+
+    def find_one(self, entity_type, filters, fields=None):
+        found = self.find(entity_type, filters, fields)
+        return found[0] if found else None
+
+    def _match(self, ent, condition):
+        field, op, value = condition
+        actual = ent.get(field)
+        if op == 'is':
+            return _same(actual, value)
+        if op == 'is_not':
+            return not _same(actual, value)
+        if op == 'in':
+            return any(_same(actual, item) for item in value)
+        raise ValueError(op)
+
+    def count(self, entity_type):
+        return len([call for call in self.calls if call[0] == entity_type])
+
+
+def make_row(**values):
+    row = [None] * len(MODEL_KEYS)
+    row[MODEL_KEYS['check']] = True
+    row[MODEL_KEYS['thumbnail']] = ""
+    for key, value in values.items():
+        row[MODEL_KEYS[key]] = value
+    return row
+
+
+def make_validate(rows, sg):
+    validator = Validate.__new__(Validate)
+    validator.model = SeqTableModel(rows)
+    validator._sg = sg
+    validator.project = PROJECT
+    return validator
+
+
+def config(values):
+    def get_config_value(key, default=None):
+        return values.get(key, default)
+    return get_config_value
+
+
+@pytest.mark.qt
+class TestGetVersions:
+
+    @pytest.fixture
+    def sg(self):
+        shots = [{'id': 100 + i, 'code': 'S%02d' % i, 'project': PROJECT} for i in range(5)]
+        plate = {'type': 'PublishedFileType', 'id': 7}
+        published = [
+            {'id': 1, 'name': 'S00_org', 'version_number': 1, 'created_at': '2026-01-01',
+             'entity': {'type': 'Shot', 'id': 100}, 'published_file_type': plate, 'project': PROJECT},
+            {'id': 2, 'name': 'S00_org', 'version_number': 2, 'created_at': '2026-01-02',
+             'entity': {'type': 'Shot', 'id': 100}, 'published_file_type': plate, 'project': PROJECT},
+            {'id': 3, 'name': 'S03_org', 'version_number': 4, 'created_at': '2026-01-03',
+             'entity': {'type': 'Shot', 'id': 103}, 'published_file_type': plate, 'project': PROJECT},
+            # 다른 이름 (src) 은 org 버전에 영향 없음
+            {'id': 4, 'name': 'S01_src', 'version_number': 9, 'created_at': '2026-01-04',
+             'entity': {'type': 'Shot', 'id': 101}, 'published_file_type': plate, 'project': PROJECT},
+        ]
+        return FakeShotgun({
+            'Shot': shots,
+            'PublishedFileType': [{'id': 7, 'code': 'Plate'}, {'id': 8, 'code': 'Source'}],
+            'PublishedFile': published,
+        })
+
+    def test_batched_queries(self, qapp, sg, monkeypatch):
+        monkeypatch.setattr(validate, 'get_config_value', config({'shotgun.batch_size': 2}))
+        rows = [make_row(shot_name='S%02d' % i, type='org') for i in range(5)]
+        rows.append(make_row(shot_name='MISSING', type='org'))
+        validator = make_validate(rows, sg)
+
+        versions = validator._get_versions(list(range(6)))
+        assert versions[0] == (3, '2026-01-02')
+        assert versions[3] == (5, '2026-01-03')
+        assert versions[1] == (1, "")
+        assert versions[5] == (1, "")
+
+        # Shot 6 개 이름 → 2 개씩 3 번, PublishedFile 은 찾은 Shot 5 개 → 3 번
+        assert sg.count('PublishedFileType') == 1
+        assert sg.count('Shot') == 3
+        assert sg.count('PublishedFile') == 3
+        for entity_type, filters in sg.calls:
+            for field, op, value in filters:
+                if op == 'in' and field in ('code', 'entity') and entity_type != 'PublishedFileType':
+                    assert len(value) <= 2
+
+    def test_uploade_status(self, qapp, sg, monkeypatch):
+        monkeypatch.setattr(validate, 'get_config_value', config({}))
+        rows = [make_row(shot_name='S00', type='org'), make_row(shot_name='S03', type='org')]
+        rows[1][MODEL_KEYS['check']] = False
+        validator = make_validate(rows, sg)
+        validator.uploade_status()
+        assert validator.model.store.text(0, MODEL_KEYS['version']) == "3"
+        assert validator.model.store.text(0, MODEL_KEYS['date']) == "2026-01-02"
+        assert validator.model.store.text(1, MODEL_KEYS['version']) == ""
+        assert sg.count('Shot') == 1 and sg.count('PublishedFile') == 1
+
+    def test_no_rows(self, qapp, sg):
+        assert make_validate([], sg)._get_versions([]) == {}
+        assert sg.calls == []
+
+
+@pytest.mark.qt
+class TestCheckEditorShot:
+
+    @pytest.fixture
+    def sg(self):
+        sequence = {'type': 'Sequence', 'id': 1, 'name': 'E001'}
+        shots = [
+            {'id': 10, 'code': 'E001_0010', 'sg_clib_name': 'A001C003.', 'sg_timecode_in': '01:00:00:00'},
+            {'id': 11, 'code': 'E001_0020', 'sg_clib_name': 'A001C003.', 'sg_timecode_in': '01:00:10:00'},
+            # 같은 (클립, 타임코드) 는 id 가 작은 Shot
+            {'id': 12, 'code': 'E001_0030', 'sg_clib_name': 'A001C003.', 'sg_timecode_in': '01:00:10:00'},
+            {'id': 13, 'code': 'E001_0040', 'sg_clib_name': 'B002C001.', 'sg_timecode_in': '02:00:00:00'},
+            {'id': 14, 'code': 'E001_0050', 'sg_clib_name': None, 'sg_timecode_in': '01:00:00:00'},
+        ]
+        for shot in shots:
+            shot.update(project=PROJECT, sg_sequence=sequence)
+        return FakeShotgun({'Shot': shots})
+
+    def test_match(self, qapp, sg, monkeypatch):
+        monkeypatch.setattr(validate, 'get_config_value', config({'shotgun.editor_timecode_tolerance': 1}))
+        rows = [
+            make_row(type='editor', clip_name='A001C003.mov', timecode_in='01:00:00:00', framerate=24.0),
+            make_row(type='editor', clip_name='a001c003.mov', timecode_in='01:00:10:00', framerate=24.0),
+            make_row(type='editor', clip_name='B002C001.mov', timecode_in='01:59:59:23', framerate=24.0),
+            make_row(type='editor', clip_name='B002C001.mov', timecode_in='02:00:00:02', framerate=24.0),
+            make_row(type='org', clip_name='A001C003.mov', timecode_in='01:00:00:00', framerate=24.0),
+        ]
+        validator = make_validate(rows, sg)
+        validator.check_editor_shot()
+
+        shot_names = [validator.model.store.text(row, MODEL_KEYS['shot_name']) for row in range(5)]
+        assert shot_names == ['E001_0010', 'E001_0020', 'E001_0040', '', '']
+        assert validator.model.store.text(0, MODEL_KEYS['seq_name']) == 'E001'
+        assert sg.count('Shot') == 1
+
+    def test_tolerance_disabled(self, qapp, sg, monkeypatch):
+        monkeypatch.setattr(validate, 'get_config_value', config({'shotgun.editor_timecode_tolerance': 0}))
+        rows = [make_row(type='editor', clip_name='B002C001.mov', timecode_in='01:59:59:23', framerate=24.0)]
+        validator = make_validate(rows, sg)
+        validator.check_editor_shot()
+        assert validator.model.store.text(0, MODEL_KEYS['shot_name']) == ''
+
+    def test_no_editor_rows(self, qapp, sg):
+        validator = make_validate([make_row(type='org')], sg)
+        validator.check_editor_shot()
+        assert sg.calls == []